@@ -0,0 +1,316 @@
+# Синтаксический анализатор: табличный лексер (ДКА) и табличный LL(1)-парсер.
+#
+# Грамматика:
+#   Program -> Stmt Program | ε
+#   Stmt    -> ident '=' Expr ';'
+#   Expr    -> Term Expr'
+#   Expr'   -> '+' Term Expr' | '-' Term Expr' | ε
+#   Term    -> Factor Term'
+#   Term'   -> '*' Factor Term' | '/' Factor Term' | ε
+#   Factor  -> number | ident | string | '(' Expr ')' | '-' Factor
+#
+# Комментарии: // до конца строки и /* ... */ (могут занимать несколько строк).
+# Анализ идёт построчно: состояние на конце строки (состояние лексера и стек
+# парсера) полностью определяет разбор следующих строк, поэтому после правки
+# достаточно перепроверить строки от места правки до совпадения состояний.
+import re
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind text column')
+Diagnostic = namedtuple('Diagnostic', 'line column message')
+
+LEX_NORMAL = 0
+LEX_COMMENT = 1
+
+# --- Лексер ---
+
+S_START, S_IDENT, S_INT, S_DOT, S_FLOAT, S_STRING, S_STRING_END, S_SPACE, S_OP, \
+    S_SLASH, S_LINE_COMMENT, S_BLOCK, S_BLOCK_STAR, S_BLOCK_END = range(14)
+
+CLASS_PATTERNS = {
+    'letter': r'[^\W\d]', 'digit': r'[0-9]', 'dot': r'\.', 'space': r'[ \t]', 'slash': r'/',
+    'star': r'\*', 'quote': r'"', 'op': r'[-+=();]',
+}
+CHAR_CLASSES = list(CLASS_PATTERNS) + ['other']
+_CLASS_MATCHERS = [(cls, re.compile(pattern)) for cls, pattern in CLASS_PATTERNS.items()]
+
+def _row(default=None, **moves):
+    return {cls: moves.get(cls, default) for cls in CHAR_CLASSES}
+
+TRANSITIONS = {
+    S_START: _row(letter=S_IDENT, digit=S_INT, space=S_SPACE, slash=S_SLASH, star=S_OP,
+                  quote=S_STRING, op=S_OP),
+    S_IDENT: _row(letter=S_IDENT, digit=S_IDENT),
+    S_INT: _row(digit=S_INT, dot=S_DOT),
+    S_DOT: _row(digit=S_FLOAT),
+    S_FLOAT: _row(digit=S_FLOAT),
+    S_STRING: _row(S_STRING, quote=S_STRING_END),
+    S_STRING_END: _row(),
+    S_SPACE: _row(space=S_SPACE),
+    S_OP: _row(),
+    S_SLASH: _row(slash=S_LINE_COMMENT, star=S_BLOCK),
+    S_LINE_COMMENT: _row(S_LINE_COMMENT),
+    S_BLOCK: _row(S_BLOCK, star=S_BLOCK_STAR),
+    S_BLOCK_STAR: _row(S_BLOCK, star=S_BLOCK_STAR, slash=S_BLOCK_END),
+    S_BLOCK_END: _row(),
+}
+
+ACCEPTING = {
+    S_IDENT: 'ident', S_INT: 'number', S_FLOAT: 'number', S_STRING_END: 'string',
+    S_SPACE: 'space', S_OP: 'op', S_SLASH: 'op', S_LINE_COMMENT: 'comment', S_BLOCK_END: 'comment',
+}
+
+def _runPattern(classes):
+    # Регулярное выражение для серии переходов состояния в себя по классам classes
+    missing = [pattern for cls, pattern in CLASS_PATTERNS.items() if cls not in classes]
+    if 'other' in classes:
+        return re.compile('(?:(?!%s).)*' % '|'.join(missing) if missing else '.*')
+    return re.compile('(?:%s)*' % '|'.join(CLASS_PATTERNS[cls] for cls in classes))
+
+# Переходы состояния в себя выполняются за один вызов re вместо цикла по символам
+RUNS = {}
+for _state, _row_moves in TRANSITIONS.items():
+    _loops = [cls for cls, target in _row_moves.items() if target == _state]
+    if _loops:
+        RUNS[_state] = _runPattern(_loops)
+
+_classCache = {}
+
+def charClass(ch):
+    cls = _classCache.get(ch)
+    if cls is None:
+        cls = next((name for name, matcher in _CLASS_MATCHERS if matcher.match(ch)), 'other')
+        _classCache[ch] = cls
+    return cls
+
+def scanLine(text, state=LEX_NORMAL):
+    # Возвращает все лексемы строки, включая пробелы и комментарии, состояние лексера
+    # на конце строки и ошибки в виде пар (позиция, сообщение)
+    tokens = []
+    errors = []
+    pos = 0
+    length = len(text)
+    transitions, runs, accepting, classes = TRANSITIONS, RUNS, ACCEPTING, _classCache
+    dfa = S_BLOCK if state == LEX_COMMENT else S_START
+    while pos < length:
+        current = dfa
+        accepted = None
+        i = pos
+        while i < length:
+            ch = text[i]
+            target = transitions[current][classes.get(ch) or charClass(ch)]
+            if target is None:
+                break
+            current = target
+            i += 1
+            run = runs.get(current)
+            if run is not None:
+                i = run.match(text, i).end()
+            if current in accepting:
+                accepted = current
+                end = i
+        else:
+            if current in (S_BLOCK, S_BLOCK_STAR):
+                tokens.append(Token('comment', text[pos:], pos))
+                return tokens, LEX_COMMENT, errors
+            if current == S_STRING:
+                errors.append((pos, "Незакрытая строка"))
+                tokens.append(Token('string', text[pos:], pos))
+                return tokens, LEX_NORMAL, errors
+        dfa = S_START
+        if accepted is None:
+            errors.append((pos, f"Недопустимый символ '{text[pos]}'"))
+            tokens.append(Token('error', text[pos], pos))
+            pos += 1
+            continue
+        kind = accepting[accepted]
+        token = text[pos:end]
+        tokens.append(Token(token if kind == 'op' else kind, token, pos))
+        pos = end
+    if dfa == S_BLOCK:
+        return tokens, LEX_COMMENT, errors
+    return tokens, LEX_NORMAL, errors
+
+def lexLine(text, state=LEX_NORMAL):
+    tokens, state, errors = scanLine(text, state)
+    return [t for t in tokens if t.kind not in ('space', 'comment', 'error')], state, errors
+
+# --- Парсер ---
+
+EPSILON = ()
+PARSE_TABLE = {
+    ('Program', 'ident'): ('Stmt', 'Program'),
+    ('Program', '$'): EPSILON,
+    ('Stmt', 'ident'): ('ident', '=', 'Expr', ';'),
+    ('Expr', 'ident'): ('Term', "Expr'"),
+    ('Expr', 'number'): ('Term', "Expr'"),
+    ('Expr', 'string'): ('Term', "Expr'"),
+    ('Expr', '('): ('Term', "Expr'"),
+    ('Expr', '-'): ('Term', "Expr'"),
+    ("Expr'", '+'): ('+', 'Term', "Expr'"),
+    ("Expr'", '-'): ('-', 'Term', "Expr'"),
+    ("Expr'", ')'): EPSILON,
+    ("Expr'", ';'): EPSILON,
+    ('Term', 'ident'): ('Factor', "Term'"),
+    ('Term', 'number'): ('Factor', "Term'"),
+    ('Term', 'string'): ('Factor', "Term'"),
+    ('Term', '('): ('Factor', "Term'"),
+    ('Term', '-'): ('Factor', "Term'"),
+    ("Term'", '*'): ('*', 'Factor', "Term'"),
+    ("Term'", '/'): ('/', 'Factor', "Term'"),
+    ("Term'", '+'): EPSILON,
+    ("Term'", '-'): EPSILON,
+    ("Term'", ')'): EPSILON,
+    ("Term'", ';'): EPSILON,
+    ('Factor', 'number'): ('number',),
+    ('Factor', 'ident'): ('ident',),
+    ('Factor', 'string'): ('string',),
+    ('Factor', '('): ('(', 'Expr', ')'),
+    ('Factor', '-'): ('-', 'Factor'),
+}
+NONTERMINALS = {nonterminal for nonterminal, _ in PARSE_TABLE}
+SYMBOL_NAMES = {'ident': 'идентификатор', 'number': 'число', 'string': 'строка', '$': 'конец файла'}
+# Маркер восстановления после ошибки: пропускаем лексемы до ';'
+RECOVER = '#recover'
+START_STACK = ('Program',)
+START_STATE = (LEX_NORMAL, START_STACK)
+END_TOKEN = Token('$', '', 0)
+
+def _name(symbol):
+    return SYMBOL_NAMES.get(symbol, f"'{symbol}'")
+
+def _expected(nonterminal):
+    return ', '.join(sorted(_name(t) for n, t in PARSE_TABLE if n == nonterminal))
+
+def parseTokens(tokens, stack=START_STACK):
+    # Продолжает разбор со стеком stack (вершина - последний элемент);
+    # возвращает новый стек и ошибки в виде пар (позиция, сообщение)
+    stack = list(stack)
+    errors = []
+    for token in tokens:
+        while stack:
+            top = stack[-1]
+            if top == RECOVER:
+                if token.kind == '$':
+                    stack.pop()
+                    continue
+                if token.kind == ';':
+                    stack.pop()
+                break
+            if top not in NONTERMINALS:
+                if top == token.kind:
+                    stack.pop()
+                    break
+                errors.append((token.column, f"Ожидалось {_name(top)}, получено {_name(token.text or token.kind)}"))
+            else:
+                production = PARSE_TABLE.get((top, token.kind))
+                if production is not None:
+                    stack.pop()
+                    stack.extend(reversed(production))
+                    continue
+                errors.append((token.column, f"Неожиданный символ {_name(token.text or token.kind)}, "
+                                             f"ожидалось: {_expected(top)}"))
+            # Режим паники: сбрасываем стек до уровня программы
+            stack = ['Program', RECOVER]
+            if token.kind == ';':
+                stack.pop()
+            elif token.kind == '$':
+                continue
+            break
+    return tuple(stack), errors
+
+def analyzeLine(text, state=START_STATE):
+    lexState, stack = state
+    tokens, lexState, lexErrors = lexLine(text, lexState)
+    stack, parseErrors = parseTokens(tokens, stack)
+    return (lexState, stack), tuple(sorted(lexErrors + parseErrors))
+
+def analyzeRange(texts, state=START_STATE, previous=(), convergeFrom=0):
+    # previous - прежние состояния этих строк: начиная с convergeFrom разбор
+    # прекращается, как только новое состояние совпало с прежним
+    states = []
+    diagnostics = []
+    for offset, text in enumerate(texts):
+        state, errors = analyzeLine(text, state)
+        states.append(state)
+        diagnostics.append(errors)
+        if offset >= convergeFrom and offset < len(previous) and previous[offset] == state:
+            break
+    return states, diagnostics
+
+def finishState(state):
+    # Ошибки, обнаруживаемые только в конце файла
+    lexState, stack = state
+    errors = []
+    if lexState == LEX_COMMENT:
+        errors.append("Незакрытый комментарий")
+    _, parseErrors = parseTokens([END_TOKEN], stack)
+    errors.extend(message for _, message in parseErrors)
+    return errors
+
+def analyzeLines(lines):
+    result = []
+    state = START_STATE
+    lineNumber = 0
+    lastLength = 0
+    for lineNumber, text in enumerate(lines, 1):
+        state, errors = analyzeLine(text, state)
+        lastLength = len(text)
+        result.extend(Diagnostic(lineNumber, column + 1, message) for column, message in errors)
+    result.extend(Diagnostic(max(1, lineNumber), lastLength + 1, message) for message in finishState(state))
+    return result
+
+def analyzeText(text):
+    return analyzeLines(text.split('\n'))
+
+class IncrementalAnalyzer:
+    # Кэш состояний на конце каждой строки. Строки, изменённые с прошлого запуска,
+    # лежат в диапазоне [dirtyStart, dirtyEnd]; анализ останавливается, когда после
+    # этого диапазона новое состояние строки совпало со старым.
+    def __init__(self):
+        self.states = [None]
+        self.diagnostics = [()]
+        self.dirtyStart = 0
+        self.dirtyEnd = 0
+        self.generation = 0
+    def lineCount(self):
+        return len(self.states)
+    def replaceLines(self, first, removed, inserted):
+        self.states[first:first + removed] = [None] * inserted
+        self.diagnostics[first:first + removed] = [()] * inserted
+        last = first + inserted - 1
+        if self.dirtyStart is None:
+            self.dirtyStart, self.dirtyEnd = first, last
+        else:
+            if first <= self.dirtyEnd:
+                self.dirtyEnd = max(first, self.dirtyEnd + inserted - removed)
+            self.dirtyStart = min(self.dirtyStart, first)
+            self.dirtyEnd = max(self.dirtyEnd, last)
+        self.generation += 1
+    def nextLine(self):
+        return self.dirtyStart
+    def startState(self, line):
+        return self.states[line - 1] if line > 0 else START_STATE
+    def previousStates(self, first, count):
+        return self.states[first:first + count], max(0, self.dirtyEnd - first)
+    def apply(self, first, states, diagnostics):
+        for offset, state in enumerate(states):
+            line = first + offset
+            old = self.states[line]
+            self.states[line] = state
+            self.diagnostics[line] = diagnostics[offset]
+            if line >= self.dirtyEnd and old == state:
+                self.dirtyStart = None
+                return line + 1
+        self.dirtyStart = first + len(states)
+        if self.dirtyStart >= len(self.states):
+            self.dirtyStart = None
+        return first + len(states)
+    def collect(self, lastLineLength=0):
+        result = []
+        for line, errors in enumerate(self.diagnostics, 1):
+            if errors:
+                result.extend(Diagnostic(line, column + 1, message) for column, message in errors)
+        result.extend(Diagnostic(len(self.states), lastLineLength + 1, message)
+                      for message in finishState(self.states[-1]))
+        return result
@@ -0,0 +1,181 @@
+# Пакетный синтаксический анализ без графического интерфейса (PyQt5 не нужен).
+# Файлы разбираются параллельно в нескольких процессах, диагностика выводится
+# в stdout строками JSON. Результаты кэшируются по хэшу содержимого: файл, у
+# которого не изменились размер и время изменения, не читается вовсе, а файл с
+# прежним хэшем не разбирается заново.
+#
+#   python batch.py [-j N] [--cache FILE | --no-cache] [--glob '*.txt'] пути...
+#
+# Код возврата: 0 - ошибок нет, 1 - найдены синтаксические ошибки,
+# 2 - какой-то файл не удалось прочитать.
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import analyzer
+import charset
+from analyzer import analyzeText
+from charset import SAMPLE_SIZE, detectEncoding
+
+CACHE_FILE = '.analyzer-cache.json'
+
+def analyzerVersion(encoding='auto'):
+    # Кэш действителен, пока не изменились анализатор, определение кодировки
+    # и кодировка, в которой читаются файлы
+    digest = hashlib.sha256(encoding.encode('utf-8'))
+    for module in (analyzer, charset):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def collectFiles(paths, pattern):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if fnmatch.fnmatch(name, pattern))
+        else:
+            files.append(path)
+    return files
+
+def analyzeFile(path, encoding, knownHash):
+    # Выполняется в рабочем процессе: (хэш, диагностика или None, если хэш совпал, ошибка)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == knownHash:
+            return digest, None, None
+        if encoding == 'auto':
+            # Кодировка определяется так же, как при открытии файла в редакторе
+            detected = detectEncoding(data[:SAMPLE_SIZE])
+            text = data[len(detected.bom):].decode(detected.codec)
+        else:
+            text = data.decode(encoding)
+        # Переводы строк как при открытии файла в редакторе
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    except (OSError, UnicodeDecodeError) as e:
+        return None, None, str(e)
+    return digest, [tuple(d) for d in analyzeText(text)], None
+
+def _analyzeTask(task):
+    return analyzeFile(*task)
+
+class ResultCache:
+    def __init__(self, filename, version):
+        self.filename = filename
+        self.version = version
+        self.files = {}
+        self.results = {}
+        self.changed = False
+        if filename is None:
+            return
+        try:
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == version:
+            self.files = data.get('files', {})
+            self.results = data.get('results', {})
+    def lookup(self, path, info):
+        # Хэш файла, если размер и время изменения не поменялись
+        entry = self.files.get(os.path.abspath(path))
+        if entry is not None and entry[0] == info.st_size and entry[1] == info.st_mtime_ns:
+            return entry[2]
+        return None
+    def knownHash(self, path):
+        entry = self.files.get(os.path.abspath(path))
+        return entry[2] if entry is not None else None
+    def store(self, path, info, digest, diagnostics):
+        self.files[os.path.abspath(path)] = [info.st_size, info.st_mtime_ns, digest]
+        if diagnostics is not None:
+            self.results[digest] = diagnostics
+        self.changed = True
+    def save(self):
+        if self.filename is None or not self.changed:
+            return
+        # Результаты, на которые не ссылается ни один файл, не сохраняются
+        used = {entry[2] for entry in self.files.values()}
+        data = {'version': self.version, 'files': self.files,
+                'results': {digest: self.results[digest] for digest in used if digest in self.results}}
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tempName = tempfile.mkstemp(prefix='.analyzer-cache-', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tempName, self.filename)
+        except BaseException:
+            os.unlink(tempName)
+            raise
+
+def run(files, out, jobs=None, cache=None, encoding='auto'):
+    # Возвращает (число файлов из кэша, число ошибок, число нечитаемых файлов)
+    if cache is None:
+        cache = ResultCache(None, None)
+    cached = diagnosticCount = failed = 0
+    pending = []
+    for path in files:
+        try:
+            info = os.stat(path)
+        except OSError as e:
+            pending.append((path, None, (None, None, str(e))))
+            continue
+        digest = cache.lookup(path, info)
+        if digest is not None and digest in cache.results:
+            pending.append((path, info, (digest, None, None)))
+        else:
+            pending.append((path, info, None))
+    tasks = [(path, encoding, cache.knownHash(path)) for path, info, result in pending if result is None]
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(_analyzeTask, tasks, chunksize=max(1, len(tasks) // (jobs * 8)))
+        for path, info, result in pending:
+            if result is None:
+                result = next(results)
+            digest, diagnostics, error = result
+            if error is not None:
+                failed += 1
+                out.write(json.dumps({'file': path, 'error': error}, ensure_ascii=False) + '\n')
+                continue
+            if diagnostics is None:
+                cached += 1
+                diagnostics = cache.results[digest]
+            cache.store(path, info, digest, diagnostics)
+            diagnosticCount += len(diagnostics)
+            for line, column, message in diagnostics:
+                out.write(json.dumps({'file': path, 'line': line, 'column': column, 'message': message},
+                                     ensure_ascii=False) + '\n')
+    return cached, diagnosticCount, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный синтаксический анализ файлов")
+    parser.add_argument('paths', nargs='+', help="файлы и каталоги")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="число процессов (по умолчанию - число ядер)")
+    parser.add_argument('--glob', default='*.txt', help="шаблон имён файлов в каталогах")
+    parser.add_argument('--encoding', default='auto', help="кодировка файлов (по умолчанию определяется по началу файла)")
+    parser.add_argument('--cache', default=CACHE_FILE, help="файл кэша результатов")
+    parser.add_argument('--no-cache', action='store_true', help="не использовать кэш")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    files = collectFiles(args.paths, args.glob)
+    cache = ResultCache(None if args.no_cache else args.cache, analyzerVersion(args.encoding))
+    cached, diagnosticCount, failed = run(files, sys.stdout, args.jobs, cache, args.encoding)
+    cache.save()
+    sys.stdout.flush()
+    print(f"Файлов: {len(files)}, из кэша: {cached}, ошибок: {diagnosticCount}, "
+          f"не прочитано: {failed}, время: {time.perf_counter() - started:.2f} с", file=sys.stderr)
+    if failed:
+        return 2
+    return 1 if diagnosticCount else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
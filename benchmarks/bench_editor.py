@@ -0,0 +1,140 @@
+# Горячие пути редактора на синтетических документах разного размера: открытие
+# и сохранение файла, пиковая память, отрисовка нумерации строк на кадр,
+# перемещение курсора (highlightCurrentLine и слои выделений), вставка и отмена.
+# Итоги выводятся в stdout и область результатов окна, полный отчёт - в JSON.
+# Запуск: python benchmarks/bench_editor.py [--lines 1000,10000,100000,1000000]
+#         [--json bench.json] [--frames 100] [--moves 200]
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QMimeData, QT_VERSION_STR
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QApplication
+from timing import HotPathTimings, formatSummary, peakRss, writeReport
+import journal
+import lab1
+
+LINE = 'x{0} := (x{0} + 42) * y;\n'
+PASTE_LINES = 10000
+
+def writeDocument(path, lines):
+    block = ''.join(LINE.format(i) for i in range(1000))
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(lines // 1000):
+            f.write(block)
+        f.write(''.join(LINE.format(i) for i in range(lines % 1000)))
+
+def stats(times):
+    times = sorted(times)
+    return {'count': len(times), 'mean_ms': statistics.mean(times) * 1000,
+            'p95_ms': times[max(0, int(len(times) * 0.95) - 1)] * 1000, 'max_ms': times[-1] * 1000}
+
+def pump(app, busy):
+    while busy():
+        app.processEvents()
+
+def timed(action):
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+def benchSize(app, window, timings, lines, directory, frames, moves):
+    path = os.path.join(directory, f'bench-{lines}.txt')
+    writeDocument(path, lines)
+    timings.reset()
+    result = {'lines': lines, 'bytes': os.path.getsize(path)}
+
+    def openFile():
+        window.openFile(path)
+        pump(app, lambda: window.loader is not None)
+    result['open_s'] = timed(openFile)
+    editor = window.textEdit
+    app.processEvents()
+
+    bar = editor.verticalScrollBar()
+    step = max(1, bar.maximum() // frames)
+    times = []
+    for frame in range(frames):
+        bar.setValue(frame * step)
+        times.append(timed(editor.lineNumberArea.repaint))
+    result['gutter_frame'] = stats(times)
+
+    # Слои выделений обновляются по таймеру, поэтому в замер входит обработка событий
+    editor.moveCursor(QTextCursor.Start)
+    app.processEvents()
+    times = []
+    for _ in range(moves):
+        times.append(timed(lambda: (editor.moveCursor(QTextCursor.Down), app.processEvents())))
+    result['cursor_move'] = stats(times)
+
+    mime = QMimeData()
+    mime.setText(''.join(LINE.format(i) for i in range(PASTE_LINES)))
+    result['paste_ms'] = timed(lambda: editor.insertFromMimeData(mime)) * 1000
+    result['undo_ms'] = timed(editor.undo) * 1000
+    result['redo_ms'] = timed(editor.redo) * 1000
+    editor.undo()
+
+    result['save_s'] = timed(lambda: window.saveDocument(wait=True))
+    app.processEvents()
+    peak = peakRss()
+    result['peak_rss_mb'] = peak / 2 ** 20 if peak is not None else None
+    result['hotpaths'] = timings.summary()
+    window.closeDocument(window.tabBar.currentIndex())
+    os.remove(path)
+    return result
+
+def formatResult(result):
+    lines = [f"Строк: {result['lines']}, байт: {result['bytes']}",
+             f"Открытие: {result['open_s']:.3f} с, сохранение: {result['save_s']:.3f} с"]
+    if result['peak_rss_mb'] is not None:
+        lines.append(f"Пиковая память: {result['peak_rss_mb']:.1f} МБ")
+    for key, title in (('gutter_frame', "Кадр нумерации строк"), ('cursor_move', "Перемещение курсора")):
+        item = result[key]
+        lines.append(f"{title}: среднее {item['mean_ms']:.3f} мс, 95% {item['p95_ms']:.3f} мс, "
+                     f"максимум {item['max_ms']:.3f} мс")
+    lines.append(f"Вставка {PASTE_LINES} строк: {result['paste_ms']:.1f} мс, отмена: {result['undo_ms']:.1f} мс, "
+                 f"повтор: {result['redo_ms']:.1f} мс")
+    lines.append(formatSummary(result['hotpaths']))
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры горячих путей редактора")
+    parser.add_argument('--lines', default='1000,10000,100000,1000000',
+                        help="размеры документов в строках через запятую (до 10000000)")
+    parser.add_argument('--json', default='bench-editor.json', help="файл отчёта")
+    parser.add_argument('--frames', type=int, default=100, help="кадров прокрутки нумерации")
+    parser.add_argument('--moves', type=int, default=200, help="перемещений курсора")
+    args = parser.parse_args(argv)
+    app = QApplication(sys.argv[:1])
+    results = []
+    with tempfile.TemporaryDirectory(prefix='bench-editor-') as directory:
+        # Журналы автосохранения замеров не попадают в настоящий каталог восстановления
+        journal.RECOVERY_DIR = os.path.join(directory, 'recovery')
+        # Замеры ставятся до создания окна, чтобы сигналы подключились к обёрткам
+        timings = HotPathTimings()
+        timings.install(lab1.HOT_PATHS)
+        window = lab1.MainWindow()
+        window.resize(1200, 900)
+        window.show()
+        app.processEvents()
+        for lines in (int(value) for value in args.lines.split(',')):
+            result = benchSize(app, window, timings, lines, directory, args.frames, args.moves)
+            results.append(result)
+            text = formatResult(result)
+            print(text + '\n', flush=True)
+            window.resultArea.appendPlainText(text)
+        window.close()
+        timings.uninstall()
+    writeReport(args.json, {'platform': sys.platform, 'python': sys.version.split()[0], 'qt': QT_VERSION_STR,
+                            'results': results})
+    print(f"Отчёт записан в '{args.json}'.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# Стоимость отрисовки нумерации строк на кадр при прокрутке.
+# Запуск: python benchmarks/bench_gutter.py [число строк] [число кадров]
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from lab1 import CodeEditor
+
+def measure(editor, frames, step):
+    bar = editor.verticalScrollBar()
+    times = []
+    for frame in range(frames):
+        bar.setValue(frame * step)
+        start = time.perf_counter()
+        editor.lineNumberArea.repaint()
+        times.append(time.perf_counter() - start)
+    return times
+
+def report(title, times):
+    times = sorted(times)
+    print(f"{title}: кадров {len(times)}, среднее {statistics.mean(times) * 1000:.3f} мс, "
+          f"95% {times[int(len(times) * 0.95) - 1] * 1000:.3f} мс, максимум {times[-1] * 1000:.3f} мс")
+
+def main(lines=1000000, frames=300):
+    app = QApplication(sys.argv[:1])
+    editor = CodeEditor()
+    editor.resize(800, 1000)
+    editor.show()
+    editor.setPlainText('\n'.join('x' * 40 for _ in range(lines)))
+    app.processEvents()
+    maximum = editor.verticalScrollBar().maximum()
+    report("Прокрутка по строке", measure(editor, frames, 1))
+    report("Прокрутка скачками", measure(editor, frames, max(1, maximum // frames)))
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
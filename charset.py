@@ -0,0 +1,133 @@
+# Определение кодировки и переводов строк текстового файла. Читается только
+# начало файла постоянного размера, поэтому определение одинаково быстро для
+# файлов любого размера. Сначала ищется BOM, затем по нулевым байтам
+# распознаются UTF-32 и UTF-16 без BOM, затем образец проверяется как UTF-8;
+# иначе файл считается написанным в cp1251.
+import codecs
+import io
+from collections import namedtuple
+
+SAMPLE_SIZE = 64 * 1024
+
+# codec - кодек Python без BOM, bom - байты, которые пишутся перед текстом
+TextEncoding = namedtuple('TextEncoding', 'codec bom')
+
+UTF8 = TextEncoding('utf-8', b'')
+
+# Кодировки, которые можно выбрать при сохранении под новым именем
+SAVE_ENCODINGS = (
+    UTF8,
+    TextEncoding('utf-8', codecs.BOM_UTF8),
+    TextEncoding('utf-16-le', codecs.BOM_UTF16_LE),
+    TextEncoding('utf-16-be', codecs.BOM_UTF16_BE),
+    TextEncoding('cp1251', b''),
+)
+
+# UTF-32 LE проверяется раньше UTF-16 LE: его BOM начинается так же
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+_NAMES = {'utf-8': 'UTF-8', 'utf-16-le': 'UTF-16 LE', 'utf-16-be': 'UTF-16 BE',
+          'utf-32-le': 'UTF-32 LE', 'utf-32-be': 'UTF-32 BE', 'cp1251': 'Windows-1251',
+          'latin-1': 'ISO-8859-1'}
+_NEWLINES = {'\n': 'LF', '\r\n': 'CRLF', '\r': 'CR'}
+
+def encodingName(encoding):
+    name = _NAMES.get(encoding.codec, encoding.codec)
+    return name + ' BOM' if encoding.bom else name
+
+def newlineName(newline):
+    return _NEWLINES[newline]
+
+def detectEncoding(sample):
+    for bom, codec in _BOMS:
+        if sample.startswith(bom):
+            return TextEncoding(codec, bom)
+    # В UTF-32 старший байт каждой четвёрки всегда нулевой, а у символов BMP
+    # нулевой и следующий за ним; образец должен декодироваться целиком
+    quads = len(sample) // 4
+    if quads:
+        for codec, high, middle in (('utf-32-le', 3, 2), ('utf-32-be', 0, 1)):
+            if sample[high:quads * 4:4].count(0) == quads and sample[middle:quads * 4:4].count(0) > quads // 2:
+                try:
+                    sample[:quads * 4].decode(codec)
+                except UnicodeDecodeError:
+                    continue
+                return TextEncoding(codec, b'')
+    # В UTF-16 латиница, цифры, пробелы и переводы строк дают нулевой байт в
+    # каждой паре, а в однобайтовых кодировках нулевых байтов не бывает
+    pairs = len(sample) // 2
+    if pairs:
+        evenZeros = sample[0:pairs * 2:2].count(0)
+        oddZeros = sample[1:pairs * 2:2].count(0)
+        if oddZeros > pairs // 10 and evenZeros <= pairs // 100:
+            return TextEncoding('utf-16-le', b'')
+        if evenZeros > pairs // 10 and oddZeros <= pairs // 100:
+            return TextEncoding('utf-16-be', b'')
+    for codec in ('utf-8', 'cp1251'):
+        try:
+            # Образец может обрываться посреди многобайтового символа
+            codecs.getincrementaldecoder(codec)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return TextEncoding(codec, b'')
+    # Декодирует любые байты
+    return TextEncoding('latin-1', b'')
+
+def utf16Length(text):
+    # Длина текста в единицах UTF-16, которыми считают позиции QTextCursor и
+    # contentsChange: символ вне BMP (эмодзи) занимает две единицы
+    return len(text) if text.isascii() else len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+def detectNewline(text):
+    # Преобладающий перевод строки; в тексте без переводов строк - '\n'
+    crlf = text.count('\r\n')
+    lf = text.count('\n') - crlf
+    cr = text.count('\r') - crlf
+    if crlf and crlf >= lf and crlf >= cr:
+        return '\r\n'
+    return '\r' if cr > lf else '\n'
+
+def sniffFile(path, sampleSize=SAMPLE_SIZE):
+    # (кодировка, перевод строки) по началу файла
+    with open(path, 'rb') as f:
+        sample = f.read(sampleSize)
+    encoding = detectEncoding(sample)
+    decoder = codecs.getincrementaldecoder(encoding.codec)(errors='replace')
+    return encoding, detectNewline(decoder.decode(sample[len(encoding.bom):]))
+
+def openReader(raw, encoding):
+    # Потоковое чтение текста из двоичного файла после BOM; переводы строк
+    # любого вида приводятся к '\n'
+    raw.seek(len(encoding.bom))
+    return io.TextIOWrapper(raw, encoding=encoding.codec, newline=None)
+
+def openWriter(raw, encoding, newline):
+    # Потоковая запись: '\n' в тексте заменяется на newline
+    raw.write(encoding.bom)
+    return io.TextIOWrapper(raw, encoding=encoding.codec, newline=newline)
+
+def readText(path, encoding):
+    with open(path, 'rb') as raw:
+        reader = openReader(raw, encoding)
+        try:
+            return reader.read()
+        finally:
+            reader.detach()
+
+def decodeAppended(data, encoding):
+    # Байты, дописанные в конец файла: (текст с переводами строк '\n', сколько
+    # байтов использовано). Оборванный символ и завершающий '\r', за которым
+    # может последовать '\n', остаются до следующего дописывания
+    decoder = codecs.getincrementaldecoder(encoding.codec)()
+    text = decoder.decode(data)
+    consumed = len(data) - len(decoder.getstate()[0])
+    if text.endswith('\r'):
+        text = text[:-1]
+        consumed -= len('\r'.encode(encoding.codec))
+    return text.replace('\r\n', '\n').replace('\r', '\n'), consumed
@@ -0,0 +1,200 @@
+# История правок для отмены/повтора. Каждая правка хранится как замена:
+# позиция, удалённый текст и вставленный текст. Подряд идущий ввод символов
+# (и удаление клавишами Backspace/Delete) объединяется в одну операцию.
+# Объём истории ограничен: самые старые операции вытесняются, а тексты
+# больше spillThreshold хранятся во временном файле, а не в памяти; место
+# вытесненных текстов в файле освобождается, когда оно превышает место живых.
+# Позиции и длины считаются в единицах UTF-16, как у QTextCursor.
+import time
+from collections import deque, namedtuple
+from charset import utf16Length
+
+SpooledText = namedtuple('SpooledText', 'offset size')
+
+# Маркер "сохранённое состояние больше недостижимо"
+_LOST = object()
+
+class EditOperation:
+    __slots__ = ('position', 'removed', 'inserted', 'removedLength', 'insertedLength',
+                 'typing', 'time', 'parts')
+    def __init__(self, position, removed, inserted, removedLength, insertedLength, typing=False):
+        self.position = position
+        self.removed = removed
+        self.inserted = inserted
+        self.removedLength = removedLength
+        self.insertedLength = insertedLength
+        self.typing = typing
+        self.time = time.monotonic()
+        self.parts = None
+
+class EditHistory:
+    MAX_BYTES = 64 * 1024 * 1024
+    MAX_OPERATIONS = 10000
+    SPILL_THRESHOLD = 1024 * 1024
+    COALESCE_SECONDS = 1.0
+    def __init__(self, maxBytes=MAX_BYTES, maxOperations=MAX_OPERATIONS, spillThreshold=SPILL_THRESHOLD):
+        self.maxBytes = maxBytes
+        self.maxOperations = maxOperations
+        self.spillThreshold = spillThreshold
+        self.undoStack = deque()
+        self.redoStack = []
+        self.bytes = 0
+        self.spool = None
+        self.spoolLive = 0
+        self.cleanOperation = None
+        self.group = None
+    def clear(self):
+        self.undoStack.clear()
+        self.redoStack = []
+        self.bytes = 0
+        self.cleanOperation = None
+        self.group = None
+        self._closeSpool()
+    def canUndo(self):
+        return bool(self.undoStack)
+    def canRedo(self):
+        return bool(self.redoStack)
+    def setClean(self):
+        self.cleanOperation = self.undoStack[-1] if self.undoStack else None
+    def invalidateClean(self):
+        # Сохранённое состояние не достигается отменой: документ восстановлен после сбоя
+        self.cleanOperation = _LOST
+    def isClean(self):
+        return self.cleanOperation is (self.undoStack[-1] if self.undoStack else None)
+    def beginGroup(self):
+        # Все правки до endGroup отменяются и повторяются одним шагом
+        self.group = []
+    def endGroup(self):
+        parts, self.group = self.group, None
+        if not parts:
+            return
+        operation = EditOperation(parts[0].position, '', '', 0, 0)
+        operation.parts = parts
+        self._push(operation)
+    def record(self, position, removed, inserted, typing=False):
+        self._dropRedo()
+        if self.group is not None:
+            self.group.append(self._operation(position, removed, inserted))
+            return
+        if typing and self._coalesce(position, removed, inserted):
+            return
+        self._push(self._operation(position, removed, inserted, typing))
+    def undo(self):
+        # Возвращает список замен (позиция, длина заменяемого, новый текст) в порядке применения
+        if not self.undoStack:
+            return None
+        operation = self.undoStack.pop()
+        self.redoStack.append(operation)
+        parts = operation.parts or [operation]
+        return [(part.position, part.insertedLength, self.text(part.removed)) for part in reversed(parts)]
+    def redo(self):
+        if not self.redoStack:
+            return None
+        operation = self.redoStack.pop()
+        self.undoStack.append(operation)
+        parts = operation.parts or [operation]
+        return [(part.position, part.removedLength, self.text(part.inserted)) for part in parts]
+    def text(self, stored):
+        if isinstance(stored, SpooledText):
+            self.spool.seek(stored.offset)
+            return self.spool.read(stored.size).decode('utf-8')
+        return stored
+    def _operation(self, position, removed, inserted, typing=False):
+        return EditOperation(position, self._store(removed), self._store(inserted),
+                             utf16Length(removed), utf16Length(inserted), typing)
+    def _store(self, text):
+        if len(text) < self.spillThreshold:
+            return text
+        if self.spool is None:
+            import tempfile
+            self.spool = tempfile.TemporaryFile(prefix='history-')
+        data = text.encode('utf-8')
+        offset = self.spool.seek(0, 2)
+        self.spool.write(data)
+        self.spoolLive += len(data)
+        return SpooledText(offset, len(data))
+    def _closeSpool(self):
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
+        self.spoolLive = 0
+    def _release(self, operations):
+        # Тексты отброшенных операций во временном файле больше не нужны
+        for operation in operations:
+            for part in operation.parts or [operation]:
+                for stored in (part.removed, part.inserted):
+                    if isinstance(stored, SpooledText):
+                        self.spoolLive -= stored.size
+        if self.spool is None:
+            return
+        if not self.spoolLive:
+            self._closeSpool()
+        elif self.spool.seek(0, 2) > 2 * self.spoolLive:
+            self._compactSpool()
+    def _compactSpool(self):
+        # Живые тексты переписываются в новый файл подряд
+        import tempfile
+        spool = tempfile.TemporaryFile(prefix='history-')
+        def move(stored):
+            if not isinstance(stored, SpooledText):
+                return stored
+            offset = spool.tell()
+            spool.write(self.text(stored).encode('utf-8'))
+            return SpooledText(offset, stored.size)
+        for operation in list(self.undoStack) + self.redoStack + (self.group or []):
+            for part in operation.parts or [operation]:
+                part.removed = move(part.removed)
+                part.inserted = move(part.inserted)
+        self.spool.close()
+        self.spool = spool
+    def _coalesce(self, position, removed, inserted):
+        if not self.undoStack:
+            return False
+        last = self.undoStack[-1]
+        if (not last.typing or last is self.cleanOperation or last.parts is not None
+                or time.monotonic() - last.time > self.COALESCE_SECONDS
+                or inserted == '\n' or last.inserted.endswith('\n')):
+            return False
+        if not removed and not last.removed and inserted and last.position + last.insertedLength == position:
+            last.inserted += inserted
+            last.insertedLength += utf16Length(inserted)
+        elif not inserted and not last.inserted and removed and position + utf16Length(removed) == last.position:
+            # Backspace: удаляемый текст растёт влево
+            last.removed = removed + last.removed
+            last.removedLength += utf16Length(removed)
+            last.position = position
+        elif not inserted and not last.inserted and removed and position == last.position:
+            # Delete: удаляемый текст растёт вправо
+            last.removed += removed
+            last.removedLength += utf16Length(removed)
+        else:
+            return False
+        last.time = time.monotonic()
+        self.bytes += len(removed) + len(inserted)
+        return True
+    def _push(self, operation):
+        self.undoStack.append(operation)
+        self.bytes += self._size(operation)
+        evicted = []
+        while len(self.undoStack) > 1 and (self.bytes > self.maxBytes or len(self.undoStack) > self.maxOperations):
+            evicted.append(self.undoStack.popleft())
+            self.bytes -= self._size(evicted[-1])
+            # Сохранённое состояние до вытесненной правки больше недостижимо,
+            # а после неё - становится дном стека
+            if self.cleanOperation is None:
+                self.cleanOperation = _LOST
+            elif self.cleanOperation is evicted[-1]:
+                self.cleanOperation = None
+        if evicted:
+            self._release(evicted)
+    def _dropRedo(self):
+        if self.redoStack and any(operation is self.cleanOperation for operation in self.redoStack):
+            self.cleanOperation = _LOST
+        dropped, self.redoStack = self.redoStack, []
+        if dropped:
+            self._release(dropped)
+    def _size(self, operation):
+        # Тексты во временном файле память не занимают
+        parts = operation.parts or [operation]
+        return sum(len(part.removed) if isinstance(part.removed, str) else 0 for part in parts) + \
+            sum(len(part.inserted) if isinstance(part.inserted, str) else 0 for part in parts)
@@ -0,0 +1,37 @@
+# Сборка ресурсного модуля icons_rc.py: иконки панели инструментов уменьшаются
+# до ICON_PIXELS (исходные 512x512 долго декодируются при запуске) и
+# упаковываются pyrcc5 в один модуль в корне проекта.
+#
+#   python icons/build_resources.py
+import os
+import subprocess
+import sys
+import tempfile
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+ICON_NAMES = ['about', 'copy', 'cut', 'delete', 'help', 'new', 'open', 'paste', 'redo', 'save',
+              'syntax', 'undo']
+ICON_PIXELS = 64
+
+def main():
+    iconDir = os.path.dirname(os.path.abspath(__file__))
+    output = os.path.join(os.path.dirname(iconDir), 'icons_rc.py')
+    with tempfile.TemporaryDirectory() as directory:
+        files = []
+        for name in ICON_NAMES:
+            image = QImage(os.path.join(iconDir, name + '.png'))
+            if image.isNull():
+                sys.exit(f"Не удалось прочитать {name}.png")
+            image = image.scaled(ICON_PIXELS, ICON_PIXELS, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            image.save(os.path.join(directory, name + '.png'))
+            files.append(f'    <file>{name}.png</file>')
+        qrc = os.path.join(directory, 'icons.qrc')
+        with open(qrc, 'w', encoding='utf-8') as f:
+            f.write('<!DOCTYPE RCC><RCC version="1.0">\n<qresource prefix="/icons">\n')
+            f.write('\n'.join(files))
+            f.write('\n</qresource>\n</RCC>\n')
+        subprocess.check_call([sys.executable, '-m', 'PyQt5.pyrcc_main', '-no-compress', '-o', output, qrc])
+
+if __name__ == '__main__':
+    main()
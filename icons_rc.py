@@ -0,0 +1,1002 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03\xc7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
+\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x54\x49\x44\
+\x41\x54\x78\x9c\xed\xda\x4f\x88\x55\x65\x18\xc7\xf1\xcf\x68\x8a\
+\xd4\x2c\x12\x19\x0d\x0b\xb2\x08\x2a\x04\x45\x33\x15\x2a\x32\x70\
+\x40\x85\x16\xe9\xda\x36\x2d\x12\x17\x2e\x14\x09\x44\x25\xda\xe4\
+\xca\x45\xb4\x12\x93\x42\xfb\xc3\x14\x42\x46\x41\xb8\x11\x6d\x53\
+\x4d\x8b\xa8\x4d\x45\xe1\x1f\x50\x91\x1a\x13\x32\x75\xd4\x3b\x2e\
+\x5e\x2f\xde\x19\xb8\x77\xce\x3d\xe7\x3d\xe7\x3d\x17\xef\x17\x9e\
+\xcd\x61\x38\xcf\xf3\xfb\xf1\x9e\xfb\x3e\xf3\xbc\x2f\x7d\xfa\xf4\
+\xe9\x93\x8e\x17\xb0\x1d\x0f\xa5\x2e\xa4\x6a\x66\x61\x1f\x6e\x61\
+\x02\x7b\x52\x15\xf2\x40\x82\x9c\xcf\xe0\x08\x9e\x6b\x79\x36\x37\
+\x41\x1d\x60\x46\xc5\xf9\xb6\x60\xd4\x64\xf1\x49\xa9\x6a\x05\x0c\
+\xe1\x03\xbc\x5a\x51\xbe\xcc\x54\x61\xc0\x7a\x1c\xc2\x23\x15\xe4\
+\xea\x9a\x32\x3f\x81\x39\x78\x0f\x5f\xab\xa9\x78\xca\x5b\x01\x4b\
+\xf1\x31\x16\x97\xf4\xfe\x68\xc4\x5e\x01\x03\xd8\x81\xef\xf5\x80\
+\x78\xe2\xae\x80\x47\xf1\x21\xd6\x46\x7c\x67\xe9\xc4\x5a\x01\x9b\
+\xf0\xb3\x1e\x13\x4f\x71\x03\x06\x85\xed\xed\x73\xcc\x2b\x5e\x4e\
+\xf5\x14\xf9\x04\x56\x09\x1d\xdd\x53\x91\x6a\xe9\x19\x66\x0a\xbd\
+\xfb\xb8\xd0\xc7\xc7\x88\x23\x77\xdf\x5b\x7b\x9e\xc0\x77\xe2\x09\
+\x6f\x8d\x73\x78\x07\x8f\x55\xa6\xa6\x4b\x5e\xc7\x15\xe5\x88\x6f\
+\x8d\x9b\x18\xc1\xea\x6a\x64\x4d\xcf\x5c\x7c\xa6\x7c\xe1\x53\xa3\
+\x81\x13\x18\x2e\x5d\x61\x07\xd6\xe0\x8c\xea\xc5\x4f\x8d\x93\x78\
+\xb1\x5c\xa9\x93\x99\x3a\xb0\xa8\x43\x34\x70\x14\x4f\x96\xa8\x1b\
+\x61\x60\xf1\x53\x42\xa1\xd3\xc5\x35\xec\xc5\xec\x32\xc4\x6f\xc1\
+\xd5\x1a\x88\xcc\x12\xbf\xe2\xf9\x58\xc2\xe7\xe3\x58\x0d\x44\x75\
+\x1b\xe3\xd8\xa5\x60\x47\x3b\x8c\x0b\x35\x10\x53\x24\xbe\x55\xa0\
+\x15\xbf\x5c\x03\x01\x31\xe2\x4f\x3c\x9b\xc7\x80\x91\x1a\x14\x1f\
+\x2b\xc6\xe4\xd8\x2e\x07\x84\xc3\x89\xeb\x35\x10\x10\x23\xae\xca\
+\xd9\x3c\x2d\xc1\x2f\x35\x10\x10\xcb\x84\x35\x79\x4c\x68\x0e\x32\
+\x1b\x35\x10\x51\x34\xae\x08\xb3\xc9\x5c\xac\xd3\xfb\x3b\xc3\x04\
+\xce\x62\x41\x5e\x13\x86\xf0\x65\x0d\x44\x14\x8d\x13\x0a\xce\x1a\
+\xde\xc4\x7f\x35\x10\x52\x24\xde\x2e\x62\x00\x3c\x2d\x9c\xe9\xa5\
+\x16\x92\x37\xc6\xb1\xac\xa8\x09\xb3\xf0\xae\x7a\xfd\x87\xd8\x4d\
+\xfc\x28\xd2\x14\xfc\x65\xf5\x98\x11\xe4\x89\x37\x62\x18\x00\x0f\
+\xe3\xd3\x88\x85\x1d\xc6\x4b\xc2\xf9\xc2\x4e\x7c\x84\xdf\xc5\xdf\
+\x8e\xcf\x09\x5b\x7d\x34\x36\xe3\xdf\x08\x85\xed\x6f\xf3\xfe\xc7\
+\xb1\x0d\x3f\x88\x67\xc6\xd6\x38\xd2\xef\xb1\x48\xf1\x49\x71\x3b\
+\x03\x5a\x59\x8e\x4f\x14\xff\x0d\xfa\x43\x09\xa7\xe2\x33\xb1\x5b\
+\xfe\xb3\x82\x2c\x06\x34\x59\x8c\x6f\x72\xe6\x69\xc6\xba\xbc\x42\
+\xa7\x63\xa5\xf0\xed\x96\x69\x40\x93\x8d\xf2\x77\xab\x23\x79\xc4\
+\x65\x65\x10\x07\x75\xf7\xcd\xe6\x31\x80\x30\x04\xc9\xd3\xad\xfe\
+\x7f\xb7\xce\x52\xd9\x88\xbf\x33\x16\x94\xd7\x80\x26\x6f\xe9\xfe\
+\xb7\x61\x53\xc1\x9c\x99\x58\x88\xe3\x19\x8a\x29\x6a\x00\xe1\x02\
+\x56\x37\x2d\xfb\x81\x08\x39\x33\xd1\x1c\xb8\x5c\xeb\x50\x4c\x0c\
+\x03\x08\xc7\x69\x63\x1d\xf2\xb4\xc6\x6f\x91\x72\x66\xa6\xd3\xc0\
+\x25\x96\x01\x84\x9e\xff\x9f\x36\x79\x5a\xa3\x21\xc1\x9d\x86\x76\
+\x03\x97\x98\x06\xc0\x0a\xd9\x0e\x72\xd7\x56\x7d\x53\xf4\xba\xd0\
+\xd9\x6d\xc0\xc5\x96\xe7\x8d\xc8\x79\x46\xf1\x1a\x6e\x4c\xf3\x77\
+\x49\x2f\x72\x0d\xe1\x0b\x9c\x57\xde\xc1\xe7\x66\x9d\xb7\xe3\xf7\
+\x4b\xca\x5b\x2b\xf6\x69\x6f\xc0\x57\x09\xeb\xaa\x8c\x19\xda\x6f\
+\xc5\xa3\x09\xeb\xaa\x94\xf9\xc2\xa7\x36\xd5\x80\xd3\x09\x6b\xaa\
+\x9c\x61\xdc\x36\xd9\x80\xb1\x9e\xb8\x99\x15\x89\xbf\x84\x7d\x7f\
+\x55\xcb\xb3\xaa\x77\xc1\xe4\x3c\x28\xcc\x03\x9a\x2b\xe0\x76\xda\
+\x72\xd2\xf0\x8a\x7b\x5b\xe3\x7d\x69\x00\xe1\x52\xf7\x04\x2e\x0d\
+\x24\x2e\x24\x15\x83\xc2\x81\xcf\xa9\xd4\x85\xf4\xe9\xd3\x27\x2d\
+\x77\x00\x7c\x74\xeb\x56\x87\x22\x86\xca\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x4d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xda\x49\x44\
+\x41\x54\x78\x9c\xed\xda\x41\x0a\x83\x30\x18\x44\xe1\x69\x0f\x66\
+\xbd\xff\x2e\x47\xb0\xbd\x87\x76\xa1\xa0\x2d\x08\x4a\xad\x4f\xc8\
+\xfb\xe0\x07\x17\x62\x26\x83\x6e\x82\x89\x24\x49\x92\x74\xb6\x36\
+\x49\x99\xe6\xc1\x46\x61\x3c\x93\x0c\xd3\x74\x70\x16\x44\x9f\xb9\
+\x80\x9e\x0a\x71\xa3\x16\xce\xb8\xf1\x25\x24\xcb\x9d\x58\xf4\x4a\
+\x2c\x80\x0e\x40\xb3\x00\x3a\x00\xcd\x02\xe8\x00\x34\x0b\xa0\x03\
+\xd0\x2c\x80\x0e\x40\xb3\x00\x3a\x00\xcd\x02\xe8\x00\x34\x0b\xd8\
+\x71\x6f\x9b\xcf\x63\xac\x5f\xe7\xdb\x51\xcf\xed\x92\x34\x3b\xf6\
+\xb5\x59\x39\x30\xe4\xbf\xa7\x6c\xdd\x54\xf5\x9f\xc0\x1e\x4d\xc6\
+\xd7\x6b\x79\x98\x79\xb5\xe9\xa7\x8c\x9b\x8f\xd9\x3d\x14\x25\x16\
+\xbd\x12\x0b\xa0\x03\xd0\x2c\x80\x0e\x40\xb3\x00\x3a\x00\xcd\x02\
+\xe8\x00\x34\x0b\xa0\x03\xd0\x2c\x80\x0e\x40\xb3\x00\x3a\x00\xcd\
+\x02\xc0\xb5\x87\x95\xeb\x53\x91\x05\xbc\x56\xae\xab\xd1\xa4\xf2\
+\x5f\x65\x25\x49\x92\x44\x7a\x03\x14\xde\x8d\xb4\xab\x5a\x2a\xfb\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xc8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x04\x7a\x49\x44\x41\x54\x78\x9c\xed\
+\x9a\x3d\x6c\x1b\x65\x1c\xc6\x9f\xe7\x75\x1a\x3e\x84\x3a\x52\x29\
+\xb5\xef\x9c\xdc\x50\x55\x6c\xdd\x3a\xb4\x0c\x48\x2c\x74\xe8\xc6\
+\x00\x12\x43\x64\x32\x02\x8d\x40\x42\xa2\x13\x20\x58\xc2\xd2\x85\
+\x56\xaa\x98\x10\x12\x03\x0c\x80\x54\x21\x21\x86\x0e\x7c\x88\x05\
+\x09\x09\x54\xc9\x1f\x67\x87\x78\xa9\xc8\x54\x88\xfc\x71\x0f\x43\
+\x6c\x27\x4e\xed\xf3\xdd\x7b\x77\xb1\x9b\xde\x6f\xb2\x7d\xef\xff\
+\xd3\xef\x7b\xff\xf7\x0b\xc8\xc9\xc9\xc9\xc9\xc9\x79\x6c\x61\x96\
+\xca\x4b\xa5\x92\x67\x8c\x79\x96\xfd\x7e\x60\xab\xa3\x10\x04\x3b\
+\xd5\x9d\x9d\x56\x9a\x7e\x1d\x26\xb3\x04\xac\x3a\x4e\x85\xe0\xa7\
+\x24\x4d\x22\x45\x52\x4f\xc4\xd5\x9a\xef\x7f\x97\x92\x6b\x63\x24\
+\x73\x6e\x0a\xab\xae\xbb\x9e\x4a\xf0\x00\x40\x2e\x41\xbc\x92\x82\
+\x5b\x13\x59\x4a\x5b\xe1\xaa\xeb\xae\x53\xb8\x75\x38\x78\x49\x7d\
+\x92\xbd\x38\x7a\x24\x2d\x91\x2c\x00\x00\x33\xfa\xa3\x80\x94\x13\
+\x30\x29\x78\x00\x20\x78\xbb\xea\x37\x36\xe2\xe8\xf2\x9c\xf2\x4d\
+\x00\xaf\xa7\xe9\xdf\x24\x52\xcb\xec\xb4\xe0\x17\x9d\x54\x9c\x3d\
+\x1a\xbc\xa4\x5d\x40\x3f\xa5\xa1\x3b\x6b\x12\x0f\x81\x89\xc1\x2b\
+\x78\x11\x28\x54\x40\x5c\x4c\xa6\x5d\xd8\x2f\x54\x7a\xc1\x73\xcb\
+\x5f\xc4\x93\x94\x10\xf0\x9b\x5a\xab\x11\x2a\x97\x28\x01\xd3\x82\
+\xaf\xb5\x5a\xbf\x79\x4e\xb9\x92\x44\x37\x20\x33\xaa\xd2\xa4\x07\
+\xc0\x8b\x23\x4d\x10\xa2\x5e\x76\x5d\xf7\x67\xdf\xf7\xeb\xd3\xda\
+\x59\x0f\x81\xb0\xe0\x6d\x75\x1e\x41\x49\x15\x90\x34\xec\xf1\x4c\
+\x58\x1b\xab\x1e\x70\x0c\xc1\x03\xe0\x28\x01\x02\x7e\xa7\xf4\x7d\
+\x54\x49\x01\xd7\x86\x25\x74\x16\xb1\x13\x70\x3c\xc1\x8f\x43\xe1\
+\x97\x6a\xd3\x7f\x27\x6a\x7b\xcf\x2d\xbf\x01\x20\x52\x02\x62\x0d\
+\x81\x79\x04\x9f\x35\x91\x13\x70\x12\x83\x07\x22\x26\xe0\xa4\x06\
+\x0f\x44\x78\x07\xac\x3a\x4e\x85\xc2\xd8\xc2\x86\xc4\x5f\x40\xa1\
+\x12\x5a\xea\xa8\x4b\x19\xaf\xb6\x53\x21\x34\x01\xa5\x52\xc9\x9b\
+\xbc\xaa\xe3\xc5\xd9\x93\x9c\xc5\x0f\x1e\x98\x91\x80\x65\x63\xce\
+\x00\xc9\xe7\xf6\x81\xd4\x4c\xaa\x23\x2b\x42\x13\xd0\xef\x31\x28\
+\x0c\x5a\x48\xea\x13\xbc\x1d\xd7\x40\x20\x35\xd5\xe2\x96\x9d\x7b\
+\xd9\x13\x79\x1e\x40\xb2\x1f\x77\x49\xfb\x28\xf0\x48\x2d\x5d\xb3\
+\x20\x4f\xc0\xbc\x1d\x98\x37\xd6\xcb\xe1\x32\xca\x4f\xd2\xd5\xa6\
+\x11\x9d\x24\x0e\x04\x54\x53\x3e\xb7\x1a\x68\xec\x3d\xfc\x74\xb0\
+\x1f\x40\x5d\x1a\x6c\x91\xc5\x94\x9f\x8d\x75\x02\xe8\x6a\xd3\x80\
+\x1f\x24\x2d\xf7\x06\x44\x50\x12\xd0\xc2\x87\xe3\x4f\xc4\x83\xb9\
+\x04\xcf\x83\x38\x1f\x4f\x3e\xaa\x7d\x5b\xac\x8f\x3a\x16\x0b\xeb\
+\x1e\xa0\x16\xb7\x82\x92\x60\x98\x70\x08\x4c\x9d\x27\x50\x87\xb6\
+\xc4\xfe\x84\x78\x37\x9e\x7c\x34\xac\x13\xd0\x40\x63\xcf\xb6\xdb\
+\x45\x67\x30\x04\xc4\xbb\xd5\x66\x36\x73\x90\xc7\xbe\x0a\xe4\x09\
+\x98\xb7\x03\xf3\xc6\xfa\x1d\x50\x2c\x16\x9f\x3a\xc5\xc2\xbb\x24\
+\x4b\x49\x1c\x90\xd4\xda\xeb\x75\x3e\x6e\xb7\xdb\xff\x4e\x6d\x43\
+\x3c\xbf\xe6\x94\x3f\xb3\x95\x0f\xc3\x3a\x01\xcb\xc6\xbc\x4d\xf2\
+\xba\xad\xfc\x10\x92\x78\x7a\x79\xb9\x0b\xe0\xfd\xf1\x27\x07\xf3\
+\x00\x02\xe7\x40\x9c\x8b\x27\x1f\x8d\x04\x43\xc0\x74\xec\x65\xc7\
+\x91\xd8\x9d\x97\xbc\x75\x0f\xa8\x35\x1b\x9f\xac\xba\x6e\xd7\x08\
+\xae\xad\x0e\x00\x08\x08\xbf\xde\xf4\x6f\x3c\xfc\xe4\xe0\x5c\x00\
+\xd2\x1f\x00\x7e\x8c\x27\x1f\x8d\x24\x47\x63\x9d\xba\xef\x67\xb7\
+\xd1\x41\x9c\x1e\x7e\x14\xf8\x43\xad\xd9\x78\x33\x0b\x33\x8b\x5a\
+\x05\x96\x20\x5d\x1e\x7d\x93\xee\x65\x65\x68\x21\x13\xb0\xe6\x38\
+\x9b\x20\x57\x00\x40\x52\xd0\xa3\xee\x64\x65\x2b\xf5\x2b\x32\x09\
+\x59\xf2\x1c\xe7\x9a\xc0\x83\x29\x36\xf1\x75\xd3\x6f\xd6\x32\x33\
+\x18\xb5\xa1\xa4\xc2\xb4\x35\x79\x88\xd4\xf0\x7c\x7b\xf6\x49\x2f\
+\x71\x1a\xd2\x65\x90\x2b\xa3\x15\xb6\x74\x9f\xbd\xee\x5b\xf1\x6c\
+\xc6\x23\xce\xa6\x68\x01\xb1\xef\xec\x0c\x43\x11\x22\x9d\x13\xf0\
+\x50\x1b\xe9\x7e\x10\xf4\x5f\xaa\x67\x78\x47\x10\x98\xf1\x0e\x28\
+\xa8\xf3\x37\xa4\x58\xb7\xbb\x26\x13\x7d\xd7\x44\x52\x20\xe8\x2b\
+\xf4\xba\x17\xea\xdb\xdb\xbf\x5a\x99\x93\x0e\xe2\x62\x2f\xb4\xf7\
+\x85\xf6\x80\xea\xce\x4e\x6b\xcd\x75\xaf\x42\xb8\x12\xfb\xaa\xda\
+\xfe\xd1\xd8\x60\x17\x67\xfa\x7a\x7e\x88\x80\xff\x40\xdd\xeb\x41\
+\x77\x92\x8c\xf9\x62\xb1\x78\x16\xe4\x28\x2e\x03\xfc\x13\xd6\x7e\
+\xe6\x10\x18\xdc\xd0\x8c\x7d\x4b\xd3\x73\xca\x37\x47\xdb\x58\x19\
+\xae\xe7\x8f\xb2\x6c\xcc\xab\xc3\xcf\x82\x76\x6b\xdb\xdb\xd5\xb0\
+\xf6\x0b\x59\x06\x6d\x71\x5d\xf7\x02\xc1\xf7\x46\x3f\x88\x5f\x62\
+\xc6\xe6\xdd\xa2\x95\x41\x2b\x8a\xc5\xe2\xd9\x27\x8c\x79\x05\xc2\
+\x75\x90\xcf\x00\x80\xa4\x07\xea\x76\x3e\x9a\x25\x7b\x2c\x09\x10\
+\xb4\xee\xb9\xe5\xd7\x32\x52\x6f\x00\x9c\x1a\xb3\x27\x05\x20\x36\
+\xea\xed\xb6\x3f\x4b\x38\xb3\x04\x08\x08\x46\x9b\xda\xfb\x25\x34\
+\xd2\x9d\x9d\xc4\x76\xa5\x07\x20\x36\x6a\xbe\xff\x79\x94\xf6\xd9\
+\xbd\x03\xa8\x6f\xd3\x29\xa1\xd1\x10\xb4\x0b\xe1\x96\xba\x9d\xe7\
+\xa2\x06\x0f\x64\x7c\x8b\xc1\x5b\x59\x29\xf5\x8d\x59\xc9\xd2\x06\
+\xf7\xa7\x9b\xc3\xb7\xfd\x09\x39\xad\xc8\xc9\xc9\xc9\xc9\xc9\x39\
+\x16\xfe\x07\x11\xab\xf7\x6e\xd4\x0d\x44\xea\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x24\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x00\xd6\x49\x44\x41\x54\x78\x9c\xed\
+\xda\x41\x0a\x83\x30\x14\x45\xd1\xb4\xb8\x10\x77\xd2\x2e\xbd\xae\
+\xc4\xa5\xd8\x61\x51\x84\xe2\x37\x3f\x37\xe2\x3d\xe0\xd0\xcf\xf3\
+\x91\x44\x07\x96\x22\x49\x92\xf4\xb3\x54\xb8\xc6\xd6\xa1\xa3\x9e\
+\x49\x73\xdf\x49\x73\xab\xcb\x2a\xe0\x95\x34\xb7\x89\x1a\x5b\x60\
+\x6e\x9e\x3a\x68\x08\xdc\xf3\xa8\x9e\x02\x94\xb5\x05\x2e\xc3\x02\
+\xe8\x00\xb4\xc8\x19\x70\xc4\x5c\xfa\xfb\x26\x58\x9d\x61\xd9\x2b\
+\xe0\x93\x3c\xff\xb4\xec\x02\xa6\xe4\xf9\xa7\xdd\x7e\x05\xec\xbd\
+\xd3\x97\xc0\x3d\x3d\xdb\x3e\x4f\xd3\x33\xa0\x7b\x16\x40\x07\xa0\
+\x59\x00\x1d\x80\x66\x01\x74\x00\x9a\x05\xd0\x01\x68\x16\x40\x07\
+\xa0\x59\x00\x1d\x80\x66\x01\x74\x00\x9a\x05\xd0\x01\x68\x16\x40\
+\x07\xa0\x59\x00\x1d\x80\x66\x01\x74\x00\x9a\x05\xd0\x01\x68\x16\
+\x40\x07\xa0\x59\x00\x1d\x80\x66\x01\x74\x00\x5a\xe4\x1f\xa1\x7f\
+\xff\x0f\x5c\xca\xed\x57\x80\x05\xd0\x01\x24\x49\x92\x28\x5f\x5c\
+\x4f\x29\xff\xec\xb0\x5c\x64\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x05\x0b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x04\xbd\x49\x44\x41\x54\x78\x9c\xe5\
+\xdb\xcf\x8b\x56\x55\x18\x07\xf0\xcf\xbc\x4e\xcc\x28\x28\x43\x6e\
+\xcc\x91\x1a\x21\x83\x5a\x18\x64\x8b\x6a\x63\x91\x81\x6d\x32\xb1\
+\xbf\xa0\xf2\x0f\x48\x72\x1b\x14\xd9\x26\x5b\xdb\xa6\x20\x17\x4d\
+\x0b\x85\xb1\x36\xfd\x20\x5a\x25\xa1\x1b\xdd\x08\x2a\x66\x33\x89\
+\x8a\x61\x88\x0e\x38\x93\x31\xb6\x38\xf7\xcd\xf7\x3d\xf7\xbe\xef\
+\xcc\x3b\x73\xcf\x79\x5f\xf5\x0b\x77\x71\xb9\xe7\x9c\xe7\xfb\xdc\
+\x7b\xcf\x39\xcf\x79\x7e\x0c\xc9\x87\x11\x3c\x85\x09\x6c\xc0\x18\
+\x46\x8b\x67\x73\xb8\x81\xab\xf8\x03\xe7\x30\x9f\x83\xd4\x50\xc2\
+\xb1\xd7\xe1\x35\xec\xc0\x4b\x78\x1a\x8f\x2c\xb1\xef\xbf\x38\x83\
+\xe3\xf8\x19\x3f\xe2\x66\x02\x8e\xb5\x63\x18\xbb\x31\x25\x7c\xd5\
+\xbb\x35\x5d\x73\x38\x56\x8c\x3d\x9c\x4d\x9b\x1e\xb0\x1a\xfb\x30\
+\xa3\x3e\xa5\x3b\x5d\x33\x85\xac\x35\x75\x10\x5f\xe9\x14\x68\xe0\
+\x1d\x7c\x88\xc7\x16\x69\x7b\x17\xd3\x38\x8f\x4b\xb8\x8e\xdb\xc5\
+\xb3\xd5\x58\x8f\x4d\x78\x12\x4f\x14\x63\x77\xc3\x55\x7c\x80\x2f\
+\xb0\xb0\x0c\xee\x2b\xc6\xb3\x38\xa9\xfb\xd7\x3a\x8b\x83\xd8\x29\
+\x2c\x7a\x4b\xc5\x58\xd1\xe7\xd3\x62\x8c\x6e\x32\x4e\x16\x5c\xb2\
+\x61\x08\xfb\x75\x9e\xe3\xb3\x38\x84\x6d\x35\xca\x7c\xae\x18\x73\
+\xb6\x83\xcc\xf9\x82\x53\xca\x45\x1d\x61\x65\x9f\xea\x40\xe2\x16\
+\x0e\x08\xbf\x72\x2a\x3c\x8a\x8f\x0b\x59\x55\x1c\x8e\x61\x6d\x2a\
+\xe1\xe3\x38\x5d\x21\x74\x01\x93\xc5\xf3\x5c\xd8\x88\xaf\x0b\xd9\
+\x31\x9f\xd3\x29\xb8\x4c\xe0\x42\x85\xb0\x6b\xd8\x55\xb7\xb0\x1e\
+\xf0\x46\xc1\x21\xe6\xf5\xbb\xc0\xb9\x16\x8c\xab\x56\xfe\x37\x61\
+\xd5\xee\x37\xc6\x05\x2e\x31\xbf\x0b\x6a\xf8\x13\xd6\xa9\xfe\xed\
+\x8f\x08\x5b\xd7\xa0\x60\x54\xe0\x54\x35\x1d\x96\xbd\x26\x0c\x09\
+\x8b\x4a\x3c\xe8\x61\xac\x5a\x19\xdf\x24\x58\x85\xaf\x54\x2f\x8c\
+\xcb\xda\x1d\xf6\x57\x0c\x76\xc4\x60\x2a\xdf\xc4\x2a\xd5\x7f\xc2\
+\xfe\x5e\x07\x7a\x56\xd8\x5b\xe3\x39\x3f\xda\xad\xd3\x80\x60\x54\
+\x79\x4d\x98\xd7\x83\xb1\xd4\x50\xb6\xf0\xae\x19\x8c\x05\x6f\xa9\
+\xd8\xa4\xbc\x3b\x9c\xb0\xb8\x79\x0d\xf6\x46\x1d\x17\xf4\x77\xab\
+\x5b\x2e\x76\x29\xdb\x09\x7b\x17\xeb\xb4\x06\x97\xa3\x4e\x93\x89\
+\x08\x6e\x8f\xae\x14\x98\xd4\xae\xcb\x65\x8b\xec\x5e\xfb\xa2\x0e\
+\xb7\x04\xab\x2b\x05\xe2\x85\x2a\x05\x36\x2a\x9b\xcd\xfb\x3a\x35\
+\x1e\x56\x3e\xcf\x1f\x48\x44\x8c\x3c\x2f\x80\xa0\x43\xab\x9c\x19\
+\x1d\x9c\x2a\xbb\xa3\x86\xb3\xd2\x1e\x6c\x72\xbd\x80\xf5\xca\xa7\
+\xc8\xdd\x55\x0d\x63\xa3\xe7\x50\x42\x52\xf0\x4b\x74\xa5\xc4\x21\
+\xed\xba\x4d\xc5\x0d\xd6\x29\x9f\xef\xeb\x3c\xcf\xf7\x1b\xdb\xb4\
+\xeb\x36\x27\xe8\xfc\x3f\xde\x8a\x1a\x9c\xcd\x4c\x30\x07\x62\xcf\
+\xd2\x1e\xee\x19\x06\xaf\x46\x8d\xbf\xcd\xc7\x2b\x1b\xbe\x8b\xee\
+\xdb\x74\x8e\x4f\x7c\x3b\x33\x91\xca\x89\x9d\xca\x27\x45\x84\x88\
+\xcd\x9d\x96\x07\x0b\x7a\x73\x60\xde\x2f\x18\xd3\x6e\x19\xde\xc1\
+\xc8\xb0\x10\xae\x6a\xdd\x17\xa7\x85\x30\x55\x6a\xc4\x2b\xff\x2b\
+\x89\xe5\xdd\x10\x74\x9b\x28\xee\x87\xb1\x65\x58\xd9\x75\x74\x3e\
+\x31\x91\x26\x5e\xce\x24\xa7\x15\xe7\xb5\xeb\xbb\xb9\x21\x04\x2a\
+\x5b\xf1\x67\x36\x3a\xf9\x71\x29\xba\xdf\xd0\x50\x9e\xef\x7f\x67\
+\x22\xd3\x0f\x5c\x8f\xee\xc7\x1a\xca\x4e\x8e\xdb\x1e\x5c\xc4\xba\
+\x8d\x2e\xc9\x41\xf0\x20\xa3\x21\x98\x85\xad\x18\x24\x6f\x6f\xdd\
+\x88\x75\x9b\x6b\x28\x6f\x79\x29\x4f\x80\xfd\x46\xac\xdb\x8d\x86\
+\x10\x66\x6e\xc5\xfd\xe4\xfb\xeb\x15\xb1\x6e\x57\x1b\x42\x4e\x4e\
+\x2b\xb6\xe4\xe1\xd2\x17\xc4\xba\x5d\xa4\x7f\xa6\x70\x2e\x87\x48\
+\x13\xb1\x29\xfc\x0f\x46\x1a\x82\xcf\xfc\x4c\x4b\xc3\x21\xbc\x90\
+\x81\x50\x6e\xbc\xa8\x3d\x42\x74\x06\xf3\xcd\x6d\xf0\x78\xd4\x78\
+\x47\x16\x4a\x79\x11\x1f\xf9\xdb\x74\xde\x23\xbf\x43\x24\xf7\x14\
+\x38\xa7\xc2\x21\xd2\x44\x3f\x5c\x62\x39\x5f\x40\xec\x12\xbb\xad\
+\x70\x89\x35\xa7\xc0\x4d\x7c\x1f\x75\x7a\x37\x31\xa9\x9c\x88\x75\
+\xf9\x41\x45\xe2\xe5\xc3\xe4\x16\x7f\xb3\xaa\xe1\xc3\x12\x18\x99\
+\xd6\x25\xdb\xb4\x2a\x34\x96\x2a\xf9\x29\xc7\x0b\x18\x57\x0e\x8d\
+\xbd\xd7\xad\xc3\x1a\x5c\x89\x3a\xa4\x0a\x8e\xe6\x78\x01\x55\xc1\
+\xd1\x45\x53\x6c\x73\x85\xc7\xb7\x4b\x1b\x1d\xae\x0a\x8f\x2f\x69\
+\x61\x6f\x08\xc9\x04\xad\x1d\x1f\xaa\x04\x09\x1e\xbc\x14\x99\x39\
+\x6c\xed\x75\xa0\xaa\x24\xa9\xa3\x06\x3f\x49\xea\xa8\x32\xef\x9e\
+\x93\xa4\x08\x07\x87\xaa\xbc\xe0\x41\x4e\x93\x3b\xac\xcc\x77\xca\
+\x0a\x92\xa8\xd7\xe2\x54\xc5\xa0\x47\x0d\x96\xeb\xac\x53\xa2\xe4\
+\x29\x35\x24\x4f\x0f\x7a\xaa\xec\x26\x09\x53\x65\x9b\x98\x50\xfd\
+\x12\xfe\xd2\xdf\x0c\xb2\x5d\xaa\x93\xa5\x2f\xa8\x31\x59\xba\x89\
+\x71\xd5\xd3\x61\x01\xdf\xc8\x9f\x2e\x3f\xa9\x3a\x5d\xfe\x54\x4a\
+\x2e\x6b\x75\x2e\x98\x98\xc5\x27\xd2\x1e\xa0\xd6\x0b\xb6\x7d\xa7\
+\x82\x89\x29\x09\x0b\x26\x9a\x18\xc2\xfb\xba\x97\xcc\x7c\x8e\xe7\
+\x6b\x94\xb9\xcd\x80\x94\xcc\xb4\x62\xab\xb2\xc5\x18\x5f\xe7\xf0\
+\x19\x5e\xb7\xbc\xa2\xa9\x83\x16\x2f\x9a\x3a\x61\x19\x46\x4e\x13\
+\x75\x94\xcd\xbd\x8d\x8f\x2c\xad\x6c\x6e\x46\x78\x29\xdd\xca\xe6\
+\xb6\xe0\x71\x8b\x9b\xad\x57\x84\xb2\xb9\x2f\xf5\xa9\x6c\xae\x15\
+\xab\x85\x63\xe6\xb4\xee\x5f\xab\x8e\xab\xd6\xc2\xc9\xba\x31\x2c\
+\x78\x5b\xa6\x84\xaf\x5b\x97\xd2\x73\xc5\x98\xb5\x97\xce\xa6\x2e\
+\x9e\xde\xe1\x5e\xf1\xf4\x33\x7a\x2f\x9e\xfe\x55\x28\x9e\xfe\x49\
+\xa2\xe2\xe9\x9c\xab\xe6\x88\x30\xbf\x37\xeb\x5e\x3e\x7f\x51\x48\
+\x65\xc9\x52\x3e\xff\x1f\x45\xc4\x8e\x5e\x54\x3f\x19\x95\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xfa\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x18\x00\x00\x0b\x18\
+\x01\x89\xa9\xb5\x10\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x04\x87\x49\x44\
+\x41\x54\x78\x9c\xed\xdb\x5b\x88\x55\x55\x18\x07\xf0\xdf\x38\x69\
+\x4d\x8a\x65\x11\x82\x11\x76\x2f\xa3\x24\x89\xe8\x02\x12\x15\x65\
+\x51\x50\x69\x65\xf7\x7a\xb0\x8c\x1e\x82\xc0\xb0\x1e\x7a\x0c\xc5\
+\x7a\xa9\x88\x28\x22\xb0\xa2\xb2\xa2\x0b\x64\x58\x29\xdd\xf0\x41\
+\x28\xe9\x42\x46\x8a\x31\x84\x14\x8a\xa4\x0e\x65\x3a\x63\x4e\x0f\
+\x6b\x0e\x67\xed\xe3\x9c\xe3\x3e\x67\xdf\xce\xd0\xfc\x61\x73\xf6\
+\x3e\x67\x9d\xef\xfb\xef\xff\x5e\xfb\x5b\x6b\x7d\x6b\x2d\xda\xc3\
+\x95\x78\x17\xbb\x31\x5c\xd2\xf1\x0f\xee\x6c\x93\x67\xee\x98\x86\
+\xf7\x94\x77\xd3\x8d\xc7\x10\x16\x14\x71\x63\x3d\x29\xca\x1c\x8f\
+\x2f\x70\x6e\xc3\xf7\xc3\xd8\x9f\x37\xa1\x08\xbd\x98\x18\x5d\x0f\
+\xe2\x26\x7c\x5c\xa0\xcf\x51\xb1\x46\xf2\x69\xac\x11\x5e\x85\xbe\
+\x82\xfd\x2e\x76\x68\x4d\xd8\x8b\xcb\x0b\xf6\x9b\xc0\x82\x06\x02\
+\x4f\x94\xe8\x7b\x34\x01\x86\x31\x80\x8b\xcb\x22\xf1\x65\xe4\xf8\
+\x9d\xb2\x9c\x8e\x20\x16\x60\x93\x64\xe0\xfd\x13\x73\x8a\x26\x30\
+\x15\x07\x22\xa7\xb3\x8b\x76\xd8\x80\x58\x80\xf7\x31\x17\x7f\x45\
+\xdf\xed\xc0\xac\xac\x4e\x26\xb4\xf8\xed\x0c\x21\x10\xc1\x4e\xfc\
+\x90\xd5\x59\x46\x7c\x8d\xf9\xea\x81\xf7\x04\x7c\x86\xd3\xb2\x18\
+\x6d\x25\xc0\x94\xe8\x7c\x67\x16\x27\x39\xe2\x53\x2c\x14\x9a\x45\
+\x38\x11\x6b\x71\x52\xa7\x06\x5b\x09\x10\x63\xb8\x53\x07\x05\xe0\
+\x43\xdc\x8b\x7f\x47\xae\x4f\x16\x6a\xc2\xf4\x4e\x8c\xa5\x15\xa0\
+\xdb\xf0\x26\x1e\x54\x7f\x30\x67\x09\xb5\xe3\xb8\x76\x0d\x8d\x55\
+\x01\xe0\x65\x3c\xa2\x2e\xc2\x6c\xa1\x8f\x32\xb5\x1d\x23\x63\x45\
+\x80\x66\x3d\xd6\x67\x24\xfb\x26\x17\xe2\x23\x1c\x9d\xd6\x70\x37\
+\x0b\x30\x10\x9d\xcf\x68\x51\xee\x49\x2c\x8f\xae\xe7\x0a\xcd\xe6\
+\x91\x59\x09\x5c\x26\xd9\x11\x29\x1b\xb3\x22\xff\x07\x1c\x3a\x16\
+\x69\xc4\x73\x92\x3d\xc6\x0f\x70\x44\x16\x02\x55\x0b\x00\xdf\x46\
+\x1c\x7e\xc1\x99\x2d\xca\xf6\xe0\x15\x49\x11\xde\x70\x98\x5a\x9e\
+\x49\xa1\x12\xb0\x44\x68\xe7\x27\x08\x37\xff\x23\xd6\xa1\x1f\x07\
+\x47\x29\xbf\x5f\xc8\x1f\xd4\x06\x6a\xb7\x0b\x03\xa8\x45\x9d\x38\
+\xef\x86\x1a\x00\x0f\x0b\x6d\x7e\x96\x7c\xc2\xfc\x66\xc6\xbb\x39\
+\x08\xd6\xf0\x2c\xae\xc3\xe6\x0c\x36\x4e\x6d\xf6\x43\xb7\xbf\x02\
+\x35\xac\xc1\xd9\xb8\x54\x68\xea\x8e\x75\xf8\x64\xce\x8d\x52\x0c\
+\xe0\xc6\x8a\x00\x84\xaa\xbc\x7e\xe4\x48\x83\x53\xa4\x10\xa0\xca\
+\x57\x60\x32\x56\x09\x41\xad\x69\x15\x2d\x1a\x55\x0a\x70\x07\x6e\
+\xc5\x15\x78\xac\x2a\x12\x55\x0a\x10\x0f\xb7\x27\x57\x45\x62\x2c\
+\xb4\x02\x85\x62\x5c\x80\xaa\x09\x54\x8d\x71\x01\xaa\x26\x50\x35\
+\xc6\x05\xa8\x9a\x40\xd5\x18\x17\xa0\x20\xbb\x7d\x78\x11\x2b\x75\
+\x98\xae\x1e\xc1\x44\x3c\x2d\x4c\xcb\x65\x9a\x00\x69\x86\xa2\x06\
+\x43\xf7\xe0\x81\x91\xf3\x39\x42\x6e\x61\x57\x9b\x36\x26\xe0\x35\
+\x61\x22\x04\xfe\xc6\x7d\x79\x90\x6b\x74\x52\x04\xb6\xaa\xa7\xab\
+\xcf\xc3\x6a\xed\x77\x77\x5f\x50\xbf\x79\xd8\x92\x03\xaf\x43\x50\
+\x94\x00\x6b\xb1\x34\xba\xbe\x44\x58\x61\x32\x29\xe5\xff\x97\xab\
+\xd7\x20\x78\x1b\xcb\xf2\xa1\x96\x44\x91\x41\xf0\x29\xc9\x74\xf5\
+\xd5\x78\x3d\x85\xcf\xa5\x92\xe2\x7d\x82\xbb\x8d\x9e\x03\xcc\x8c\
+\xa2\x5b\x81\xc7\x85\x60\x58\xc3\x2d\x0d\xd7\x8d\x58\x2c\xf9\xa4\
+\xd7\x0b\xf9\xbc\xc1\xfc\xa9\x05\x94\x91\x11\x7a\x48\x48\x61\xd5\
+\xde\xe7\x45\x42\x40\xfc\xa3\xa1\xdc\x42\x3c\xaf\x9e\xea\xfa\x1e\
+\xd7\x0b\x59\xdd\x4a\x90\x67\x56\x78\xa2\xb0\xb8\x29\xce\xd4\xfe\
+\x14\x9d\x6f\x11\x52\xda\xb5\xeb\xcd\xb2\x35\x9f\xf0\x6a\x64\x6f\
+\x49\xb3\x42\x65\x75\x84\x86\x70\xb3\x64\x3e\xef\x9c\xe8\xfc\x74\
+\xf5\x00\xb9\x4d\x88\x17\xdb\xcb\x20\x56\x66\x4f\x70\xaf\x50\xa5\
+\xbf\x6b\x51\x66\xa7\x70\xf3\xfd\x65\x10\xa2\xfc\xae\xf0\x6e\x5c\
+\x63\xf4\x36\x7d\x00\xd7\xe2\xe7\x32\x09\x55\x31\x16\xd8\x2e\x3c\
+\xe5\x6d\xd1\x77\xfb\x84\x3c\xfe\x37\x65\x93\xa9\x6a\x30\xd4\x8f\
+\x79\x23\x9f\x7b\x84\xe6\xf1\xf3\x2a\x88\x54\x39\x31\xb2\x49\x18\
+\xe0\xf4\xaa\x2f\x7a\x2a\x1d\x55\xcf\x0c\x1d\x54\x50\x0f\x2f\x2d\
+\xc6\xf3\x01\x55\x13\xa8\x1a\xff\x7b\x01\xf2\x8c\x01\xcb\x70\x9b\
+\xe2\x45\x1d\x16\x96\xce\xdc\x25\xac\x06\xc9\x84\xbc\x04\x98\xa9\
+\xdc\x09\xce\x99\xb8\x01\x6f\x65\x35\x94\xd7\xd3\xfa\x5d\xb9\x8b\
+\xa9\x77\x61\x43\x1e\x86\xf2\xaa\x01\x43\xb8\x48\x18\xe0\x94\x11\
+\x57\x7e\x15\xf6\x0c\x64\x46\x9e\x31\x60\x1f\x36\xe6\x68\xaf\x14\
+\xb4\x7a\x5a\xf1\x0a\xf1\xde\xa6\xa5\xba\x17\x31\xe7\xa6\x9d\xad\
+\x56\x02\xc4\x55\x6c\x86\xb1\x27\x42\xbc\x87\xa0\xa3\xd7\x65\x92\
+\x90\x8b\xaf\x65\x55\xe6\xe5\x40\xaa\x2c\x4c\x17\xf2\x88\x35\xee\
+\x1d\xef\x2f\x5a\x15\x19\xd9\x88\xa3\xf2\x60\x57\x02\x56\xaa\xf3\
+\xde\x2a\xdd\xfe\xc8\x51\x71\x81\xe4\x2a\xcd\xd5\x38\x26\x07\x82\
+\x45\xa1\x17\x2b\x24\x73\x8f\xf7\xb7\xfa\x43\x1a\x65\x56\xe0\xd1\
+\xe8\x7a\x07\x5e\x12\xf2\x7b\xbb\x74\xc7\x76\x9a\x29\x38\x5f\xc8\
+\x38\xc7\x3b\xc9\xd6\x09\xc9\x97\x4c\x23\xce\xda\x1c\x5d\xd9\xfb\
+\x85\xb3\x1e\x1b\x84\x74\x7c\x2e\xe8\x11\x16\x2d\xef\xe9\x82\x1b\
+\x3b\xdc\x31\x28\xec\x24\x49\xb5\xb5\xb7\xdd\xe0\x30\x4d\xd8\xca\
+\x7e\x95\x90\xca\xee\xeb\xc0\x46\x11\x18\xc4\x6f\xf8\x4a\xa8\xad\
+\xfd\x69\xff\xf8\x1f\xd0\x9c\x97\x05\x8c\x1f\x79\xbb\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x8f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x03\x41\x49\x44\x41\x54\x78\x9c\xed\
+\x9b\xbd\x4e\x1b\x41\x14\x85\x3f\x48\x84\x05\x14\xf0\x18\x06\x09\
+\x24\xaa\x24\x75\x6a\x9c\x97\xa1\x4a\x48\x4c\xa2\xd4\x80\x0c\xc4\
+\x05\x2f\x92\x22\x15\x0f\x81\x45\x95\xbf\x32\x29\x52\x62\x09\x30\
+\xc5\xee\x4a\xce\xec\x30\xbe\xf7\xce\xfe\x81\xf7\x48\x53\xd8\xbe\
+\x73\xef\x39\x47\xeb\xd9\xb1\xe7\x2e\xb4\x68\xd1\xa2\x45\x18\x3b\
+\xc0\x10\xb8\x02\xc6\xc0\x35\x30\x02\x4e\x81\xed\x1a\x79\x65\xd8\
+\x26\xe1\x32\x22\xe1\x36\x26\xe1\x3a\x24\xe1\x6e\xc6\x32\x70\x0e\
+\xdc\x01\x93\x07\xc6\x2d\x70\x06\x74\x62\x0a\x19\xd1\x49\x6b\xdf\
+\x06\xf8\xdd\x91\x68\x58\xd6\x26\x5f\x06\x2e\x02\x89\xdd\xf1\x8d\
+\x6a\x4d\xe8\xa4\x35\xa5\xfc\x2e\x50\x9a\x70\xae\x48\x9e\x8d\x93\
+\x38\x4d\x2a\x9c\x18\xf8\x9d\x4b\x93\xef\x90\xbf\xec\x2f\x81\x1e\
+\xb0\x92\x8e\xdd\xf4\xbd\xe9\x98\x1b\x60\x33\x56\x99\x00\x9b\x69\
+\x2d\x1f\xbf\xd5\x74\xf4\x3c\xfc\xee\x10\xae\x09\x43\x4f\xf2\x35\
+\x4f\xdc\x9a\xa7\xc8\xa1\x4d\x93\x0a\x47\x11\xfc\x86\x92\x02\x57\
+\xce\xa4\xdd\x40\x6c\x0f\xff\xe5\x56\xe5\xe8\x29\xf8\x5d\x49\x0c\
+\x18\x3b\x93\x56\x03\xb1\xab\x0d\x30\x40\xc3\x6f\xec\x06\x2c\x7a\
+\x26\x4d\x02\x09\x1f\x3b\x72\xda\x7c\x06\x7c\x77\x5e\xbf\x0e\x24\
+\x0c\x7d\x56\x15\x34\xfc\x5c\x6d\x5e\x9c\x92\x5f\x64\xd6\x3d\x71\
+\x75\x2d\x82\x87\x1e\x7e\xd2\x45\xf0\x54\x52\x60\x9b\xfc\xee\x6a\
+\xc4\xec\xdb\xcc\x0d\xd0\xb5\x69\x52\xa1\x8b\xed\x36\x78\x0b\x6c\
+\x49\x8b\x9c\x39\x93\x25\xe3\x28\x56\x99\x02\xee\xad\x50\x32\xce\
+\x34\x05\xb4\x5b\xcd\xaf\xc0\x52\x9c\x26\x15\x96\xd2\x9a\x52\x7e\
+\xa6\xad\x7a\x07\x18\x90\xbf\xdc\xdc\xcb\xfe\x88\x6a\xc5\x67\x58\
+\x4a\x6b\xcf\xe2\x37\x20\xf2\x77\xca\x06\xf9\x85\x27\x5b\xf0\x36\
+\x62\x12\x17\x84\x2e\x0f\xf3\x9b\xb9\x35\x5f\x50\x14\x72\xef\xa1\
+\x9a\xb9\x55\xc0\xc4\xcf\xb7\x0f\x98\x2b\xb4\x06\xd4\x4d\xa0\x6e\
+\x54\x65\x40\x3f\x1d\x9a\xf8\x83\x72\xa8\xd8\xe1\xae\xb2\x52\xf4\
+\xa7\xe6\xbc\x17\xc4\x7f\x9c\x8a\x3f\xa8\x80\x5f\xa9\x05\xa6\xc5\
+\x4f\x48\xfe\x95\xd9\x0b\xc4\xbf\xf3\xd4\x39\x28\x91\x9f\x0a\xda\
+\x02\xae\xf8\x09\xf0\x0f\x78\x19\x98\xf3\x22\x8d\xb1\x98\xd0\x28\
+\x03\x2c\xe2\x33\x58\x4d\x68\x8c\x01\x31\xe2\x33\x58\x4c\x68\x84\
+\x01\x45\x88\xcf\xa0\x35\xa1\x76\x03\x8a\x14\x9f\x41\x63\x82\xc9\
+\x80\x22\xf7\x01\xa5\xb8\xde\x80\x5a\xff\x15\x9d\xe5\xf0\x07\x4f\
+\x5c\xd1\x5f\x81\x7e\x04\xbf\x28\x48\x0b\x14\x61\x82\x56\xbc\x86\
+\x9f\x19\x9a\x02\x31\x26\x58\xc4\x6b\xf9\x99\xa0\x2d\x60\x31\xc1\
+\x2a\xde\xc2\x4f\x0d\x4b\x01\x9f\x09\xfb\x81\xf8\x3d\xf2\x07\xb3\
+\x12\xf1\x56\x7e\x2a\x58\x0b\x4c\x9b\xf0\x49\x10\xbf\x8f\x5e\xbc\
+\x99\xdf\x73\x45\x01\x2b\x32\xd1\x8b\xc8\xf6\xf4\x9f\xd3\xd8\x05\
+\x92\x5f\x86\xa5\xa2\xfd\x4f\xb0\x04\x22\x8f\x0a\xad\x01\x75\x13\
+\xa8\x1b\xcf\x04\x31\x9b\xc0\x5b\xf2\xf7\xef\x35\xe0\x17\xf0\xb7\
+\x68\x52\x4a\x74\x49\xf8\xbd\x72\xde\x5f\x07\x7e\x03\x7f\xac\x89\
+\xa5\x47\x63\xc7\x34\xfb\x68\xec\x04\xe3\xb9\xe0\x5c\x1f\x8e\x7e\
+\x51\x24\xcf\x46\x95\xc7\xe3\xc7\x06\x7e\xe2\xe3\x71\x5f\x83\xc4\
+\x25\x49\xb7\xd8\x0a\xf5\x37\x48\x6c\xe0\x6f\x90\x98\xc5\x4f\xdc\
+\x20\xe1\x36\x47\x34\xad\x4f\xb0\xf4\x16\x99\x91\x33\xa9\xe9\x7d\
+\x82\x1a\x7e\x23\x89\x01\x4f\xb9\x4f\xf0\xda\x0d\x98\xfb\x8d\x90\
+\xcf\x80\x1f\xce\xeb\xa7\xd4\x27\xf8\x53\x92\x50\xda\x2c\xbd\x4e\
+\x7e\xbd\x68\x52\xb3\xb4\x8f\x9f\xa8\x59\x3a\xd4\x2e\x9f\xf5\xe1\
+\xbd\xf1\x24\xbf\xa1\x9a\x9e\x21\x49\xbb\xbc\x8f\x9f\xb8\x5d\x1e\
+\x6c\x0f\x4c\x0c\x62\x95\x29\x30\x30\xf0\x13\x3f\x30\x01\xed\x23\
+\x33\xc0\x9c\x3f\x34\x35\x8d\xd0\x63\x73\xe2\xde\xdb\x12\xb1\x45\
+\x49\x8f\xcd\xb5\x68\xd1\xe2\xe9\xe3\x1e\x38\x45\x6f\xc4\x73\x08\
+\x2b\xff\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\xd8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x03\x8a\x49\x44\x41\x54\x78\x9c\xed\
+\x9b\x4f\x48\x54\x41\x1c\xc7\x3f\xd6\x0a\x0a\x29\x51\x9a\xa7\xbc\
+\x04\x05\x0a\x41\x76\xea\x12\x88\x91\x51\x58\x10\x54\xd7\x8c\x84\
+\x3a\xd8\x9f\x9b\x76\xab\x93\xd7\x3a\xdb\x7a\xa9\x6b\xa7\x0a\xb2\
+\xbf\x74\xe9\x92\x05\x9d\x5c\x4a\xcb\xa8\x43\x7f\x0c\xed\xe2\xc2\
+\x9a\x76\x98\x27\xac\xbb\x33\x6f\xa6\xf6\x37\xf3\xde\xba\xfb\x81\
+\xb9\xbc\x9d\x9d\xdf\xf7\xfb\xdb\xb7\x6f\xfe\xbc\x19\xa8\x53\xa7\
+\x4e\x2d\xd3\x10\x38\x5e\x2b\xb0\x0b\xe8\x04\xb6\x01\xcd\xd1\xf5\
+\x25\xe0\x17\xf0\x05\x78\x0f\xfc\x0e\xac\xcb\x1b\x3b\x80\xb3\xc0\
+\x1d\x60\x06\xf8\x03\xac\x5a\xca\x0a\xf0\x11\xb8\x0b\x9c\x03\x3a\
+\x42\x8b\xae\x94\x0c\x70\x1a\x98\x04\x0a\xd8\x0d\xdb\xca\x32\xf0\
+\x18\x38\x13\xb5\x9d\x5a\x1a\x81\x0b\xc0\x1c\x95\x9b\x36\x95\x39\
+\xe0\x62\x14\x2b\x55\xf4\x03\xd3\xf8\x33\x5e\x5a\x72\xc0\x91\x20\
+\xce\x2c\xb4\x00\x59\xd4\xff\x36\x94\xf9\xe2\x67\xc5\x44\xa4\x21\
+\x11\xba\x50\xbf\x44\x68\xe3\xba\xbb\xa1\xdb\xb3\xd7\x32\x0e\x01\
+\x0b\x15\x0a\x97\x2c\x0b\x91\xa6\x20\x0c\x00\x79\xcf\x86\xfe\xa7\
+\xe4\x81\xe3\x1e\x7d\x03\x2a\xcb\x52\xe6\x17\x81\x17\x51\x59\x14\
+\x6a\x33\x8f\xc7\x3b\xa1\x1b\x99\xdb\xbe\x00\x8c\x02\x4d\x45\x6d\
+\x37\x45\xd7\x24\xc6\x0d\x0b\xa8\xe7\x93\x28\x2d\xc8\x3d\xf0\x86\
+\x62\xe2\x0c\x09\xc5\xc8\x21\xdc\x3b\x4c\x08\x09\x7b\xed\x10\x6b\
+\x4a\x28\xd6\x44\x45\x8e\x8b\xe8\x47\xae\x9f\xbf\xee\x10\xef\x86\
+\x50\xac\x95\x48\x7b\x2c\x9b\x2c\x9f\x37\x02\xb7\x90\x9b\x35\xfe\
+\x74\xa8\xf3\x43\x28\x56\x03\x70\x13\xcb\xb0\xd9\x96\x80\xf3\xc0\
+\x6e\x21\x41\x49\xb0\x07\xe5\xc1\x48\x5c\x02\x32\xc0\x88\xa8\x9c\
+\x64\x18\x21\x66\x16\x19\x97\x80\x93\xa8\x85\x8b\x6a\xa7\x13\xe5\
+\x45\x4b\x5c\x02\xe2\xba\xab\x6a\xc3\xf8\x37\x30\x25\xa0\x03\xe8\
+\xf5\xa3\x25\x11\x7a\x31\xac\x2c\x99\x12\x70\x14\xd8\xec\x4d\x4e\
+\x78\x32\x28\x4f\x65\x98\x12\x10\x6c\x66\x15\x90\x3e\xdd\x45\x53\
+\x02\x0e\x78\x14\x92\x14\x5a\x4f\xba\x01\x4e\x2b\x6a\x42\xe1\x3a\
+\xf8\x99\x02\x1e\xa0\x06\x39\xab\x96\xba\x2f\x81\x77\x96\x3a\x7b\
+\x81\x83\x96\x3a\x0d\x40\x1b\x70\x0c\xd8\xef\xa0\x11\x94\xb6\xad\
+\x38\x2c\xb9\xf7\xe0\x36\xd4\x2c\x90\x8e\x9e\x62\x08\xf7\x59\x64\
+\x8f\x4b\x83\x27\x1c\x1b\x1b\x15\x34\x51\x29\xa3\xb8\x69\x76\x5a\
+\x30\x19\x74\x68\x68\x91\xf5\xf3\xf9\xa4\x69\xc2\x6d\x51\x65\xb0\
+\xf4\x8b\xba\x87\x60\xb3\xe6\x5a\x29\x6f\x51\xab\x2f\x69\x21\x8f\
+\xd2\x64\xa3\xcc\x9b\x6d\x32\xb4\xe1\xd1\x25\x60\xc9\xe1\x7b\xfb\
+\x70\xbb\x53\x42\xd1\x8c\xd2\x64\xa3\xcc\x9b\x2e\x01\xf3\x0e\x0d\
+\xb5\x02\x57\x1c\xea\x85\xe2\x2a\x4a\x93\x0d\x17\x6f\xb5\xd5\x0d\
+\x4a\x0c\x84\xde\x00\xf7\x09\x3f\x10\x6a\x47\x0d\x84\x9c\xfa\x76\
+\xfe\x61\x20\x04\x30\x8b\xcc\xba\x5c\x69\x19\x76\x88\x3d\xec\x29\
+\xf6\x8c\x2e\x98\xa9\x17\x78\xe5\x20\xb4\xda\xd0\x7a\x32\x25\xe0\
+\x89\x47\x21\x49\xf1\x54\x77\xd1\x94\x80\x87\xa8\xed\x2c\x1b\x85\
+\x65\xd4\x84\xad\x0c\x53\x02\xbe\x01\xcf\xbc\xc9\x09\xcf\x73\xe0\
+\xbb\xee\x83\xb8\x91\xe0\xb8\x1f\x2d\x89\x60\xf4\x12\x97\x80\x7b\
+\xc0\x67\x79\x2d\xc1\x99\x43\x79\xd1\x12\x97\x80\x65\x60\x4c\x5c\
+\x4e\x78\xc6\x50\x5e\xb4\xd8\x26\x43\xe3\xa8\x37\xad\xd5\x4a\x0e\
+\xb8\x1d\x57\xc1\x96\x80\x02\x70\x19\xfb\x08\xcf\x95\x36\x87\x3a\
+\xed\x42\xb1\x56\x81\x4b\x28\x0f\x15\x93\x45\x66\x34\x16\xf2\xf5\
+\x78\xb6\x22\xc7\x25\x54\xdb\x06\x89\x69\x3c\x6c\x9f\xeb\x42\x6e\
+\x8b\xcc\x35\xd6\xaf\x27\xa4\x7e\x8b\xcc\x1a\xd5\xb0\x49\x4a\xfb\
+\x02\x44\x92\x01\xd4\xca\x8a\x84\x60\xc9\x92\x8f\xb4\x05\xa1\x8f\
+\x1a\xde\x28\xb9\x46\x17\x61\x37\x48\x9b\x4a\x0e\x8f\xff\x79\x1b\
+\x5b\xa8\xe1\xcd\xd2\xc5\x1c\x26\xfc\x76\x79\xeb\x0e\xb0\xd0\xac\
+\x1d\x98\xf8\x84\x3f\xe3\xa9\x3d\x30\x51\x4c\x06\x38\x05\x3c\x42\
+\xee\xc8\xcc\x24\xea\x18\x4e\xaa\x8f\xcc\xe8\x28\x3e\x34\xf5\x01\
+\xf7\x43\x53\xb3\xa8\x43\x53\x83\x78\x3e\x34\x95\xd4\xb1\xb9\x9d\
+\xc0\x76\xd6\x1f\x9b\x9b\x07\xbe\xb2\xc1\x8e\xcd\xd5\xa9\x53\x27\
+\xdd\xfc\x05\xbd\xc4\xd9\xfa\x85\xb0\x8a\x25\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\x38\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x05\xea\x49\x44\x41\x54\x78\x9c\xdd\
+\x9b\x5f\x88\x15\x55\x1c\xc7\x3f\xbf\x63\xae\x0a\xea\x6e\xa6\x92\
+\x46\xbb\x85\x0a\x26\xba\x65\x49\x45\x41\x0f\x45\x1a\x05\x61\xf6\
+\x47\xb3\x97\x7a\x90\x7a\xca\x1e\x12\x49\xa9\xa7\x02\x23\x28\xe8\
+\xa1\x20\x4b\x7d\x30\xff\x44\xd8\x7f\x13\x17\x53\x43\x28\x41\x2d\
+\x7d\xb0\xb2\x42\x70\xb3\x4d\x96\x4d\x50\x73\x57\x77\x77\x4e\x0f\
+\x67\xae\x7b\x66\xee\xcc\xdc\x99\x3b\x67\xe6\xee\xfa\x85\x0b\x73\
+\xef\x7c\x7f\x7f\xe6\x77\xce\x9c\xf3\x3b\xbf\x73\x2e\xb8\x43\x0b\
+\xa8\x6d\x0e\xf5\xc5\x40\x6d\x05\xae\x2d\xde\x4e\x76\xcc\x13\x94\
+\x07\xdc\x51\xa0\x8d\xdb\x7d\x1b\xf3\x0a\xb4\x51\x37\x5a\x05\xa5\
+\x41\x3e\x2b\xce\x84\xec\x30\x36\x68\x2b\xce\x46\xfd\x18\x05\xd2\
+\x27\xc8\x20\xd0\x5e\x80\xfe\x79\x46\xb7\xf4\x19\x5b\xc3\x12\x72\
+\xc4\xb4\x90\xda\xee\x5e\xb7\xda\xe6\xf7\xb0\x9f\xdc\xeb\x76\x06\
+\xf5\x81\xef\xe4\x00\x30\xdb\xa1\xe2\xd9\x20\x03\x7e\x70\xd7\x3b\
+\xd4\x8b\x72\xa9\x0c\xbc\x1f\x00\x04\x19\x05\x6a\x8d\x3b\xbd\xea\
+\x15\xa3\x73\xc8\xc6\x70\xc5\x4c\x41\x69\xbf\x17\xf4\x03\x33\x1c\
+\xe8\x9c\x01\xd2\x3f\xa4\x97\x59\x0e\x74\x16\x09\x39\x35\xe4\xac\
+\xfa\x30\xbf\x3e\xb5\xde\x0a\x6a\x67\x7e\x7d\x85\x43\x6d\xb4\x1c\
+\xbe\x04\xb4\xe6\x50\xd6\x0a\x72\xc9\x0a\xe8\x26\x47\x4e\x5e\x81\
+\xe3\x31\x00\xc0\xeb\xa8\x5c\x09\xd2\x04\x6a\x75\xfd\xba\xd4\x6a\
+\xa3\xe3\x8a\xee\xdd\x79\x3c\x2b\x0b\xd7\x89\x3f\x62\xfb\xbd\xa0\
+\x17\x98\x5e\x87\x9e\xe9\x20\xbd\x15\x3d\x62\x66\x96\xc9\x8e\x7d\
+\x2d\x0a\x72\x60\xc8\x71\xa5\x41\xbd\x93\x5d\x87\x7a\x3b\xa8\x43\
+\x0e\xb8\xf7\xb3\x38\xac\x0a\x39\xff\x1f\x30\x35\x83\xfc\x54\x90\
+\x0b\x41\x1d\xac\x2a\xc8\xd7\x42\x30\x43\x50\x5e\xa8\x17\xac\x4b\
+\x2f\xae\xd6\xd9\xb2\xfe\x02\xc8\xc5\x94\x5a\x26\xe4\x70\xa8\x17\
+\x9c\x03\x26\xa5\x10\x9c\x04\x72\x2e\x24\x7b\xa4\x28\x2f\x0b\x98\
+\x05\x2a\xd0\x81\xf5\x80\x20\x13\x40\xbd\x54\x5b\x4e\xad\x34\xdc\
+\x78\x5d\x23\x05\x6d\x82\x0c\x86\x5a\xf2\x2c\xd0\x9c\x20\xd3\x0c\
+\x72\x36\xd8\xfd\x65\x90\x61\xba\xfc\x4d\x01\xd9\x1f\x7a\x97\x35\
+\xb0\x36\x41\x60\x6d\x35\x5f\xf6\x97\xe5\x6d\x11\x58\x11\xf1\x40\
+\xdd\xc0\xf8\x08\xee\x78\x90\xee\x88\x80\xad\x28\xd9\x67\xa7\x68\
+\x09\x26\x33\x89\x53\xda\xcb\x11\xc1\xea\x65\x98\xd6\xff\x32\xc0\
+\x14\x32\x42\x0f\xf6\x0f\x30\xce\x22\x8d\x03\xe9\xaa\xe6\x95\x51\
+\x64\x2d\x1e\x8b\xc2\x0f\xe6\xf7\x82\x95\x16\xe7\xc5\x18\xce\x43\
+\x0d\xf2\xd9\x29\x14\x48\x67\x44\x2f\xf8\x0b\x18\x63\x3e\x91\xf7\
+\x3b\x29\xa1\xf6\x57\x46\x71\x51\x83\x9a\x24\x70\x9f\xfd\xa3\x20\
+\x13\x41\x9f\x06\xe6\x0b\x6a\x79\xb5\x98\xbc\x0b\x7a\x4f\x09\xfe\
+\x95\x82\x9b\xc2\x39\x81\xdf\xca\x27\x41\x4e\x56\x77\x7f\x19\x04\
+\x6e\x6e\xb4\xd3\x8e\x21\xbb\xa3\xde\xf3\xe8\x77\x5f\x46\xc4\xba\
+\x3f\x2b\x1e\x4f\x1f\x00\x9e\x68\xb4\xb3\x45\x60\x74\xd4\x54\x17\
+\xd1\xfa\x5d\x86\x5b\x0e\x0a\x5c\x0c\x55\xa1\x1f\xe4\xa3\xa8\x1b\
+\x3a\xf0\x4d\x36\x18\xee\xd5\x89\x56\xac\x72\x59\x44\xeb\x0f\x30\
+\x72\x17\x3e\x69\x21\x5f\x24\x04\xe0\xcb\xb2\xbd\x29\xf3\x15\xf0\
+\xa1\x77\x26\xdc\xfb\xa6\x3c\x3f\x1a\x06\xd9\x97\xd0\x03\xf6\x35\
+\xda\xbb\xa2\xd1\x1e\xae\x15\x46\xd4\xfe\x8a\xd8\x5a\x8f\x45\xc9\
+\xaf\x80\x7a\x1e\x90\x04\x82\xf8\x9c\xab\x12\x4d\x20\x3d\xa1\xe5\
+\x6e\xd4\x6b\xd0\x63\xb8\xe5\xa0\xcc\x1e\xb0\x48\x90\x50\x55\x58\
+\x1f\xd5\xe8\xa3\xf6\x2f\x3e\x67\x51\x89\x7e\x95\x05\xb5\x39\xd4\
+\xd2\x67\x30\x73\x7e\x1b\xc8\x99\x50\xcf\xd8\xdc\x68\x6f\x5d\xa3\
+\x19\xe4\x7c\x28\xe1\xb9\xdf\xba\xff\x00\xc1\xfd\xc4\xf3\xc0\xc4\
+\x06\xf9\x5a\x04\x82\x3b\x3d\xa0\x5e\x8f\xe0\xbc\x11\xe2\x64\xd8\
+\x49\x1a\xde\x58\x16\x6a\xdd\x5f\x88\x1e\xe4\x9a\x40\x7e\x0d\xf5\
+\x92\xa5\x25\xfb\xea\x1c\x2b\xc3\xb9\x3f\xf0\x58\x02\x7f\x49\x68\
+\x9c\xe8\x27\x58\x3b\x1c\x31\x68\x49\xa8\x06\x27\xcd\x3c\xa3\xc2\
+\x03\xa2\x55\x1d\x6e\x29\xc9\xf7\xdc\x78\x38\xaa\xc8\xe9\x07\xe0\
+\xab\xda\xe2\xf2\x75\x8c\x6c\x27\xf0\x48\xe1\xde\xe7\xc0\x14\x7f\
+\xaa\x8b\x4d\x75\x41\xbd\x57\x5b\x8d\x7a\x3f\x39\x55\x56\x1f\x1b\
+\x5b\x6e\xe0\x2a\x11\x7a\x1a\xe4\xb8\xc0\x33\x24\xa7\xba\x67\x53\
+\xe8\x4a\xe2\x88\xc0\x72\x90\xe3\xc6\x66\x7e\xe4\x0d\xc0\x14\x50\
+\xdb\x05\xb5\x45\x90\x34\xe7\x77\x2e\xba\xe0\x08\x32\x59\x50\x5b\
+\xfc\x23\xb9\xb9\x7a\x43\x9e\x00\xcc\x31\x87\x20\x78\xca\xfa\x4d\
+\x03\x83\xf1\x22\x5e\x5f\x6d\xb5\x89\x9c\x01\xc0\xab\x7c\x31\xb6\
+\xe5\xb0\xf1\xa5\x3e\xd4\x1b\x80\xe9\x20\x1d\x82\xdc\x08\xa0\xd1\
+\xc7\x34\xde\x12\x8d\x37\x41\xe3\x8d\xd1\x78\xf7\x68\xf4\xbe\x08\
+\xb9\xcb\x29\x74\x57\x71\x34\x7a\xaf\xc6\xbb\xdb\xd7\x3d\x41\xe3\
+\x2d\xd6\xe8\x63\x00\xc6\x07\xe9\xa0\xbe\x93\x68\xf5\x42\x76\x59\
+\x03\xdb\x76\xcc\x16\x57\x18\xd7\xd8\x3c\x3f\x07\x48\xb3\xd4\x7d\
+\x21\x34\xfa\x7f\x6b\x74\x55\xa1\xc9\x7f\xfd\x2a\xbc\x5d\x79\x9e\
+\x28\x0b\x16\x5a\x46\x0f\x92\x5c\xc2\x6e\x03\xb9\x6c\x05\xe0\xd9\
+\x14\xfa\x9f\xb3\xf4\x5f\x26\xf9\xa4\xe9\x68\x90\x83\x96\xfe\x32\
+\x56\x91\x57\x8a\x9a\x1e\xb0\x20\x05\xbf\xc3\x72\x30\x4d\x6a\xbb\
+\xcc\x0a\x40\x9a\x1d\xa2\x05\x95\xa9\xb7\x9e\xa2\x6a\xd6\x31\x60\
+\x2c\xb0\x10\x40\xa3\x0f\x02\x87\x6a\x8b\xc8\xcf\xd6\x97\xf3\x29\
+\x6c\x58\x9c\x80\x6c\x1c\x0e\x69\xf4\x8f\xfe\xf5\x83\xbe\x8f\xa9\
+\x91\x35\x00\x73\x05\xf1\x0d\xa4\xde\xbf\xeb\xb5\xae\x7b\x52\xf0\
+\x6d\x4e\x6f\x2c\x2b\x00\xe3\x8b\xef\xdb\xdc\x94\x7e\x01\xd9\x03\
+\x60\x8d\xb4\xde\x1f\x29\x65\xa6\x59\xd7\x69\x8e\xbb\xdb\x9c\x69\
+\xb1\xac\x00\xbc\x3f\xad\x2f\x99\x66\x83\xac\x01\xb0\xb3\x3c\x1d\
+\xcb\x0a\x40\xdf\x6b\xc8\xba\x07\xf8\x3b\x85\xc0\x69\x8d\xfe\xd7\
+\x96\x4d\x01\xcf\xba\x4e\xca\x44\xab\x90\x35\x00\x5d\x96\xe8\xcc\
+\x14\xfc\x3b\x05\xb9\xc5\x5c\x4a\x86\x4d\x0f\xd9\x09\x20\xc8\x1c\
+\xe0\xae\xda\xfc\x80\x2f\x5d\xb1\x34\x07\x18\x0b\x72\xd1\x1f\x71\
+\x6b\x1d\x5f\x95\xa1\x4d\x10\x19\x04\x6e\xcb\x60\x67\x7e\xe5\x40\
+\x85\x7f\x4e\xb0\x46\xab\x56\xfe\xad\x26\x17\xc9\x38\x08\xd6\x01\
+\x3b\xf9\x48\x9a\xd6\xd4\x9b\x56\xb2\xb4\xa1\x0e\x3b\x1b\x2d\xf9\
+\xb7\x12\x88\xf6\xb4\xf9\x49\x76\x3b\xd9\x71\x6b\xe5\x4f\x4c\x20\
+\x17\x80\x27\x43\xf7\xaf\xb7\x2b\xc0\x20\x27\x48\x3e\x1e\x1b\x87\
+\x66\x90\xdf\xad\x20\x6c\xa5\x7a\x50\x5c\x5a\x39\x56\xef\x57\x8f\
+\xb2\xf4\xb2\x5c\x58\x13\x4a\x57\x7f\x03\xf9\x14\x64\x2f\x48\x9f\
+\xf5\xfb\x29\xf2\x1d\x73\x9f\x65\x17\x57\x4c\x66\x28\xdf\x83\xec\
+\x00\x39\x11\x4a\xb3\x5f\x75\xf4\x6c\xa9\xb1\xd6\xfe\x3b\x5b\x44\
+\x05\x67\x0f\x6e\x16\x28\x37\x80\x7c\x97\x60\x67\x00\xd4\x6b\x0e\
+\xec\xd4\x85\x76\xf3\x7e\xcb\x29\x31\xad\x73\x06\xe4\x73\xe0\xd1\
+\x02\x6c\x2d\x36\xa9\xae\x74\x0b\x6a\xc0\x9c\x33\x54\x9b\xc8\xd9\
+\xed\xff\x07\xe7\xf3\x4b\x5f\x8f\x5c\x6b\xe2\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x8d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
+\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x05\x1a\x49\x44\
+\x41\x54\x78\x9c\xed\x9b\x5d\x68\x1d\x45\x14\xc7\x7f\x46\xaf\xc9\
+\x4d\x4a\x8d\xb1\x25\xa6\xa2\x82\x82\x45\x8d\x9f\x44\x04\x95\xfa\
+\x68\x15\xf5\x4d\xb1\xc4\x54\x90\xa2\xd6\xa2\x26\x45\x1f\x54\x7c\
+\xd1\x42\xad\x20\x8a\x6f\x2a\x0a\x3e\x29\xbe\xf8\xa0\xad\x96\x56\
+\x85\x80\x4a\xfd\xa0\x0a\x4d\x8b\xc5\x8f\x68\xea\x4d\xdb\xa4\x34\
+\xa1\x4a\x63\xd3\xde\xeb\xc3\xb9\x7b\xd9\x68\xe6\xcc\xc7\xce\x6e\
+\x6e\x31\x3f\x18\x58\xb2\x3b\xe7\xfc\xcf\xc9\xee\xec\xce\xcc\xb9\
+\xb0\xc8\xff\x9b\x33\x94\x73\x25\xe0\x21\x60\x35\xb0\x24\xd0\x7e\
+\x0d\xf8\x05\xd8\x0c\xfc\x1c\x68\x63\x41\x28\x01\x3b\x91\x00\x62\
+\xb4\x71\xe0\xbc\x40\x2d\xad\xc0\xd2\xc0\xbe\xc1\x6c\x20\x5e\xf0\
+\x49\x5b\xe7\xa9\xa1\x1b\x78\x1f\xf8\x1b\xa8\x02\x23\xc0\x10\x70\
+\x4e\x78\x58\xee\x7c\x48\xfc\x04\x3c\xe5\xe1\xbf\x15\xd8\x63\xb0\
+\x33\x0d\x6c\x22\x52\x22\x5a\x62\x18\xc9\x81\xfb\x80\x2b\x0d\xe7\
+\x96\x02\xcf\x02\x3f\x21\x63\x94\x36\x8e\x59\x31\x25\xe0\xe3\x2c\
+\x46\x23\x70\xad\xc3\x35\xcb\x80\xd7\x81\xcf\x81\x8b\x43\x1d\x99\
+\x12\xf0\x26\xf0\x69\xa8\xd1\x08\x1c\xf6\xb8\xf6\x56\x60\x37\x70\
+\x67\x88\xa3\x33\x0d\x7f\xaf\x02\xef\x02\x07\xeb\xc7\xe3\xc0\x68\
+\xbd\x75\x23\x6f\x09\x5f\x76\x00\x5f\x3a\x5e\x3b\x86\xdc\xde\xae\
+\x7e\xca\xc8\x63\x73\xdc\xc3\x47\x10\x5b\x28\x66\x10\x04\xb8\x1b\
+\x38\x1a\xe0\xe7\xa5\xd0\xe0\x6c\x64\x09\x3e\x24\x01\x00\x9d\xc0\
+\x63\xc0\x7e\x4f\x5f\x5b\x02\x7c\xa9\x0c\x79\x0a\x88\x95\x80\x84\
+\x16\x60\x00\xf8\xcd\xc3\xdf\x50\x06\x7f\x73\x58\x0d\x9c\x74\x70\
+\x58\xb5\x9c\xcf\x92\x80\x84\x0e\xe0\x15\xe0\x94\x83\x9e\x93\xc0\
+\x6d\x59\x1d\x5e\x00\x4c\x38\x38\x9b\x06\xfa\x2d\xd7\xc4\x48\x40\
+\xc2\xed\xc0\x11\x07\x5d\x13\xf5\x18\x82\xd9\xee\xe0\xe4\x00\xd0\
+\x0b\xb4\x5b\xae\x8b\x99\x00\x80\xcb\x80\x5f\x1d\xf4\x7d\x12\xea\
+\x60\xc0\xc1\xf8\x18\x70\x49\xfd\xfa\xa2\x13\x00\x70\x21\x6e\x49\
+\x18\xf0\x35\xdc\x01\x54\x2c\x46\xa7\x98\xfb\xb9\xba\x10\x09\x00\
+\xb9\x13\x26\x2d\xbe\x2b\x18\xa6\xf4\xa6\x2f\xc1\x27\x80\x1e\xc5\
+\x69\x15\xc9\xea\x48\x90\xe4\xb8\xec\x47\xc6\x9f\xaa\x72\x4d\x0f\
+\x12\x93\x13\xed\xd8\x07\xbe\xd7\xe6\xe9\x57\xb6\xf4\x79\xd2\x55\
+\x40\x20\x2f\x5b\xfc\x4f\x22\x77\xb6\x95\x47\x2c\x86\x7e\x57\x0c\
+\x69\x5f\x6e\xfd\xfe\x31\x79\xd1\x8e\x7d\x3c\x58\xef\x62\xe8\x3b\
+\x8b\x11\x6d\x40\x79\xd5\xd0\x67\x82\x62\x16\x32\xd6\x18\xfc\x27\
+\x6d\xb7\xcd\xc0\xe5\xe8\x1f\x34\x3f\xa2\xaf\x21\x94\x81\xad\xfc\
+\x37\xf8\x55\x21\xd1\x04\xd0\x02\xec\x43\x4f\x42\xaf\x66\xe0\x19\
+\x4b\xe7\x0d\x8e\x42\x56\x01\x83\xc0\xfd\x14\xb4\x84\x95\x62\x3d\
+\x7a\x0c\xcf\x69\x9d\x87\x95\x8e\x33\xc8\xe4\xa4\xd9\xe9\x44\xa6\
+\xc5\xa6\x38\xbe\x30\x75\x6c\x43\x82\x34\x75\xdc\x9a\xa7\xea\xc8\
+\x7c\x84\x39\x8e\x13\xc8\xa3\x0a\xcc\x7d\x9e\xaf\x46\x16\x23\x4d\
+\x6c\x8f\x2e\x33\x3f\x34\xad\x25\x52\x4b\x6e\xe9\x04\xa8\x83\x03\
+\xca\xad\xd3\x84\x7c\x65\x39\xdf\x88\x35\x9d\x80\x4b\x95\x0e\xa7\
+\x68\x8e\xaf\x3e\x57\xf6\x20\x9a\x4d\x34\x62\x4d\x27\x40\x9b\x36\
+\x56\x90\xf1\xe1\x74\x61\x06\x59\xc7\x34\xb1\x22\x39\x48\x27\xa0\
+\x4b\xe9\xe0\xb3\x4a\xdb\x2c\x68\x9a\x1b\xb1\xa6\x13\x50\x9e\xe7\
+\xc2\x84\xbf\x32\xcb\x29\x1e\x4d\x73\x5b\x72\x90\x4e\x80\xb6\xc3\
+\x92\x69\xf7\xa5\x09\x69\xc4\x93\x4e\x80\xf6\x8c\x3b\xcd\xa2\x9a\
+\x0c\x4d\xf3\xf1\xe4\x20\x9d\x80\xa3\x4a\x87\xee\xcc\x72\x8a\x47\
+\xd3\x3c\x95\x1c\xa4\x13\xa0\x8d\x9a\x3d\xc8\x74\xf3\x74\xa1\x0d\
+\x38\x5f\x39\x5f\x49\x0e\xd2\x09\xd0\x2a\x38\x5a\x80\xab\x32\x8a\
+\x2a\x92\x5e\xcc\xdb\x7e\x20\x55\x2b\xc0\xdc\x04\xd8\x3e\x74\x6e\
+\xc9\xa2\xa8\x60\x6e\xb2\x9c\x9f\x37\xd6\x25\xc0\x2c\xe6\x49\xc4\
+\x8e\x88\x02\xf3\x66\x1b\xe6\x38\x66\x51\x6a\x9e\x76\x29\x1d\x4f\
+\x00\xcb\xf3\x54\x1d\x89\x2e\xa4\xac\xc6\x14\xc7\x37\xe9\x8b\xff\
+\xbd\xba\xa3\x6d\x22\x94\x80\x07\xa2\xc9\xcc\x8f\x01\xe0\x6c\xe5\
+\xbc\x3a\xab\xbd\x06\x7d\x35\x65\x94\xb0\xda\x80\xa2\x38\x0b\x19\
+\xcc\xb5\x18\xfa\x6c\x46\x7e\xb0\x18\x78\x38\x07\xe1\xb1\x58\x87\
+\xae\x7d\x9f\x8b\x91\x47\x2d\x46\x0e\xd2\x9c\x4b\x63\x9d\xc8\xb7\
+\x8c\xa6\x7d\xa3\x8b\xa1\x0e\xec\x5b\x4d\x6f\xc5\xd5\x1e\x85\xb7\
+\xd1\x35\x4f\xe3\xb1\x40\xfb\xb4\xc5\x58\x15\xb8\x37\x9e\xf6\xcc\
+\xac\xc1\x5e\x9f\xb0\xc9\xc7\x60\x3b\xb2\xf3\xab\x19\x3c\x06\x5c\
+\x17\x45\x7e\x36\xfa\x80\x3f\xd1\xb5\x1e\x26\x60\x79\xfe\x1e\x8b\
+\xd1\x64\x3c\x58\x99\x35\x82\x0c\x5c\x81\x04\x67\xd3\xe9\x5b\xa6\
+\xdb\xe0\x03\x07\xe3\xe3\x2c\xcc\x9d\x70\x03\x6e\xc1\x7f\x46\x86\
+\xf5\x8c\xe5\x48\x05\x88\xcd\xc9\x31\xe4\x8e\x29\x8a\x7e\x64\xc5\
+\xc7\xa6\xeb\x08\x70\x51\x56\x67\x37\xa3\x6f\x98\xa4\x07\xc6\x37\
+\xc8\xb7\xb4\xfd\x5c\xe0\x1d\xec\x03\x5e\x0d\x29\x92\xba\x23\x96\
+\xe3\xb5\x8e\x4e\x6b\xc0\x1f\xc0\x83\xe8\xd3\x51\x5f\x4a\xc8\xb6\
+\xfd\x21\x47\x0d\xce\xef\x7c\x1f\x36\xe2\x9e\x84\x1a\x52\xcd\xfd\
+\x38\xf2\x5f\x0b\x65\x59\xdd\xef\xa8\x87\xdf\x1a\xf0\x62\x06\x9f\
+\x2a\x43\xf8\x25\xa1\x86\x3c\x3e\xdb\x90\x12\x95\x3e\x52\x2b\xb2\
+\xf3\x50\x46\x06\xb7\x41\x64\x62\xa6\xcd\xea\x4c\x6d\x73\xa4\x58\
+\x8d\xf4\xa3\xef\xbe\xba\x3c\x9b\x63\xc0\xb7\xc8\x6e\xf4\x30\x52\
+\x94\x71\x00\xb7\x82\x4c\xcd\xee\x60\x8e\x71\xcf\xe1\x46\xfc\xca\
+\x56\xf3\x6e\x93\x48\xf1\x64\xa1\x74\x01\xef\x65\x14\x1e\xa3\xed\
+\x44\xea\x05\x17\x8c\xbb\xb0\xcf\xc1\xf3\x68\x87\x90\xb7\x4d\x53\
+\x6c\xda\xb4\x22\xcf\x9f\xad\xb8\x32\x46\x9b\x02\x9e\x67\x01\x7e\
+\x4a\xe7\x42\x2b\xf2\x5f\xd9\x85\xff\xdb\xc2\xd6\xf6\x52\xe0\xcf\
+\xe6\x62\xb0\x12\x29\xba\x1a\x26\xec\x75\x36\x0b\x7c\x0d\xbc\x00\
+\x5c\x9f\x97\xc8\xa2\x9e\x9f\x36\x64\xc2\xd4\x8b\x14\x27\xac\x40\
+\x3e\x90\x92\x1d\xe9\x19\x64\x6b\xae\x82\x6c\x5a\x8c\x00\xdf\x23\
+\xd3\xdc\x45\x16\xc9\x91\x7f\x00\xf6\x23\xe1\xfa\x7d\x6f\x88\xb9\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x62\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x0a\x14\x49\x44\x41\x54\x78\x9c\xdd\
+\x5b\x6b\x8c\x5c\x65\x19\x7e\x9e\x73\x4e\xb7\x0b\xdd\xdd\x99\x2d\
+\x6b\xdb\x99\x39\xa7\x36\xd8\x62\xb1\x04\x21\x18\x48\xa1\x11\x12\
+\x2e\x82\x80\x89\x69\x31\x80\x12\xaa\x22\x5b\xa9\x24\x68\x45\x63\
+\x08\xfc\x40\x20\xa1\x5c\xa2\x02\xda\x2e\x21\x50\x4d\x21\x42\x5b\
+\x12\x22\x05\xf1\x92\x68\x80\x7a\xc1\x60\x94\x7b\x6b\xad\x9c\x33\
+\x33\x34\xdd\x86\xdd\x9d\x05\x67\x75\xce\x79\xfc\xb1\x67\xcb\x76\
+\xf7\x7c\x33\x67\x76\x67\x0a\xf8\xfc\x9b\xf3\xbe\xdf\x7b\x9b\x73\
+\xf9\xbe\xf7\x42\xb4\x19\x85\x42\xc1\x05\xb0\xd2\xb2\xac\x93\x24\
+\x1d\x0f\x60\x09\xc9\x85\x92\xb2\x00\x3a\x63\xb6\x2a\xc9\x21\x49\
+\xfb\x01\xec\x03\xf0\xba\xa4\x17\x25\xed\x2a\x95\x4a\x7e\x3b\xed\
+\x63\x3b\x64\xe6\xf3\xf9\xd3\x6d\xdb\x5e\x2d\xe9\x22\x92\x4b\x67\
+\xa1\x47\x92\xf6\x00\xd8\x19\x45\xd1\x63\xa5\x52\xe9\x79\x00\x6a\
+\x9d\xa9\x2d\x0c\x40\x36\x9b\xcd\x76\x77\x77\x5f\x25\xa9\x3f\x76\
+\xba\x1d\xf8\x87\xa4\x81\xd1\xd1\xd1\x81\xa1\xa1\xa1\xa1\x56\x08\
+\x9c\x75\x00\x32\x99\x4c\x6f\x4f\x4f\xcf\xf5\x00\xd6\x03\xe8\x99\
+\xbd\x49\x8d\x21\xa9\x02\xe0\xbe\x4a\xa5\xb2\x71\x78\x78\xf8\xed\
+\xd9\xc8\x9a\x4d\x00\xe8\x79\xde\x3a\x49\xdf\x27\x79\xcc\x6c\x8c\
+\x98\x29\x24\x1d\x24\x79\x93\xef\xfb\x9b\x00\x44\x33\x91\x31\xa3\
+\x00\xb8\xae\xbb\x94\xe4\x43\x00\xce\x98\xc9\xfa\x56\x43\xd2\xf3\
+\x00\xd6\x06\x41\xb0\xbb\xd9\xb5\x4d\x07\xc0\x75\xdd\x2f\x02\xf8\
+\x09\xc9\xee\x26\x97\x56\x01\xbc\x22\xe9\x55\x92\x6f\x02\x18\x8c\
+\xa2\xe8\xdf\x00\x60\x59\xd6\x51\x00\xfa\x24\x2d\x26\xb9\x1c\xc0\
+\x0a\xbc\xf7\x85\x48\x05\x49\xa3\x00\xd6\x05\x41\xb0\xb5\x99\x75\
+\xcd\x04\xc0\xf2\x3c\xef\x0e\x49\xdf\x24\x99\x6a\x9d\xa4\xdd\x24\
+\xb7\x01\x78\xca\xf7\xfd\x3f\x63\x3c\x08\x69\x30\xd7\xf3\xbc\x53\
+\x01\x9c\x2f\x69\x0d\xc9\xe3\x52\xea\x13\xc9\x1f\xf8\xbe\xff\x6d\
+\xa4\x7c\x24\xd2\x06\xa0\xc3\x75\xdd\x87\x49\xae\x4e\x61\x44\x8d\
+\xe4\x8e\x5a\xad\x76\x4f\xb9\x5c\x7e\x36\xa5\xfc\xba\xc8\xe7\xf3\
+\x67\xd8\xb6\x7d\xad\xa4\xd5\x24\x9d\x14\x36\x6c\x0f\x82\xe0\x72\
+\x00\xff\x69\xc4\x9b\x26\x00\x1d\xae\xeb\x3e\x4e\xf2\xb3\x0d\x94\
+\x0a\xc0\x8e\x28\x8a\x6e\x28\x95\x4a\xaf\xa7\x90\xdb\x34\x0a\x85\
+\xc2\x71\x24\x6f\x05\xb0\xba\xd1\x5d\x28\x69\x67\x10\x04\x9f\x47\
+\x83\x20\x34\x0a\x80\xe5\xba\xee\xa3\x29\xfe\xf9\xbd\x61\x18\xf6\
+\x97\x4a\xa5\x5f\x37\xe0\x6b\x09\xf2\xf9\xfc\x39\xb6\x6d\x6f\x06\
+\x70\x6c\x3d\xbe\xf8\x4e\xf8\x02\xea\x3c\x0e\x76\x3d\x01\x9e\xe7\
+\xdd\x49\xf2\xab\x0d\x94\x3c\x5c\xad\x56\x2f\xda\xbf\x7f\xff\x6b\
+\xf5\xf8\x5a\x89\x4a\xa5\xb2\xb7\xa3\xa3\xe3\x41\xc7\x71\x16\x93\
+\x3c\xd1\xc4\x47\xf2\x13\x99\x4c\xa6\x67\x64\x64\xe4\x97\x46\x1e\
+\x13\x21\x7e\xdb\xff\xcc\x74\xab\x49\x0a\x49\x7e\xd7\xf7\xfd\xbb\
+\x9a\xb2\x7e\x1c\x56\x2e\x97\x73\x49\xf6\xc5\xb2\x0e\x96\xcb\xe5\
+\x00\x40\xd8\xac\x20\xcf\xf3\x36\x48\xda\x48\xd2\x32\xd8\x29\x00\
+\x57\x98\xbe\x0e\x89\xce\xb9\xae\xbb\x14\xc0\x8b\x24\xbb\x0c\x7a\
+\xff\x0b\xe0\x4a\xdf\xf7\x1f\x49\x6b\x68\x2e\x97\x3b\xda\x71\x9c\
+\x4b\x25\xad\x01\xb0\x6a\xea\x67\x54\xd2\x3b\x24\x9f\x93\xf4\x58\
+\x18\x86\x0f\x97\xcb\xe5\x77\xd3\xca\xf6\x3c\xef\x32\x00\x5b\x00\
+\xcc\x49\xa2\xc7\x9f\xc8\x93\x83\x20\xd8\x33\x95\x96\x14\x35\x0b\
+\xc0\x16\x93\xf3\x92\x42\x34\xe7\xbc\xe5\x79\xde\x7a\xdb\xb6\xf7\
+\x01\x78\x80\xe4\x05\x49\x7b\x08\x92\xf3\x00\x9c\x47\xf2\x7e\xc7\
+\x71\xf6\x16\x0a\x85\xab\x91\xf2\x2b\x15\xdb\x72\xa5\xa4\xc4\x67\
+\x3d\xf6\xe5\xa7\x48\xf0\x77\xda\x3b\xc0\xf3\xbc\x75\x24\xd7\x99\
+\x94\x91\xfc\x8e\xef\xfb\x03\x69\x0c\x5b\xb0\x60\xc1\xc2\xde\xde\
+\xde\x5f\x90\xbc\x26\x76\x30\x2d\xba\x48\x5e\xdc\xd3\xd3\x73\xaa\
+\x65\x59\x4f\x56\xab\xd5\x86\xfb\x87\x91\x91\x91\x97\x32\x99\xcc\
+\x3b\x00\xce\x33\xd8\xed\x65\x32\x99\xfd\x23\x23\x23\x2f\x1c\x76\
+\x7d\xf2\x8f\x4c\x26\xd3\xdb\xdd\xdd\xbd\xdb\xb4\xb7\x97\xb4\x35\
+\x08\x82\x2f\xa5\xf1\x20\x97\xcb\x2d\x76\x1c\xe7\xb7\x00\x3e\x96\
+\x86\xdf\x04\x49\x7f\x0b\xc3\xf0\xec\x72\xb9\x3c\x98\x86\xdf\x75\
+\xdd\xad\x24\x2f\x37\xc8\x3a\x58\xa9\x54\x96\x4d\x3e\x40\x1d\x76\
+\x4b\xf4\xf4\xf4\x5c\x5f\xe7\x60\xb3\xb7\x5a\xad\x7e\x3d\x8d\x11\
+\xf3\xe7\xcf\xef\x71\x1c\xe7\x69\xcc\xd2\x79\x00\x20\x79\xa2\x6d\
+\xdb\x4f\x00\xe8\x48\xc3\x5f\xad\x56\xd7\x01\xd8\x6b\x90\x75\x4c\
+\x7c\x72\x3d\x84\x43\x01\xc8\x64\x32\xbd\x92\xbe\x91\xb4\x50\x92\
+\xc2\x30\xec\x1f\x1c\x1c\xac\xa4\x31\x62\xde\xbc\x79\xf7\x00\x38\
+\x3e\x0d\x6f\x1a\x90\x5c\xe9\xba\xee\xad\x69\x78\x07\x07\x07\x2b\
+\x61\x18\xf6\xc7\x6f\xff\x24\xac\xcf\x66\xb3\xd9\x89\x1f\x87\x02\
+\xd0\xdd\xdd\x7d\x55\x9d\x03\xce\xf6\xb4\x9b\x9c\x5c\x2e\xb7\x4a\
+\xd2\x15\x75\x58\x24\xe9\x77\x51\x14\x5d\x23\xe9\x2c\x00\x67\x4a\
+\xba\x1a\xc0\x33\x75\x8c\x06\x80\xeb\x16\x2d\x5a\xb4\x22\x8d\x0d\
+\xb1\xad\x3b\x0c\xe4\x9e\xae\xae\xae\xaf\x4d\xfc\x98\x78\x07\xd0\
+\xf3\xbc\x37\x00\x4c\xcb\xe4\x48\xaa\x49\x5a\x51\x2c\x16\xdf\x48\
+\xa3\xdc\x75\xdd\xa7\x49\x7e\xc6\x40\x7e\x3b\x0c\xc3\xb5\xa5\x52\
+\xe9\x89\x24\x62\x3e\x9f\x3f\xd7\xb2\xac\xad\x24\x3f\x92\x44\x97\
+\xf4\x48\xbc\xc7\x6f\x88\x7c\x3e\xff\x71\xcb\xb2\x5e\x4a\x3a\x3b\
+\x48\xda\x13\x04\xc1\x71\x00\x64\xc5\xcc\xa7\x23\xc1\x79\x00\x20\
+\xb9\x3d\xad\xf3\x71\x02\xf4\x5c\x83\xf1\xef\xd6\x6a\xb5\x73\x4d\
+\xce\x03\x40\xa9\x54\xfa\x15\x80\xb3\xe3\x8c\x4f\x92\x2d\xab\x5d\
+\xd7\x9d\x9f\xc6\x96\x52\xa9\xf4\x3a\xc9\xc4\xbb\x80\xe4\xd2\xd8\
+\xe7\xf1\x47\xc0\xb6\xed\x35\x26\x41\x61\x18\xde\x93\x46\x61\x2c\
+\xf8\x34\xd3\x8e\x0c\xc0\xcd\xe5\x72\xf9\x2f\x8d\x64\x04\x41\xf0\
+\x77\x00\x37\x18\xc8\x1d\x00\x2e\x48\x6b\x4f\xad\x56\x33\xda\x6e\
+\xdb\xf6\x6a\x20\x0e\x80\xa4\x0b\x93\x98\x24\xed\x2e\x95\x4a\xcf\
+\xa5\x55\x28\xa9\x68\x20\x0d\x8f\x8d\x8d\xdd\x97\x56\x4e\x10\x04\
+\x03\x00\x4c\xb9\xbe\x95\x69\xe5\x94\xcb\xe5\x67\x25\x25\x66\x89\
+\x26\x7c\xb6\x0a\x85\x82\x6b\xca\xe2\xc6\xc9\x8c\xd4\x28\x16\x8b\
+\x7f\x90\xf4\xf8\x14\x45\x92\xb4\xe1\xc0\x81\x03\xa3\x4d\x88\x1a\
+\x03\xf0\x7b\x03\xad\xa9\x8c\xb3\xc9\x07\x92\xcb\x0a\x85\x82\x6b\
+\x61\x3c\xa2\xa6\x2d\xe7\x53\xcd\x28\x03\x80\xf8\xf8\xf9\x15\x00\
+\x3f\x96\xf4\x43\x92\x67\x05\x41\xf0\x40\xb3\x72\x00\x94\x0d\xd7\
+\x9b\xcd\x3c\x3f\x6d\xb8\x4e\x00\x2b\x1d\xcb\xb2\x4e\x36\x30\x54\
+\x7d\xdf\xff\x53\x93\xca\x00\xa0\xe6\xfb\xfe\x83\x00\x1e\x9c\xc1\
+\xda\xc9\xc8\x1a\xae\xa7\x3e\x24\x01\x80\xef\xfb\x7f\xf4\x3c\x6f\
+\x0c\xc0\xdc\xa9\x34\xcb\xb2\x4e\xb2\x24\x2d\x37\xac\x7d\x19\xe3\
+\xb7\xe2\xfb\x01\x07\xc0\xa7\x93\x08\x92\x9a\xcd\x36\x8d\x61\xdc\
+\x97\x24\x59\xcb\x2d\x00\x4b\x0c\xc4\x23\x96\xe0\x98\x0a\xcf\xf3\
+\xfa\x01\xe4\x0d\xe4\xa6\x1f\x4b\x49\xaf\x26\x5d\x27\xb9\xc4\x22\
+\xb9\xd0\x40\x7c\xb3\x59\x45\xad\x80\xeb\xba\x67\x02\xb8\x33\x89\
+\x26\xe9\x8d\x62\xb1\xd8\x74\x00\xea\xf8\xb2\xc8\x8a\xab\xb4\x49\
+\x48\x75\xfa\x6a\x25\x0a\x85\xc2\x1a\x00\x3b\x91\x50\x13\x90\x14\
+\x45\x51\xb4\x1e\x33\xc8\x1a\xc1\xe0\x8b\xa4\xac\x95\xa4\x0c\x00\
+\x26\x8a\x16\x47\x08\xb6\xeb\xba\xb7\x93\x7c\x94\xe4\xd1\x49\x0c\
+\x24\x6f\x9a\x69\xd2\xb5\x8e\x2f\x9d\x0d\x73\xec\xed\xc6\xe2\xc5\
+\x8b\x7b\xa3\x28\x7a\x8c\xe4\xd9\x26\x1e\x49\xb7\x07\x41\x90\xea\
+\x34\xd8\x2c\x1c\x8c\x57\x6b\xa6\x45\x3d\x2e\x57\xb5\x15\x0b\x16\
+\x2c\x58\x28\xe9\x37\x24\x13\x4f\x79\x71\x8a\xeb\x7b\x41\x10\x6c\
+\x9c\x8d\x9e\x3a\xbe\x54\x1d\x92\x43\x48\x08\x00\x80\xbe\xd9\x28\
+\x6d\x04\xd7\x75\x8f\x22\xf9\x24\xc6\xeb\x80\x49\x18\x23\xf9\xe5\
+\x66\x12\xaf\x75\x90\xe8\x0b\xc9\x21\x2b\x6e\x4b\x99\x06\x49\x8b\
+\x5b\xa0\xb8\x1e\x6e\x06\x70\x8a\x41\xf7\x3b\x61\x18\x5e\xdc\x22\
+\xe7\xeb\xf9\xf2\x96\x85\xf1\x9e\x9c\x69\x88\xab\xb4\x6d\x41\x3e\
+\x9f\xf7\x48\x5e\x9b\x44\x8b\xb3\xce\x97\xc4\x47\xe3\x96\x80\x64\
+\x62\x76\x4a\xd2\x3e\x8b\xa4\x69\xc3\xb3\x02\x09\xdb\xc7\x56\xc0\
+\xb6\xed\x7e\x93\x6c\x49\xb7\x05\x41\xd0\xf4\xb7\xbe\x0e\xe6\xc2\
+\xf0\x98\x91\x7c\xcd\x8a\xa2\xe8\x45\xc3\xc2\xce\xb8\x44\xdd\x72\
+\x48\xfa\x9c\x81\x54\x9c\x33\x67\xce\x6d\xad\xd4\xe5\x79\xde\x69\
+\x30\x04\x3b\x8a\xa2\xbf\x5a\x00\x76\xc1\xdc\x79\x95\x3a\xf9\x90\
+\x16\xb9\x5c\xee\x68\x98\x5f\x7c\x5b\xf6\xed\xdb\x97\xb6\x87\x20\
+\x2d\xce\x37\x5c\x17\x80\x5d\x56\xb1\x58\x0c\xe2\x56\xb4\xe9\x1c\
+\xe3\x65\xac\x96\x82\xa4\x57\xa7\x8e\x97\x3a\xf9\x92\x16\x26\x1f\
+\x24\xed\x2e\x16\x8b\x81\x13\x1b\xf5\x24\x80\xeb\xa6\x32\x91\x5c\
+\x96\xcb\xe5\x56\xb5\xaa\xd1\x21\xc6\xbb\x92\x12\x2b\x4b\xb5\x5a\
+\xed\x95\x16\xea\x41\x2e\x97\x5b\x45\x72\x59\x12\x2d\xf6\x19\x0e\
+\x00\x84\x61\xb8\xcd\xb6\xed\x69\x01\x00\x00\xc7\x71\xae\x05\xd0\
+\xb2\x00\xc4\x9d\x9f\xfd\xad\x92\x57\x0f\xb1\xed\x89\x08\xc3\x70\
+\x1b\x90\x32\x2d\x1e\x45\xd1\x09\xed\xea\xfa\x68\x17\xd2\xa6\xc5\
+\x9d\xf7\xae\x69\x80\xe4\xb4\x2d\x27\x49\xc7\xb2\xac\x5b\x00\x5c\
+\xd2\x0a\xc3\xe2\x97\xa0\xa9\x6a\xf4\x6a\x33\x65\xf1\x7a\xb0\x2c\
+\xeb\xd6\x3a\xfd\x44\x03\x88\x5f\xfc\x87\x72\x81\xd9\x6c\x36\xdb\
+\xd5\xd5\xf5\x66\x52\x75\x48\xe3\x67\xd1\xf3\x5a\xd1\x02\x93\xcb\
+\xe5\x4e\x71\x1c\xe7\x85\x24\x5a\xad\x56\xfb\x54\x9a\xd4\x79\x23\
+\xe4\xf3\xf9\x73\x2c\xcb\x7a\xc6\xd0\xdc\x31\x52\xa9\x54\x3e\x3a\
+\xd1\x6a\x7b\xe8\x6d\x3c\x34\x34\x34\x44\xf2\xde\x24\x81\x24\x69\
+\xdb\xf6\xe6\xbe\xbe\xbe\x66\x7b\x03\x8f\x38\xfa\xfa\xfa\xba\x6d\
+\xdb\xde\x5c\xa7\x89\xea\xde\xc9\x7d\xc6\x87\x7d\x8e\x46\x46\x46\
+\xee\x90\x74\xd0\xb0\xf0\xd8\xce\xce\xce\x4d\xad\x32\xb4\x5d\x88\
+\x6d\x4c\x6c\x9e\x92\x34\x58\xa9\x54\xee\x98\x7c\xed\xb0\x00\x0c\
+\x0f\x0f\xbf\x4d\xf2\x46\x93\x70\x92\x97\x7b\x9e\xb7\xa1\x25\x96\
+\xb6\x01\x9e\xe7\x6d\x30\xf5\x06\x00\x80\xa4\x1b\xa7\x76\x99\x4f\
+\xdb\x90\xf8\xbe\xbf\x19\x80\x71\x43\x22\x69\xa3\xeb\xba\xa9\x0a\
+\x94\x47\x12\x9e\xe7\x5d\x26\xa9\x5e\xde\xe0\xb9\x62\xb1\x38\x6d\
+\xff\x91\xb4\x23\x8b\x24\xad\xad\x53\xa0\xb4\x48\x3e\xf4\x41\x0a\
+\xc2\x44\x93\x54\x9d\x1d\xe6\xa8\xa4\xb5\x48\xe8\x17\x9c\x4d\x9b\
+\x5c\x14\xb7\xc9\x25\x66\x70\x4d\x68\xf5\x67\xb0\x2d\x6d\x72\x93\
+\x84\xdf\x05\xe0\x5b\xf5\x78\x24\x3d\x52\xad\x56\x53\x77\x8f\xb4\
+\x0a\x7d\x7d\x7d\xdd\x9d\x9d\x9d\x9b\xea\x3d\xf3\x31\xee\xf6\x7d\
+\xdf\xf8\xde\x4a\xd3\x2a\xfb\x73\x92\x8d\x0e\x45\xff\x0c\xc3\xf0\
+\xea\x0f\x63\xab\x6c\xda\x66\xe9\x1d\x24\x13\x4b\xe8\x93\x94\xb5\
+\xbd\x59\x3a\xde\xde\xde\x82\x23\xd8\x2c\x3d\x81\x8e\xb8\xfd\xac\
+\xe1\xf1\x58\x52\x0d\xc0\xe3\x61\x18\xfe\xe8\xff\xa5\x5d\x7e\x02\
+\x33\x1a\x98\x00\xb0\x9d\xe4\x53\x71\xa5\xb9\x99\x81\x89\xd3\xf0\
+\xde\xc0\x44\xe2\x91\x36\x41\x5f\xdb\x06\x26\x0e\x61\x16\x23\x33\
+\x63\x00\x5e\x9e\x3c\x32\x03\x60\xa2\x62\x33\x75\x64\xe6\x04\x34\
+\x99\x8f\x3c\x12\x23\x33\x87\x10\x37\x53\x6f\x21\x79\xfa\x4c\xd6\
+\xb7\x1a\x47\x74\x68\x6a\x12\xac\x42\xa1\xd0\x4f\xf2\xfd\x1c\x9b\
+\x1b\x94\x74\x53\xb1\x58\xdc\x8c\x19\x8e\xcd\xd5\x1d\x98\x68\xa4\
+\xbf\x52\xa9\xbc\x60\x59\xd6\xc0\xdc\xb9\x73\x23\x00\x9f\x44\x9b\
+\xd2\xe8\x09\x18\x01\x70\xf7\xe8\xe8\xe8\xa5\x07\x0e\x1c\x78\x16\
+\xb3\x18\xa7\xfd\xb0\x8d\xce\xee\xd1\xf8\xe8\xec\xfd\x1f\x98\xd1\
+\xd9\x24\x99\xf9\x7c\x7e\xa5\x6d\xdb\x6b\x24\x5d\x18\xbf\xc1\x67\
+\x33\x3c\xbd\x9b\xe4\xce\x30\x0c\xb7\x7d\xa0\x87\xa7\x4d\x98\x32\
+\x3e\xbf\x9c\xe4\x12\x00\x8b\x94\x30\x3e\x0f\xe0\x2d\x49\xff\x22\
+\xf9\x5a\x5c\xb0\xd9\x55\x2c\x16\x83\x76\xda\xf7\x3f\x31\x71\xca\
+\xeb\x7d\x60\xca\x84\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\x02\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x67\x00\x00\x0e\x67\
+\x01\x8f\x89\x82\x71\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x8f\x49\x44\
+\x41\x54\x78\x9c\xed\x9b\x41\x6e\xc2\x30\x10\x45\x9f\x7a\xb9\x9c\
+\xa2\x5b\x2e\x43\x6f\x06\x27\x48\x0f\x02\x0b\xa4\x74\x61\x8d\x04\
+\x2d\x20\x9c\x78\xec\x19\x7e\xbf\x94\x5d\x02\xef\x7d\x09\x92\xd8\
+\x1a\xb8\xcd\x04\x1c\x80\x13\x30\x03\x3b\xf2\x67\x47\x71\x39\x51\
+\xdc\xa6\x47\x27\x7e\x02\x17\x60\xf9\x75\xec\xfd\x19\xdd\xb2\xe7\
+\xaf\xcf\x85\xe2\x7a\x93\x47\xf2\x99\x4b\xb8\x27\x7f\xb7\x84\x89\
+\xe7\xf2\x19\x4b\x78\x26\x7f\x5d\xc2\x04\x70\x7c\xe1\xe4\x4c\x25\
+\xbc\x22\x6f\xc7\x11\xe0\x5c\x71\x41\xf4\x12\x6a\xe4\x17\x8a\x3b\
+\x73\xe5\x45\x51\x4b\xa8\x95\x5f\x80\x6f\x28\xb7\x89\xda\x0b\xa3\
+\x95\xb0\x46\x7e\xe1\xea\x36\xbf\xf6\x03\x22\x94\xd0\x8c\x3d\x63\
+\x09\xcd\x99\x33\x95\xe0\xc6\x9a\xa1\x04\x77\xc6\xc8\x25\x74\x63\
+\x8b\x58\x42\x77\xa6\x48\x25\x0c\x63\x89\x50\xc2\x70\x86\x91\x00\
+\xc3\xe5\x47\x82\x84\x91\x1f\x01\x14\x4e\xbe\x27\x58\x58\xf9\x1e\
+\x80\xe1\xe5\x3d\x41\xd3\xc8\x5b\x5a\x02\xa7\x93\xb7\xb4\x00\x4f\
+\x2b\x6f\xd9\x22\x90\x5e\xde\xb2\x56\xe4\x2d\xe4\x2d\x3d\x4a\x08\
+\x2b\x6f\xf1\x2c\x21\xbc\xbc\xc5\xa3\x84\xaf\xae\x06\x0d\xd2\xb2\
+\x84\x74\xf2\x96\x16\x25\xa4\x95\xb7\x6c\x29\xc1\x5d\xfe\xc3\xfb\
+\x0b\xd4\x23\xfd\x13\x90\xfe\x13\x94\xbe\x0d\x4a\x3f\x08\x49\x3f\
+\x0a\x4b\xbf\x0c\x49\xbf\x0e\x4b\x2f\x88\x48\x2f\x89\x49\x2f\x8a\
+\x4a\x2f\x8b\x4b\x6f\x8c\x48\x6f\x8d\x49\x6f\x8e\x4a\x6f\x8f\x0f\
+\x07\x18\xc9\x10\x41\x7e\x18\x4b\x24\xf9\xee\x4c\x11\xe5\xbb\xb1\
+\x45\x96\x77\x67\xcc\x20\xef\xc6\x9a\x49\xde\xd2\x8c\x39\xa3\xbc\
+\x65\x33\xbb\xfc\xc0\x84\xf2\xc8\xcc\x0c\x65\xa2\x32\xbb\xbc\xa5\
+\xb6\x84\x33\x94\x71\xd2\x77\x90\xb7\xd4\x94\x70\x80\xff\xc1\x49\
+\x40\x7c\x74\xd6\x22\x3d\x3c\x6d\x91\x1b\x9f\xff\x01\xfc\x3a\x09\
+\x16\xc6\xce\x6f\x56\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x04\xca\x57\xa7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x7c\x5a\x07\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xc1\x59\x87\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\xc7\x98\x67\
+\x00\x61\
+\x00\x62\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0a\x84\x37\xe7\
+\x00\x73\
+\x00\x79\x00\x6e\x00\x74\x00\x61\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0a\xa8\xba\x47\
+\x00\x70\
+\x00\x61\x00\x73\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0a\xc7\x57\x87\
+\x00\x63\
+\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\x33\x5a\x87\
+\x00\x68\
+\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\xad\x0f\x07\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x03\xcb\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x05\x1c\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x09\xe8\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x10\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x10\x1f\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x15\x1d\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x18\xb0\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x8c\
+\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x22\xc8\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x28\x59\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x32\xbf\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x47\x7c\x03\xe0\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x03\xcb\
+\x00\x00\x01\xa1\x47\x7c\x03\xc8\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x05\x1c\
+\x00\x00\x01\xa1\x47\x7c\x03\xb6\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x09\xe8\
+\x00\x00\x01\xa1\x47\x7c\x03\xc9\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x10\
+\x00\x00\x01\xa1\x47\x7c\x03\xb6\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x10\x1f\
+\x00\x00\x01\xa1\x47\x7c\x03\xd6\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x15\x1d\
+\x00\x00\x01\xa1\x47\x7c\x03\xdb\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x18\xb0\
+\x00\x00\x01\xa1\x47\x7c\x03\xcc\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x8c\
+\x00\x00\x01\xa1\x47\x7c\x03\xbf\
+\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x22\xc8\
+\x00\x00\x01\xa1\x47\x7c\x03\xd1\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x28\x59\
+\x00\x00\x01\xa1\x47\x7c\x03\xc4\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x32\xbf\
+\x00\x00\x01\xa1\x47\x7c\x03\xc1\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
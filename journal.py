@@ -0,0 +1,170 @@
+# Журнал восстановления несохранённых документов. Правки дописываются в конец
+# файла по мере ввода, поэтому стоимость записи пропорциональна правке, а не
+# размеру документа. Первая строка - исходное состояние: файл на диске (путь,
+# размер, время изменения, кодировка) или пустой документ; дальше - записи
+# JSON по одной на строке:
+#   {"p": позиция, "r": длина удалённого текста, "t": вставленный текст}
+#   {"snapshot": полный текст}  - после уплотнения журнала
+# Позиция и длина считаются в единицах UTF-16, как у QTextCursor. Имя файла
+# начинается с номера процесса, поэтому журналы работающего редактора не
+# принимаются за оставшиеся после сбоя. Оборванная последняя строка при чтении
+# отбрасывается.
+import itertools
+import json
+import os
+
+RECOVERY_DIR = os.environ.get('LAB1_RECOVERY_DIR') or os.path.join(os.path.expanduser('~'), '.lab1', 'recovery')
+SUFFIX = '.journal'
+_numbers = itertools.count(1)
+
+def _encode(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def baseHeader(path, encoding=None, newline='\n'):
+    # encoding - пара (кодек, BOM), в которой файл читается и сохраняется
+    header = {'path': path, 'newline': newline}
+    if encoding is not None:
+        header['codec'] = encoding[0]
+        header['bom'] = encoding[1].hex()
+    if path is not None:
+        try:
+            info = os.stat(path)
+        except OSError:
+            return header
+        header['size'] = info.st_size
+        header['mtime'] = info.st_mtime_ns
+    return header
+
+def baseChanged(header):
+    # Файл, к которому применяются правки, изменился после начала журнала
+    path = header.get('path')
+    if path is None:
+        return False
+    current = baseHeader(path)
+    return (current.get('size'), current.get('mtime')) != (header.get('size'), header.get('mtime'))
+
+class Journal:
+    # Состояние журнала одного документа в потоке интерфейса; запись в файл
+    # выполняют функции ниже в фоновом потоке
+    def __init__(self, directory=None):
+        self.directory = directory or RECOVERY_DIR
+        self.path = None
+        self.header = None
+        self.pending = []
+        self.truncate = False
+        self.size = 0
+        self.needsCompaction = False
+    @classmethod
+    def adopt(cls, path, header, directory=None):
+        # Журнал, оставшийся после сбоя, переходит к текущему процессу
+        journal = cls(directory)
+        journal.path = journal._newPath()
+        os.replace(path, journal.path)
+        journal.header = header
+        journal.size = os.path.getsize(journal.path)
+        return journal
+    def _newPath(self):
+        return os.path.join(self.directory, f'{os.getpid()}-{next(_numbers)}{SUFFIX}')
+    def isStarted(self):
+        return self.header is not None
+    def start(self, header):
+        if self.path is None:
+            self.path = self._newPath()
+        self.header = header
+        self.pending = [_encode(header)]
+        self.truncate = True
+        self.size = len(self.pending[0])
+    def append(self, position, removed, inserted):
+        record = _encode({'p': position, 'r': removed, 't': inserted})
+        self.pending.append(record)
+        self.size += len(record)
+    def takePending(self):
+        # (данные, перезаписать ли файл) для writeJournal
+        data = ''.join(self.pending).encode('utf-8')
+        truncate = self.truncate
+        self.pending = []
+        self.truncate = False
+        return data, truncate
+    def compacted(self, size):
+        # Снимок текста заменяет все записи, в том числе ещё не записанные
+        self.pending = []
+        self.truncate = False
+        self.size = size
+        self.needsCompaction = False
+    def reset(self):
+        self.header = None
+        self.pending = []
+        self.truncate = False
+        self.size = 0
+        self.needsCompaction = False
+
+def writeJournal(path, data, truncate=False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb' if truncate else 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+def compactJournal(path, header, text):
+    # Новый журнал из заголовка и снимка атомарно заменяет старый
+    tempName = path + '.tmp'
+    with open(tempName, 'wb') as f:
+        f.write(_encode(header).encode('utf-8'))
+        f.write(_encode({'snapshot': text}).encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tempName, path)
+
+def removeJournal(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def readJournal(path):
+    # (заголовок, записи); записи до последнего снимка не возвращаются
+    with open(path, 'rb') as f:
+        lines = f.read().split(b'\n')
+    header = json.loads(lines[0])
+    records = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            # Запись оборвалась при сбое: дальше читать нечего
+            break
+        if 'snapshot' in record:
+            records = []
+        records.append(record)
+    return header, records
+
+def _processAlive(pid):
+    if os.name != 'posix':
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def findJournals(directory=None):
+    # Журналы завершившихся процессов. Вызывается до того, как текущий процесс
+    # что-то записал, поэтому журнал с его номером остался от прежнего процесса
+    directory = directory or RECOVERY_DIR
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return []
+    result = []
+    for name in names:
+        if not name.endswith(SUFFIX):
+            continue
+        pid = name.split('-', 1)[0]
+        if pid.isdigit() and int(pid) != os.getpid() and _processAlive(int(pid)):
+            continue
+        result.append(os.path.join(directory, name))
+    return result
@@ -1,10 +1,91 @@
+import time
+# Отсчёт для --profile-startup начинается до импорта PyQt5
+STARTUP_STARTED = time.perf_counter()
+import io
+import mmap
+import operator
+import os
+import queue
+import re
+import stat
 import sys
+import threading
+from array import array
+from itertools import accumulate, count
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QPlainTextEdit, QSplitter, QAction, QFileDialog,
-    QMessageBox, QToolBar, QWidget, QVBoxLayout, QTextEdit, QDialog, QDialogButtonBox
+    QMessageBox, QToolBar, QWidget, QVBoxLayout, QTextEdit, QDialog, QDialogButtonBox,
+    QProgressBar, QPushButton, QScrollBar, QHBoxLayout, QInputDialog, QMenu, QTabBar,
+    QPlainTextDocumentLayout, QLineEdit, QCheckBox, QLabel
 )
-from PyQt5.QtGui import QPainter, QTextFormat, QColor, QIcon, QKeyEvent, QFont
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import (
+    QPainter, QTextFormat, QColor, QIcon, QKeySequence, QFont, QTextCursor, QTextCharFormat,
+    QTextLayout, QTextBlockUserData, QStaticText, QTextDocument, QDragLeaveEvent
+)
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QObject, QFile, QFileSystemWatcher, pyqtSignal
+from charset import (SAVE_ENCODINGS, UTF8, TextEncoding, decodeAppended, encodingName, newlineName, openReader,
+                     openWriter, readText, sniffFile, utf16Length)
+from analyzer import IncrementalAnalyzer, analyzeRange, scanLine, LEX_NORMAL
+from history import EditHistory
+from journal import (Journal, baseChanged, baseHeader, compactJournal, findJournals, readJournal,
+                     removeJournal, writeJournal)
+from search import MatchIndex, astralPositions, compilePattern, findMatches, replaceAll, utf16Offset
+try:
+    # Иконки, собранные в один ресурсный модуль (python icons/build_resources.py)
+    import icons_rc
+except ImportError:
+    icons_rc = None
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
+_iconCache = {}
+
+def loadIcon(name):
+    # Без ресурсного модуля иконки берутся из каталога программы, а не из текущего
+    icon = _iconCache.get(name)
+    if icon is None:
+        path = f':/icons/{name}.png'
+        if not QFile.exists(path):
+            path = os.path.join(ICON_DIR, name + '.png')
+        icon = _iconCache[name] = QIcon(path)
+    return icon
+
+# Файлы больше этого размера загружаются с индикатором прогресса в строке состояния
+PROGRESS_THRESHOLD = 4 * 1024 * 1024
+# Файлы больше этого размера предлагается открыть в режиме просмотра
+VIEWER_THRESHOLD = 512 * 1024 * 1024
+# Сколько подготовленных номеров строк хранит панель нумерации
+NUMBER_CACHE_SIZE = 4096
+# Сколько сообщений анализатора выводится в область результатов
+MAX_SHOWN_DIAGNOSTICS = 1000
+# Сколько последних прочитанных байтов файла сверяется, чтобы отличить
+# дописывание в конец от перезаписи файла другой программой
+FILE_TAIL_CHECK = 4096
+# Дописанное больше этого размера загружается заново целиком, в фоне
+APPEND_LIMIT = 16 * 1024 * 1024
+# Форматы дополнительных выделений создаются один раз
+CURRENT_LINE_FORMAT = QTextCharFormat()
+CURRENT_LINE_FORMAT.setBackground(QColor(Qt.yellow).lighter(160))
+CURRENT_LINE_FORMAT.setProperty(QTextFormat.FullWidthSelection, True)
+MATCH_FORMAT = QTextCharFormat()
+MATCH_FORMAT.setBackground(QColor('#ffd27f'))
+DIAGNOSTIC_FORMAT = QTextCharFormat()
+DIAGNOSTIC_FORMAT.setUnderlineStyle(QTextCharFormat.SpellCheckUnderline)
+DIAGNOSTIC_FORMAT.setUnderlineColor(QColor(Qt.red))
+
+class BackgroundExecutor:
+    # Однопоточный исполнитель, создаваемый при первой задаче: concurrent.futures
+    # (а с ним и logging) не импортируется при запуске программы
+    def __init__(self):
+        self.executor = None
+    def submit(self, fn, *args):
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        return self.executor.submit(fn, *args)
+    def shutdown(self, wait=False):
+        # wait=True дожидается уже поставленных задач, иначе они отменяются
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait, cancel_futures=not wait)
 
 class LineNumberArea(QWidget):
     def __init__(self, editor):
@@ -15,6 +96,221 @@ class LineNumberArea(QWidget):
     def paintEvent(self, event):
         self.codeEditor.lineNumberAreaPaintEvent(event)
 
+class DocumentLoader:
+    # Читает файл порциями в фоновом потоке; очередь ограничена, чтобы в памяти
+    # не накапливалось больше нескольких порций сверх самого документа.
+    # Кодировка и перевод строки определяются по началу файла. Порция вставляется
+    # в документ кусками по INSERT_SIZE символов, чтобы один проход таймера
+    # укладывался в отведённое время
+    CHUNK_SIZE = 256 * 1024
+    INSERT_SIZE = 8 * 1024
+    QUEUE_SIZE = 8
+    def __init__(self, filename, encoding=None):
+        self.filename = filename
+        detected, self.newline = sniffFile(filename)
+        self.encoding = encoding or detected
+        self.totalBytes = os.path.getsize(filename)
+        self.bytesRead = 0
+        self.error = None
+        # Ещё не вставленная часть полученной порции
+        self.pending = ''
+        self.pendingOffset = 0
+        self.chunks = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+    def start(self):
+        self.thread.start()
+    def cancel(self):
+        self.cancelled.set()
+    def _run(self):
+        try:
+            with open(self.filename, 'rb') as raw:
+                text = openReader(raw, self.encoding)
+                while not self.cancelled.is_set():
+                    chunk = text.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    self.bytesRead = raw.tell()
+                    self._put(chunk)
+                text.detach()
+        except Exception as e:
+            self.error = e
+        self._put(None)
+    def _put(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+class DocumentSaver:
+    # Блоки документа обходятся в потоке интерфейса и порциями передаются потоку записи;
+    # запись идёт во временный файл, который после fsync атомарно заменяет целевой
+    CHUNK_SIZE = 256 * 1024
+    QUEUE_SIZE = 8
+    END = object()
+    def __init__(self, document, filename, encoding=UTF8, newline='\n'):
+        self.filename = os.path.realpath(filename)
+        self.encoding = encoding
+        self.block = document.begin()
+        self.totalBlocks = document.blockCount()
+        self.blocksWritten = 0
+        self.pending = None
+        self.allQueued = False
+        self.error = None
+        self.chunks = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.cancelled = threading.Event()
+        try:
+            self.mode = stat.S_IMODE(os.stat(self.filename).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            self.mode = 0o666 & ~umask
+        self.directory, name = os.path.split(self.filename)
+        import tempfile
+        fd, self.tempName = tempfile.mkstemp(prefix='.' + name + '.', suffix='.tmp', dir=self.directory)
+        self.file = openWriter(io.open(fd, 'wb'), encoding, newline)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+    def start(self):
+        self.thread.start()
+    def cancel(self):
+        self.cancelled.set()
+    def isFinished(self):
+        return self.allQueued and not self.thread.is_alive()
+    def feed(self, deadline=None):
+        # Без deadline отдаёт весь документ, блокируясь на заполненной очереди
+        while not self.allQueued:
+            if self.pending is None:
+                chunk = self._nextChunk()
+                self.pending = self.END if chunk is None else chunk
+            try:
+                self.chunks.put(self.pending, block=deadline is None)
+            except queue.Full:
+                return False
+            self.allQueued = self.pending is self.END
+            self.pending = None
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        return self.allQueued
+    def _nextChunk(self):
+        if not self.block.isValid():
+            return None
+        parts = []
+        size = 0
+        while self.block.isValid() and size < self.CHUNK_SIZE:
+            text = self.block.text()
+            self.block = self.block.next()
+            parts.append(text)
+            if self.block.isValid():
+                parts.append('\n')
+            size += len(text) + 1
+            self.blocksWritten += 1
+        return ''.join(parts)
+    def _run(self):
+        while not self.cancelled.is_set():
+            try:
+                item = self.chunks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is self.END:
+                break
+            if self.error is None:
+                try:
+                    self.file.write(item)
+                except Exception as e:
+                    self.error = e
+        try:
+            if self.error is None and not self.cancelled.is_set():
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.file.close()
+                os.chmod(self.tempName, self.mode)
+                os.replace(self.tempName, self.filename)
+                self._syncDirectory()
+                return
+        except Exception as e:
+            self.error = e
+        try:
+            self.file.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self.tempName)
+        except OSError:
+            pass
+    def _syncDirectory(self):
+        if os.name != 'posix':
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+class SelectionLayers(QObject):
+    # Дополнительные выделения редактора по слоям: текущая строка, диагностика, поиск.
+    # Слои объединяются в один вызов setExtraSelections не чаще раза за проход цикла
+    # событий; если слои не менялись и курсор остался в той же экранной строке (для
+    # перенесённого абзаца - в той же части абзаца), вызова нет вовсе
+    LAYERS = ('diagnostics', 'search')
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.layers = dict.fromkeys(self.LAYERS, [])
+        self.currentLine = QTextEdit.ExtraSelection()
+        self.currentLine.format = CURRENT_LINE_FORMAT
+        self.currentLineKey = None
+        self.dirty = True
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.apply)
+    def layer(self, name):
+        return self.layers[name]
+    def setLayer(self, name, selections):
+        self.layers[name] = selections
+        self.invalidate()
+    def invalidate(self):
+        self.dirty = True
+        self.schedule()
+    def schedule(self):
+        if not self.timer.isActive():
+            self.timer.start()
+    def visibleRange(self):
+        # Позиции начала первого и конца последнего видимого блока
+        editor = self.editor
+        block = editor.firstVisibleBlock()
+        start = block.position()
+        bottom = editor.viewport().height()
+        offset = editor.contentOffset()
+        while block.isValid() and editor.blockBoundingGeometry(block).translated(offset).top() <= bottom:
+            block = block.next()
+        end = block.position() if block.isValid() else editor.document().characterCount()
+        return start, end
+    def apply(self):
+        editor = self.editor
+        cursor = None if editor.isReadOnly() else editor.textCursor()
+        key = None
+        if cursor is not None:
+            # Номер блока и номер экранной строки внутри него
+            block = cursor.block()
+            line = block.layout().lineForTextPosition(cursor.positionInBlock())
+            key = block.blockNumber(), line.lineNumber() if line.isValid() else 0
+        if not self.dirty and key == self.currentLineKey:
+            return
+        self.dirty = False
+        self.currentLineKey = key
+        selections = []
+        if cursor is not None:
+            # Выделение на всю ширину закрашивает экранную строку, где стоит курсор
+            cursor.clearSelection()
+            self.currentLine.cursor = cursor
+            selections.append(self.currentLine)
+        for name in self.LAYERS:
+            selections.extend(self.layers[name])
+        editor.setExtraSelections(selections)
+
 class CodeEditor(QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -22,24 +318,182 @@ class CodeEditor(QPlainTextEdit):
         self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
         self.updateRequest.connect(self.updateLineNumberArea)
         self.cursorPositionChanged.connect(self.highlightCurrentLine)
+        self.lineNumberOffset = 0
+        self.maxLineNumber = None
+        self.digitWidth = None
+        self.gutterWidth = 0
+        self.numberCache = {}
+        self.updateLineNumberAreaWidth(0)
+        # Отмена и повтор идут через собственную историю правок, стек QTextDocument не нужен
+        self.setUndoRedoEnabled(False)
+        self.history = EditHistory()
+        self.trackHistory = True
+        self.applyingEdit = False
+        self.highlighter = None
+        self.selectionLayers = SelectionLayers(self)
+        self.document().contentsChange.connect(self._onContentsChange)
+    def attachDocument(self, document, history):
+        # Редактор один на все вкладки: при переключении подменяются документ и его история
+        self.document().contentsChange.disconnect(self._onContentsChange)
+        self.setDocument(document)
+        self.setUndoRedoEnabled(False)
+        self.history = history
+        document.contentsChange.connect(self._onContentsChange)
         self.updateLineNumberAreaWidth(0)
-        self.setUndoRedoEnabled(True)
-        self.lastKeyEvent = None
+        self.selectionLayers.invalidate()
     def keyPressEvent(self, event):
-        if event.text() != "" or event.key() in (Qt.Key_Backspace, Qt.Key_Delete):
-            self.lastKeyEvent = QKeyEvent(event.type(), event.key(), event.modifiers(),
-                                          event.text(), event.isAutoRepeat(), event.count())
+        if self.isReadOnly():
+            super().keyPressEvent(event)
+            return
+        for sequence, handler in ((QKeySequence.Undo, self.undo), (QKeySequence.Redo, self.redo),
+                                  (QKeySequence.Cut, self.cut), (QKeySequence.Paste, self.paste)):
+            if event.matches(sequence):
+                handler()
+                return
+        key = event.key()
+        cursor = self.textCursor()
+        if key in (Qt.Key_Backspace, Qt.Key_Delete):
+            if not cursor.hasSelection():
+                wordwise = event.modifiers() & Qt.ControlModifier
+                if key == Qt.Key_Backspace:
+                    move = QTextCursor.PreviousWord if wordwise else QTextCursor.PreviousCharacter
+                else:
+                    move = QTextCursor.NextWord if wordwise else QTextCursor.NextCharacter
+                cursor.movePosition(move, QTextCursor.KeepAnchor)
+            self.replaceSelection(cursor, '', typing=True)
+            return
+        text = '\n' if key in (Qt.Key_Return, Qt.Key_Enter) else event.text()
+        modifiers = event.modifiers() & (Qt.ControlModifier | Qt.AltModifier)
+        if text and (text.isprintable() or text in '\n\t') and modifiers != Qt.ControlModifier:
+            self.replaceSelection(cursor, text, typing=True)
+            self.ensureCursorVisible()
+            return
         super().keyPressEvent(event)
+    def contextMenuEvent(self, event):
+        # Стандартное меню правит документ в обход истории
+        menu = QMenu(self)
+        readOnly = self.isReadOnly()
+        hasSelection = self.textCursor().hasSelection()
+        for title, handler, enabled in (("Отменить", self.undo, self.history.canUndo() and not readOnly),
+                                        ("Повторить", self.redo, self.history.canRedo() and not readOnly),
+                                        (None, None, False),
+                                        ("Вырезать", self.cut, hasSelection and not readOnly),
+                                        ("Копировать", self.copy, hasSelection),
+                                        ("Вставить", self.paste, self.canPaste() and not readOnly),
+                                        ("Удалить", self.deleteSelection, hasSelection and not readOnly),
+                                        (None, None, False),
+                                        ("Выделить все", self.selectAll, True)):
+            if title is None:
+                menu.addSeparator()
+                continue
+            menu.addAction(title, handler).setEnabled(enabled)
+        menu.exec_(event.globalPos())
+    def replaceSelection(self, cursor, text, typing=False):
+        start, end = cursor.selectionStart(), cursor.selectionEnd()
+        if start == end and not text:
+            return
+        self.replaceRange(start, end, text, typing)
+    def replaceRange(self, start, end, text, typing=False):
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        removed = cursor.selectedText().replace('\u2029', '\n')
+        if self.trackHistory:
+            self.history.record(start, removed, text, typing)
+        self._applyEdit(cursor, text)
+    def _applyEdit(self, cursor, text):
+        self.applyingEdit = True
+        try:
+            if text:
+                cursor.insertText(text)
+            else:
+                cursor.removeSelectedText()
+        finally:
+            self.applyingEdit = False
+        self.setTextCursor(cursor)
+    def _onContentsChange(self, position, removed, added):
+        if self.applyingEdit or not self.trackHistory or (self.highlighter is not None and self.highlighter.formatting):
+            return
+        # Правка в обход replaceRange (ввод через метод ввода, перетаскивание):
+        # вставку можно записать, а удалённый текст уже не восстановить
+        if removed == 0 and added > 0:
+            # added может учитывать завершающий разделитель абзаца документа
+            end = min(position + added, self.document().characterCount() - 1)
+            if end <= position:
+                return
+            cursor = QTextCursor(self.document())
+            cursor.setPosition(position)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            self.history.record(position, '', cursor.selectedText().replace('\u2029', '\n'))
+        elif removed or added:
+            self.history.clear()
+    def undo(self):
+        # Правка снимается со стека, только если её можно применить
+        if not self.isReadOnly() and self.history.canUndo():
+            self._replay(self.history.undo())
+    def redo(self):
+        if not self.isReadOnly() and self.history.canRedo():
+            self._replay(self.history.redo())
+    def _replay(self, edits):
+        for position, length, text in edits:
+            cursor = QTextCursor(self.document())
+            cursor.setPosition(position)
+            cursor.setPosition(position + length, QTextCursor.KeepAnchor)
+            self._applyEdit(cursor, text)
+        self.document().setModified(not self.history.isClean())
+        self.ensureCursorVisible()
+    def cut(self):
+        cursor = self.textCursor()
+        if cursor.hasSelection() and not self.isReadOnly():
+            self.copy()
+            self.replaceSelection(cursor, '')
+    def deleteSelection(self):
+        cursor = self.textCursor()
+        if cursor.hasSelection() and not self.isReadOnly():
+            self.replaceSelection(cursor, '')
+    def insertFromMimeData(self, source):
+        if source.hasText() and not self.isReadOnly():
+            self.replaceSelection(self.textCursor(), source.text())
+            self.ensureCursorVisible()
+    def dropEvent(self, event):
+        # Перетаскивание тоже правит документ через replaceRange; перенос внутри
+        # редактора (удаление и вставка) отменяется одним шагом
+        source = event.mimeData()
+        if self.isReadOnly() or not source.hasText():
+            super().dropEvent(event)
+            return
+        position = self.cursorForPosition(event.pos()).position()
+        selection = self.textCursor()
+        start, end = selection.selectionStart(), selection.selectionEnd()
+        move = event.source() is self and event.dropAction() == Qt.MoveAction
+        event.acceptProposedAction()
+        # Стандартная обработка убирает курсор-указатель места вставки
+        super().dragLeaveEvent(QDragLeaveEvent())
+        if event.source() is self and start <= position <= end:
+            return
+        text = source.text()
+        self.history.beginGroup()
+        if move:
+            self.replaceRange(start, end, '')
+            if position > end:
+                position -= end - start
+        self.replaceRange(position, position, text)
+        self.history.endGroup()
+        cursor = self.textCursor()
+        cursor.setPosition(position)
+        cursor.setPosition(position + utf16Length(text), QTextCursor.KeepAnchor)
+        self.setTextCursor(cursor)
+        self.setFocus()
     def lineNumberAreaWidth(self):
-        digits = 1
-        max_lines = max(1, self.blockCount())
-        while max_lines >= 10:
-            max_lines //= 10
-            digits += 1
-        space = 3 + self.fontMetrics().width('9') * digits
-        return space
+        if self.digitWidth is None:
+            self.digitWidth = self.fontMetrics().width('9')
+        digits = len(str(max(1, self.maxLineNumber or self.blockCount())))
+        return 3 + self.digitWidth * digits
     def updateLineNumberAreaWidth(self, _):
-        self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
+        width = self.lineNumberAreaWidth()
+        if width != self.gutterWidth:
+            self.gutterWidth = width
+            self.setViewportMargins(width, 0, 0, 0)
     def updateLineNumberArea(self, rect, dy):
         if dy:
             self.lineNumberArea.scroll(0, dy)
@@ -47,64 +501,892 @@ class CodeEditor(QPlainTextEdit):
             self.lineNumberArea.update(0, rect.y(), self.lineNumberArea.width(), rect.height())
         if rect.contains(self.viewport().rect()):
             self.updateLineNumberAreaWidth(0)
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self.digitWidth = None
+            self.numberCache.clear()
+            self.updateLineNumberAreaWidth(0)
     def resizeEvent(self, event):
         super().resizeEvent(event)
         cr = self.contentsRect()
         self.lineNumberArea.setGeometry(cr.left(), cr.top(), self.lineNumberAreaWidth(), cr.height())
     def highlightCurrentLine(self):
-        extraSelections = []
-        if not self.isReadOnly():
-            selection = QTextEdit.ExtraSelection()
-            lineColor = QColor(Qt.yellow).lighter(160)
-            selection.format.setBackground(lineColor)
-            selection.format.setProperty(QTextFormat.FullWidthSelection, True)
-            selection.cursor = self.textCursor()
-            selection.cursor.clearSelection()
-            extraSelections.append(selection)
-        self.setExtraSelections(extraSelections)
+        self.selectionLayers.schedule()
     def lineNumberAreaPaintEvent(self, event):
         painter = QPainter(self.lineNumberArea)
-        painter.fillRect(event.rect(), Qt.lightGray)
+        rect = event.rect()
+        painter.fillRect(rect, Qt.lightGray)
+        painter.setPen(Qt.black)
+        right = self.lineNumberArea.width() - 2
+        rectTop = rect.top()
+        rectBottom = rect.bottom()
+        cache = self.numberCache
         block = self.firstVisibleBlock()
-        blockNumber = block.blockNumber()
+        blockNumber = block.blockNumber() + self.lineNumberOffset
         top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
         bottom = top + int(self.blockBoundingRect(block).height())
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(blockNumber + 1)
-                painter.setPen(Qt.black)
-                painter.drawText(0, top, self.lineNumberArea.width()-2, self.fontMetrics().height(),
-                                 Qt.AlignRight, number)
+        while block.isValid() and top <= rectBottom:
+            if block.isVisible() and bottom >= rectTop:
+                number = cache.get(blockNumber)
+                if number is None:
+                    if len(cache) >= NUMBER_CACHE_SIZE:
+                        cache.clear()
+                    text = str(blockNumber + 1)
+                    number = cache[blockNumber] = (QStaticText(text), self.digitWidth * len(text))
+                painter.drawStaticText(right - number[1], top, number[0])
             block = block.next()
             top = bottom
             bottom = top + int(self.blockBoundingRect(block).height())
             blockNumber += 1
 
+class DocumentSnapshot(QObject):
+    # Копия текста документа, которая снимается в потоке интерфейса небольшими
+    # кусками по таймеру, чтобы не останавливать ввод на больших файлах. Правка
+    # документа во время снятия должна отменять снимок (cancel)
+    CHUNK = 1024 * 1024
+    SLICE = 0.01
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+        self.document = None
+        self.parts = None
+        self.position = 0
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._take)
+    @staticmethod
+    def text(parts):
+        # selectedText() разделяет абзацы символом U+2029, длина при замене не меняется
+        return ''.join(parts).replace('\u2029', '\n')
+    def isRunning(self):
+        return self.timer.isActive()
+    def start(self, document):
+        if self.isRunning() and document is self.document:
+            return
+        self.cancel()
+        self.document = document
+        self.parts = []
+        self.timer.start()
+    def cancel(self):
+        self.timer.stop()
+        self.parts = None
+        self.position = 0
+    def _take(self):
+        end = self.document.characterCount() - 1
+        cursor = QTextCursor(self.document)
+        deadline = time.perf_counter() + self.SLICE
+        while self.position < end and time.perf_counter() < deadline:
+            stop = min(end, self.position + self.CHUNK)
+            # Суррогатная пара (символ вне BMP) не разрезается между кусками
+            if stop < end and '\ud800' <= self.document.characterAt(stop - 1) <= '\udbff':
+                stop -= 1
+            cursor.setPosition(self.position)
+            cursor.setPosition(stop, QTextCursor.KeepAnchor)
+            self.parts.append(cursor.selectedText())
+            self.position = stop
+        if self.position < end:
+            return
+        parts = self.parts
+        self.cancel()
+        self.callback(parts)
+
+class DocumentSearch(QObject):
+    # Поиск по снимку документа в фоновом потоке: вхождения приходят порциями
+    # и складываются в индекс. Правка текста делает индекс устаревшим
+    # (generation), и поиск перезапускается после паузы во вводе.
+    RESTART_DELAY = 300
+    matchesChanged = pyqtSignal(int, bool)
+    replaceFinished = pyqtSignal(object)
+    _batchReady = pyqtSignal(object)
+    _replaceReady = pyqtSignal(object)
+    def __init__(self, document, parent=None):
+        super().__init__(parent)
+        self.document = document
+        self.index = MatchIndex()
+        self.pattern = None
+        self.generation = 0
+        self.finished = True
+        self.formatGuard = None
+        self.searchPending = False
+        self.replacePending = None
+        self.snapshot = DocumentSnapshot(self._submitSnapshot, self)
+        self.executor = BackgroundExecutor()
+        self.restartTimer = QTimer(self)
+        self.restartTimer.setSingleShot(True)
+        self.restartTimer.setInterval(self.RESTART_DELAY)
+        self.restartTimer.timeout.connect(lambda: self.search(self.pattern))
+        document.contentsChange.connect(self._onContentsChange)
+        self._batchReady.connect(self._applyBatch)
+        self._replaceReady.connect(self._applyReplace)
+    def setDocument(self, document):
+        self.document.contentsChange.disconnect(self._onContentsChange)
+        self.document = document
+        document.contentsChange.connect(self._onContentsChange)
+        self.replacePending = None
+        self.search(self.pattern)
+    def shutdown(self):
+        self.generation += 1
+        self.snapshot.cancel()
+        self.executor.shutdown()
+    def search(self, pattern):
+        self.restartTimer.stop()
+        self.snapshot.cancel()
+        self.pattern = pattern
+        self.generation += 1
+        self.index.clear()
+        self.finished = pattern is None
+        self.searchPending = pattern is not None
+        if pattern is None:
+            self.replacePending = None
+        else:
+            self.snapshot.start(self.document)
+        self.matchesChanged.emit(0, self.finished)
+    def replaceAll(self, replacement, regex):
+        # Замена считается по тому же снимку, что и поиск
+        if self.pattern is None:
+            return
+        self.replacePending = replacement, regex
+        if not self.restartTimer.isActive():
+            self.snapshot.start(self.document)
+    def _submitSnapshot(self, parts):
+        self.executor.submit(self._work, self.generation, parts, self.pattern,
+                             self.searchPending, self.replacePending)
+        self.searchPending = False
+    def _onContentsChange(self, position, removed, added):
+        if self.formatGuard is not None and self.formatGuard.formatting:
+            return
+        if self.pattern is None or not (removed or added):
+            return
+        self.snapshot.cancel()
+        self.generation += 1
+        self.index.clear()
+        self.finished = False
+        self.searchPending = False
+        self.matchesChanged.emit(0, False)
+        self.restartTimer.start()
+    def _work(self, generation, parts, pattern, searching, replace):
+        text = DocumentSnapshot.text(parts)
+        del parts
+        if searching:
+            for starts, ends in findMatches(text, pattern, lambda: generation != self.generation):
+                self._batchReady.emit((generation, starts, ends))
+            self._batchReady.emit((generation, None, None))
+        if replace is not None and generation == self.generation:
+            try:
+                result = replaceAll(text, pattern, *replace)
+            except (re.error, IndexError) as e:
+                result = e
+            self._replaceReady.emit((generation, replace, result))
+    def _applyBatch(self, result):
+        generation, starts, ends = result
+        if generation != self.generation:
+            return
+        if starts is None:
+            self.finished = True
+        else:
+            self.index.extend(starts, ends)
+        self.matchesChanged.emit(self.index.count(), self.finished)
+    def _applyReplace(self, result):
+        generation, replace, result = result
+        if replace is not self.replacePending:
+            return
+        # Текст изменился, пока готовилась замена: её посчитают по новому снимку
+        if generation != self.generation and not isinstance(result, Exception):
+            return
+        self.replacePending = None
+        self.replaceFinished.emit(result)
+
+class FindBar(QWidget):
+    closed = pyqtSignal()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.findEdit = QLineEdit()
+        self.findEdit.setPlaceholderText("Найти")
+        self.replaceEdit = QLineEdit()
+        self.replaceEdit.setPlaceholderText("Заменить на")
+        self.regexBox = QCheckBox("Регулярное выражение")
+        self.caseBox = QCheckBox("Учитывать регистр")
+        self.countLabel = QLabel()
+        self.previousButton = QPushButton("Назад")
+        self.nextButton = QPushButton("Далее")
+        self.replaceButton = QPushButton("Заменить")
+        self.replaceAllButton = QPushButton("Заменить все")
+        self.closeButton = QPushButton("Закрыть")
+        self.closeButton.clicked.connect(self.closed)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(4, 2, 4, 2)
+        for widget in (self.findEdit, self.previousButton, self.nextButton, self.replaceEdit,
+                       self.replaceButton, self.replaceAllButton, self.regexBox, self.caseBox,
+                       self.countLabel):
+            layout.addWidget(widget)
+        layout.addStretch()
+        layout.addWidget(self.closeButton)
+        self.setLayout(layout)
+    def setReplaceVisible(self, visible):
+        for widget in (self.replaceEdit, self.replaceButton, self.replaceAllButton):
+            widget.setVisible(visible)
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.closed.emit()
+            return
+        super().keyPressEvent(event)
+
+class LineIndex:
+    # Смещения начала строк в отображённом файле; 4 байта на строку, если файл меньше 4 ГБ
+    SCAN_SIZE = 4 * 1024 * 1024
+    MAX_LINE_BYTES = 64 * 1024
+    def __init__(self, mm, encoding=UTF8):
+        # Строки делятся по байту '\n', поэтому кодировка должна быть однобайтовой или UTF-8
+        self.mm = mm
+        self.size = len(mm)
+        self.codec = encoding.codec
+        self.starts = array('I' if self.size < 2 ** 32 else 'Q', [len(encoding.bom)])
+        self.complete = False
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._build, daemon=True)
+    def start(self):
+        self.thread.start()
+    def cancel(self):
+        self.cancelled.set()
+        self.thread.join()
+    def _build(self):
+        pos = self.starts[0]
+        while pos < self.size and not self.cancelled.is_set():
+            chunk = self.mm[pos:pos + self.SCAN_SIZE]
+            parts = chunk.split(b'\n')
+            parts.pop()
+            # Начало следующей строки = позиция '\n' + 1
+            self.starts.extend(map(operator.add, accumulate(map(len, parts)), count(pos + 1)))
+            pos += len(chunk)
+        self.complete = True
+    def lineCount(self):
+        return len(self.starts)
+    def line(self, number):
+        start = self.starts[number]
+        if number + 1 < len(self.starts):
+            end = self.starts[number + 1] - 1
+        else:
+            end = self.size
+        data = self.mm[start:min(end, start + self.MAX_LINE_BYTES)]
+        if data.endswith(b'\r'):
+            data = data[:-1]
+        return data.decode(self.codec, errors='replace')
+
+class LargeFileView(QWidget):
+    indexingFinished = pyqtSignal(int)
+    def __init__(self, filename, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+        self.encoding, self.newline = sniffFile(filename)
+        self.file = open(filename, 'rb')
+        try:
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        self.index = LineIndex(self.mm, self.encoding)
+        self.firstLine = 0
+        self.shownLines = 0
+        self.wheelDelta = 0
+        self.editor = CodeEditor()
+        self.editor.setReadOnly(True)
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.editor.installEventFilter(self)
+        self.editor.viewport().installEventFilter(self)
+        self.scrollBar = QScrollBar(Qt.Vertical)
+        self.scrollBar.valueChanged.connect(self.scrollToLine)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.editor)
+        layout.addWidget(self.scrollBar)
+        self.setLayout(layout)
+        self.indexTimer = QTimer(self)
+        self.indexTimer.setInterval(100)
+        self.indexTimer.timeout.connect(self._updateRange)
+    def start(self):
+        self.index.start()
+        self.indexTimer.start()
+    def closeFile(self):
+        self.indexTimer.stop()
+        self.index.cancel()
+        self.mm.close()
+        self.file.close()
+    def visibleLineCount(self):
+        return self.editor.viewport().height() // max(1, self.editor.fontMetrics().height()) + 1
+    def goToLine(self, number):
+        self.scrollBar.setValue(number)
+        self.scrollToLine(self.scrollBar.value())
+    def scrollToLine(self, first):
+        total = self.index.lineCount()
+        last = min(total, first + self.visibleLineCount())
+        self.firstLine = first
+        self.shownLines = last - first
+        self.editor.lineNumberOffset = first
+        self.editor.setPlainText('\n'.join(self.index.line(i) for i in range(first, last)))
+        self.editor.lineNumberArea.update()
+    def _updateRange(self):
+        total = self.index.lineCount()
+        visible = self.visibleLineCount()
+        self.editor.maxLineNumber = total
+        self.editor.updateLineNumberAreaWidth(0)
+        self.scrollBar.setPageStep(visible)
+        self.scrollBar.setRange(0, max(0, total - visible))
+        if self.shownLines < visible:
+            self.scrollToLine(self.scrollBar.value())
+        if self.index.complete:
+            self.indexTimer.stop()
+            self.indexingFinished.emit(total)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._updateRange()
+        self.scrollToLine(self.scrollBar.value())
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel:
+            # Трекпад присылает доли шага колеса (меньше 120): они копятся до целого шага
+            self.wheelDelta += event.angleDelta().y()
+            steps = int(self.wheelDelta / 120)
+            self.wheelDelta -= steps * 120
+            self.scrollBar.setValue(self.scrollBar.value() - steps * self.scrollBar.singleStep() * 3)
+            return True
+        if event.type() == QEvent.KeyPress and obj is self.editor:
+            key = event.key()
+            page = self.scrollBar.pageStep()
+            moves = {Qt.Key_Up: -1, Qt.Key_Down: 1, Qt.Key_PageUp: -page, Qt.Key_PageDown: page}
+            if key in moves:
+                self.scrollBar.setValue(self.scrollBar.value() + moves[key])
+                return True
+            if event.modifiers() & Qt.ControlModifier and key in (Qt.Key_Home, Qt.Key_End):
+                self.scrollBar.setValue(self.scrollBar.minimum() if key == Qt.Key_Home else self.scrollBar.maximum())
+                return True
+        return super().eventFilter(obj, event)
+
+class SyntaxAnalyzer(QObject):
+    # Инкрементальный анализ документа: правки отмечаются по contentsChange, при запуске
+    # тексты изменённых строк порциями передаются в фоновый поток, а результат
+    # (состояние лексера - в QTextBlock.userState) применяется в потоке интерфейса
+    FIRST_BATCH = 256
+    MAX_BATCH = 8192
+    analysisFinished = pyqtSignal(list)
+    _batchReady = pyqtSignal(object)
+    def __init__(self, document, parent=None):
+        super().__init__(parent)
+        self.document = document
+        self.engine = self.newEngine(document)
+        self.blockCount = document.blockCount()
+        self.diagnostics = []
+        self.running = False
+        self.requested = False
+        self.formatGuard = None
+        self.batchLines = self.FIRST_BATCH
+        self.executor = BackgroundExecutor()
+        document.contentsChange.connect(self._onContentsChange)
+        self._batchReady.connect(self._applyBatch)
+    @staticmethod
+    def newEngine(document):
+        engine = IncrementalAnalyzer()
+        engine.replaceLines(0, 1, document.blockCount())
+        return engine
+    def setDocument(self, document, engine):
+        # Анализатор и его поток общие для всех вкладок, состояние анализа (engine) - у каждой своё
+        self.document.contentsChange.disconnect(self._onContentsChange)
+        self.document = document
+        self.engine = engine
+        self.blockCount = document.blockCount()
+        self.requested = False
+        document.contentsChange.connect(self._onContentsChange)
+    def shutdown(self):
+        self.executor.shutdown()
+    def _onContentsChange(self, position, removed, added):
+        # Смена форматов подсветкой тоже приходит как contentsChange, но текст не меняет
+        if self.formatGuard is not None and self.formatGuard.formatting:
+            return
+        newCount = self.document.blockCount()
+        first = self.document.findBlock(position).blockNumber()
+        lastBlock = self.document.findBlock(position + added)
+        last = lastBlock.blockNumber() if lastBlock.isValid() else newCount - 1
+        inserted = last - first + 1
+        self.engine.replaceLines(first, inserted - (newCount - self.blockCount), inserted)
+        self.blockCount = newCount
+    def analyze(self):
+        self.batchLines = self.FIRST_BATCH
+        self.requested = True
+        if not self.running:
+            self._scheduleBatch()
+    def _scheduleBatch(self):
+        first = self.engine.nextLine()
+        if first is None:
+            self.running = False
+            self.requested = False
+            lastLength = self.document.lastBlock().length() - 1
+            self.diagnostics = self.engine.collect(lastLength)
+            self.analysisFinished.emit(self.diagnostics)
+            return
+        texts = []
+        block = self.document.findBlockByNumber(first)
+        while block.isValid() and len(texts) < self.batchLines:
+            texts.append(block.text())
+            block = block.next()
+        previous, convergeFrom = self.engine.previousStates(first, len(texts))
+        self.running = True
+        self.executor.submit(self._work, self.engine, self.engine.generation, first, texts,
+                             self.engine.startState(first), previous, convergeFrom)
+        self.batchLines = min(self.batchLines * 4, self.MAX_BATCH)
+    def _work(self, engine, generation, first, texts, state, previous, convergeFrom):
+        states, diagnostics = analyzeRange(texts, state, previous, convergeFrom)
+        self._batchReady.emit((engine, generation, first, states, diagnostics))
+    def _applyBatch(self, result):
+        engine, generation, first, states, diagnostics = result
+        if engine is not self.engine:
+            # Пока шёл анализ, переключили вкладку
+            self.running = False
+            if self.requested:
+                self._scheduleBatch()
+            return
+        # Документ изменился, пока шёл анализ: результат устарел
+        if generation == self.engine.generation:
+            self.engine.apply(first, states, diagnostics)
+            block = self.document.findBlockByNumber(first)
+            for lexState, _ in states:
+                block.setUserState(lexState)
+                block = block.next()
+        self._scheduleBatch()
+
+class HighlightData(QTextBlockUserData):
+    def __init__(self, revision, startState, tokens):
+        super().__init__()
+        self.revision = revision
+        self.startState = startState
+        self.tokens = tokens
+
+def _charFormat(color, italic=False, bold=False, underline=False):
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    fmt.setFontItalic(italic)
+    if bold:
+        fmt.setFontWeight(QFont.Bold)
+    if underline:
+        fmt.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+        fmt.setUnderlineColor(QColor(color))
+    return fmt
+
+class SyntaxHighlighter(QObject):
+    # Форматируются только видимые блоки (и MARGIN_BLOCKS вокруг них). Состояние лексера
+    # на конце блока хранится в userState (-1 - неизвестно); для блоков вне экрана оно
+    # досчитывается по таймеру небольшими порциями, пока не совпадёт с прежним.
+    MARGIN_BLOCKS = 50
+    SLICE_SECONDS = 0.005
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        editor.highlighter = self
+        self.document = editor.document()
+        self.enabled = True
+        self.suspended = False
+        self.formatting = False
+        self.dirtyFrom = 0
+        self.dirtyTo = self.document.blockCount() - 1
+        self.blockCount = self.document.blockCount()
+        self.formats = {
+            'number': _charFormat('#0000c0'),
+            'string': _charFormat('#008000'),
+            'comment': _charFormat('#808080', italic=True),
+            'op': _charFormat('#800000', bold=True),
+            'error': _charFormat('#ff0000', underline=True),
+        }
+        self.visibleTimer = QTimer(self)
+        self.visibleTimer.setSingleShot(True)
+        self.visibleTimer.setInterval(0)
+        self.visibleTimer.timeout.connect(self.highlightVisible)
+        self.backlogTimer = QTimer(self)
+        self.backlogTimer.setInterval(0)
+        self.backlogTimer.timeout.connect(self._processBacklog)
+        self.document.contentsChange.connect(self._onContentsChange)
+        editor.updateRequest.connect(self.scheduleVisible)
+        self.backlogTimer.start()
+    def setEnabled(self, enabled):
+        self.enabled = enabled
+        if enabled:
+            self.scheduleVisible()
+            self._startBacklog()
+            return
+        self.backlogTimer.stop()
+        self._clearFormats()
+    def saveState(self):
+        return self.dirtyFrom, self.dirtyTo
+    def setDocument(self, document, state=None):
+        # Подсветка общая для всех вкладок; state - сохранённый saveState() диапазон
+        # недосчитанных блоков, None - документ ещё не подсвечивался
+        self.document.contentsChange.disconnect(self._onContentsChange)
+        self.document = document
+        document.contentsChange.connect(self._onContentsChange)
+        self.blockCount = document.blockCount()
+        if state is None:
+            state = 0, self.blockCount - 1
+        self.dirtyFrom, self.dirtyTo = state
+        if not self.enabled:
+            self._clearFormats()
+        self.backlogTimer.stop()
+        self._startBacklog()
+        self.scheduleVisible()
+    def _clearFormats(self):
+        block = self.document.begin()
+        while block.isValid():
+            if isinstance(block.userData(), HighlightData):
+                self._applyFormats(block, [])
+                block.setUserData(None)
+            block = block.next()
+    def suspend(self):
+        self.suspended = True
+        self.backlogTimer.stop()
+    def resume(self):
+        self.suspended = False
+        self._startBacklog()
+        self.scheduleVisible()
+    def scheduleVisible(self, *args):
+        if self.enabled and not self.suspended and not self.visibleTimer.isActive():
+            self.visibleTimer.start()
+    def _startBacklog(self):
+        if self.enabled and not self.suspended and self.dirtyFrom is not None:
+            self.backlogTimer.start()
+    def _onContentsChange(self, position, removed, added):
+        if self.formatting:
+            return
+        newCount = self.document.blockCount()
+        block = self.document.findBlock(position)
+        first = block.blockNumber()
+        lastBlock = self.document.findBlock(position + added)
+        last = lastBlock.blockNumber() if lastBlock.isValid() else newCount - 1
+        while block.isValid() and block.blockNumber() <= last:
+            block.setUserState(-1)
+            # Без стека отмены revision() блока не меняется при правке внутри строки,
+            # поэтому кэш затронутых блоков сбрасывается явно
+            data = block.userData()
+            if isinstance(data, HighlightData):
+                data.revision = -1
+            block = block.next()
+        if self.dirtyFrom is None:
+            self.dirtyFrom, self.dirtyTo = first, last
+        else:
+            if first <= self.dirtyTo:
+                self.dirtyTo = max(first, self.dirtyTo + newCount - self.blockCount)
+            self.dirtyFrom = min(self.dirtyFrom, first)
+            self.dirtyTo = max(self.dirtyTo, last)
+        self.blockCount = newCount
+        self._startBacklog()
+        self.scheduleVisible()
+    def _processBacklog(self):
+        if not self.enabled or self.suspended or self.dirtyFrom is None:
+            self.backlogTimer.stop()
+            return
+        deadline = time.perf_counter() + self.SLICE_SECONDS
+        block = self.document.findBlockByNumber(self.dirtyFrom)
+        previous = block.previous()
+        state = previous.userState() if previous.isValid() else LEX_NORMAL
+        if state < 0:
+            state = LEX_NORMAL
+        while block.isValid():
+            _, end, _ = scanLine(block.text(), state)
+            if block.blockNumber() > self.dirtyTo and block.userState() == end:
+                self.dirtyFrom = None
+                break
+            block.setUserState(end)
+            state = end
+            block = block.next()
+            if time.perf_counter() > deadline:
+                break
+        if self.dirtyFrom is not None:
+            self.dirtyFrom = block.blockNumber() if block.isValid() else None
+        if self.dirtyFrom is None:
+            self.backlogTimer.stop()
+        self.scheduleVisible()
+    def highlightVisible(self):
+        if not self.enabled or self.suspended:
+            return
+        editor = self.editor
+        block = editor.firstVisibleBlock()
+        for _ in range(self.MARGIN_BLOCKS):
+            if not block.previous().isValid():
+                break
+            block = block.previous()
+        bottom = editor.viewport().height()
+        offset = editor.contentOffset()
+        below = 0
+        while block.isValid() and below <= self.MARGIN_BLOCKS:
+            self._highlightBlock(block)
+            if editor.blockBoundingGeometry(block).translated(offset).top() > bottom:
+                below += 1
+            block = block.next()
+    def _highlightBlock(self, block):
+        previous = block.previous()
+        startState = previous.userState() if previous.isValid() else LEX_NORMAL
+        known = startState >= 0
+        if not known:
+            # Состояние ещё не досчитано: подсвечиваем предварительно, фон уточнит позже
+            startState = LEX_NORMAL
+        data = block.userData()
+        if isinstance(data, HighlightData) and data.revision == block.revision() and data.startState == startState:
+            return
+        text = block.text()
+        tokens, end, _ = scanLine(text, startState)
+        # Столбцы лексем - в символах строки, а FormatRange считает в единицах UTF-16
+        astral = astralPositions(text)
+        ranges = []
+        for token in tokens:
+            fmt = self.formats.get(token.kind)
+            if fmt is None and token.kind not in ('ident', 'space'):
+                fmt = self.formats['op']
+            if fmt is None:
+                continue
+            formatRange = QTextLayout.FormatRange()
+            formatRange.start = utf16Offset(astral, token.column)
+            formatRange.length = utf16Offset(astral, token.column + len(token.text)) - formatRange.start
+            formatRange.format = fmt
+            ranges.append(formatRange)
+        self._applyFormats(block, ranges)
+        block.setUserData(HighlightData(block.revision(), startState, tokens))
+        if known:
+            block.setUserState(end)
+            # Фон сравнивает новые состояния со старыми: перезаписанные здесь
+            # блоки не должны считаться старыми
+            if self.dirtyFrom is not None and block.blockNumber() >= self.dirtyFrom:
+                self.dirtyTo = max(self.dirtyTo, block.blockNumber())
+    def _applyFormats(self, block, ranges):
+        self.formatting = True
+        try:
+            block.layout().setFormats(ranges)
+            self.document.markContentsDirty(block.position(), block.length())
+        finally:
+            self.formatting = False
+
+class AutosaveService(QObject):
+    # Журнал правок текущего документа для восстановления после сбоя. Правки
+    # копятся в памяти и раз в INTERVAL мс дописываются в файл в фоновом потоке,
+    # так что стоимость записи пропорциональна правке, а не размеру документа.
+    # Когда журнал становится заметно больше документа, он уплотняется: снимок
+    # текста заменяет накопленные правки.
+    INTERVAL = 2000
+    COMPACT_MIN = 4 * 1024 * 1024
+    failed = pyqtSignal(str)
+    def __init__(self, handle, parent=None):
+        super().__init__(parent)
+        self.handle = handle
+        self.document = handle.document
+        self.length = self.document.characterCount() - 1
+        self.formatGuard = None
+        self.suspended = False
+        self.executor = BackgroundExecutor()
+        self.snapshot = DocumentSnapshot(self._compact, self)
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.INTERVAL)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+        self.document.contentsChange.connect(self._onContentsChange)
+    def setHandle(self, handle):
+        self.flush()
+        self.snapshot.cancel()
+        self.document.contentsChange.disconnect(self._onContentsChange)
+        self.handle = handle
+        self.document = handle.document
+        self.length = self.document.characterCount() - 1
+        self.document.contentsChange.connect(self._onContentsChange)
+    def suspend(self):
+        # Загрузка файла в журнал не пишется
+        self.suspended = True
+        self.snapshot.cancel()
+    def resume(self):
+        # После загрузки документ совпадает с файлом: журнал начнётся заново
+        self.suspended = False
+        self.length = self.document.characterCount() - 1
+        self.discard(self.handle.journal)
+    def discard(self, journal):
+        if journal is self.handle.journal:
+            self.snapshot.cancel()
+        if journal.path is not None and journal.isStarted():
+            self._submit(removeJournal, journal.path)
+        journal.reset()
+    def shutdown(self):
+        self.timer.stop()
+        self.snapshot.cancel()
+        self.executor.shutdown(wait=True)
+    def flush(self):
+        journal = self.handle.journal
+        if self.suspended or not journal.isStarted():
+            return
+        if not self.document.isModified():
+            # Документ снова совпадает с сохранённым
+            self.discard(journal)
+            return
+        data, truncate = journal.takePending()
+        if data:
+            self._submit(writeJournal, journal.path, data, truncate)
+        if journal.needsCompaction or journal.size > max(self.COMPACT_MIN, 2 * self.length):
+            self.snapshot.start(self.document)
+    def _onContentsChange(self, position, removed, added):
+        if self.suspended or (self.formatGuard is not None and self.formatGuard.formatting):
+            return
+        # added и removed могут учитывать завершающий разделитель абзаца документа,
+        # поэтому удалённая длина считается по изменению длины документа
+        length = self.document.characterCount() - 1
+        end = min(position + added, length)
+        inserted = ''
+        if end > position:
+            cursor = QTextCursor(self.document)
+            cursor.setPosition(position)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            inserted = cursor.selectedText().replace('\u2029', '\n')
+        # Длины в единицах UTF-16, как позиции курсора при восстановлении
+        removed = max(end - position, 0) - (length - self.length)
+        self.length = length
+        if not removed and not inserted:
+            return
+        journal = self.handle.journal
+        if not journal.isStarted():
+            journal.start(baseHeader(self.handle.path, self.handle.encoding, self.handle.newline))
+        journal.append(position, removed, inserted)
+        # Снимок для уплотнения устарел
+        self.snapshot.cancel()
+    def _compact(self, parts):
+        journal = self.handle.journal
+        if not journal.isStarted():
+            return
+        journal.compacted(self.length)
+        self._submit(self._writeSnapshot, journal.path, journal.header, parts)
+    @staticmethod
+    def _writeSnapshot(path, header, parts):
+        compactJournal(path, header, DocumentSnapshot.text(parts))
+    def _submit(self, fn, *args):
+        self.executor.submit(self._run, fn, args)
+    def _run(self, fn, args):
+        try:
+            fn(*args)
+        except (OSError, ValueError) as e:
+            # ValueError - в том числе UnicodeEncodeError: ошибка в потоке не должна пропасть молча
+            self.failed.emit(str(e))
+
+class DocumentHandle:
+    # Вкладка редактора. У неактивной вкладки текст может быть выгружен (document is None):
+    # тогда при активации он заново загружается с диска, а положение курсора восстанавливается
+    def __init__(self, path=None, document=None):
+        self.path = path
+        self.document = document
+        self.history = EditHistory()
+        self.journal = Journal()
+        self.encoding = UTF8
+        self.newline = '\n'
+        # Какая часть файла на диске уже в документе: размер, время изменения,
+        # последние байты; fileChanged - изменение, замеченное в неактивной вкладке
+        self.fileSize = None
+        self.fileMtime = None
+        self.fileTail = None
+        self.fileChanged = False
+        self.analysis = None
+        self.highlightState = None
+        self.cursorPosition = 0
+        self.scrollValue = 0
+        self.viewer = False
+    def isModified(self):
+        return self.document is not None and self.document.isModified()
+    def displayName(self):
+        return os.path.basename(self.path) if self.path else "Безымянный документ"
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.currentFile = None
-        self.lastAction = None
+        self.documents = []
+        self.currentHandle = None
+        self.loader = None
+        self.saver = None
+        self.largeFileView = None
+        self.timings = None
         self.initUI()
+    @property
+    def currentFile(self):
+        return self.currentHandle.path if self.currentHandle is not None else None
+    @currentFile.setter
+    def currentFile(self, path):
+        self.currentHandle.path = path
     def initUI(self):
         self.setWindowTitle("Лабораторная работа №1: Текстовый редактор")
         self.textEdit = CodeEditor()
-        self.textEdit.document().modificationChanged.connect(self.onModificationChanged)
+        self.highlighter = SyntaxHighlighter(self.textEdit)
+        self.analyzer = SyntaxAnalyzer(self.textEdit.document(), self)
+        self.analyzer.formatGuard = self.highlighter
+        self.analyzer.analysisFinished.connect(self.showDiagnostics)
+        self.search = DocumentSearch(self.textEdit.document(), self)
+        self.search.formatGuard = self.highlighter
+        self.search.matchesChanged.connect(self.onMatchesChanged)
+        self.search.replaceFinished.connect(self.onReplaceFinished)
+        # Первая вкладка получает документ, созданный редактором
+        handle = DocumentHandle(document=self.textEdit.document())
+        handle.document.setParent(self)
+        handle.document.modificationChanged.connect(self.onModificationChanged)
+        handle.history = self.textEdit.history
+        handle.analysis = self.analyzer.engine
+        self.documents.append(handle)
+        self.currentHandle = handle
+        self.autosave = AutosaveService(handle, self)
+        self.autosave.formatGuard = self.highlighter
+        self.autosave.failed.connect(
+            lambda message: self.statusBar().showMessage(f"Ошибка автосохранения: {message}", 5000))
+        self.tabBar = QTabBar()
+        self.tabBar.setTabsClosable(True)
+        self.tabBar.setMovable(True)
+        self.tabBar.setDocumentMode(True)
+        self.tabBar.setExpanding(False)
+        self.tabBar.addTab(handle.displayName())
+        self.tabBar.currentChanged.connect(self.activateDocument)
+        self.tabBar.tabCloseRequested.connect(self.closeDocument)
+        self.tabBar.tabMoved.connect(self.onTabMoved)
+        self.editorLayout = QVBoxLayout()
+        self.editorLayout.setContentsMargins(0, 0, 0, 0)
+        self.editorLayout.setSpacing(0)
+        self.editorLayout.addWidget(self.tabBar)
+        self.editorLayout.addWidget(self.textEdit)
+        # Слежение за файлами на диске начинается с открытием первого файла
+        self.fileWatcher = None
+        self.changedFiles = set()
+        self.fileChangeTimer = QTimer(self)
+        self.fileChangeTimer.setSingleShot(True)
+        self.fileChangeTimer.setInterval(200)
+        self.fileChangeTimer.timeout.connect(self._processFileChanges)
+        # Панель поиска и диалоги справки создаются при первом обращении
+        self.findBar = None
+        self.helpDialog = None
+        self.aboutBox = None
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(150)
+        self.searchTimer.timeout.connect(self.startSearch)
+        # Вхождения выделяются только в видимой части документа
+        self.viewportSelectionTimer = QTimer(self)
+        self.viewportSelectionTimer.setSingleShot(True)
+        self.viewportSelectionTimer.setInterval(0)
+        self.viewportSelectionTimer.timeout.connect(self.updateViewportSelections)
+        self.shownMatches = None
+        self.diagnosticCursors = []
+        self.shownDiagnostics = None
+        self.textEdit.updateRequest.connect(self.scheduleViewportSelections)
+        editorArea = QWidget()
+        editorArea.setLayout(self.editorLayout)
         self.resultArea = QPlainTextEdit()
         self.resultArea.setReadOnly(True)
-        splitter = QSplitter(Qt.Vertical)
-        splitter.addWidget(self.textEdit)
-        splitter.addWidget(self.resultArea)
-        splitter.setStretchFactor(0, 3)
-        splitter.setStretchFactor(1, 1)
+        self.splitter = QSplitter(Qt.Vertical)
+        self.splitter.addWidget(editorArea)
+        self.splitter.addWidget(self.resultArea)
+        self.splitter.setStretchFactor(0, 3)
+        self.splitter.setStretchFactor(1, 1)
         centralWidget = QWidget()
         layout = QVBoxLayout()
-        layout.addWidget(splitter)
+        layout.addWidget(self.splitter)
         centralWidget.setLayout(layout)
         self.setCentralWidget(centralWidget)
         self.createActions()
         self.createMenus()
         self.createToolBar()
+        self.createStatusBar()
         self.textEdit.document().setModified(False)
         self.resize(1600, 1200)
         self.setMinimumSize(400, 300)
@@ -112,51 +1394,80 @@ class MainWindow(QMainWindow):
     def createActions(self):
         self.newAct = QAction("Создать", self)
         self.newAct.triggered.connect(self.newDocument)
-        self.newAct.setIcon(QIcon("icons/new.png"))
+        self.newAct.setIcon(loadIcon('new'))
         self.openAct = QAction("Открыть", self)
         self.openAct.triggered.connect(self.openDocument)
-        self.openAct.setIcon(QIcon("icons/open.png"))
+        self.openAct.setIcon(loadIcon('open'))
         self.saveAct = QAction("Сохранить", self)
-        self.saveAct.triggered.connect(self.saveDocument)
-        self.saveAct.setIcon(QIcon("icons/save.png"))
+        self.saveAct.triggered.connect(lambda: self.saveDocument())
+        self.saveAct.setIcon(loadIcon('save'))
         self.saveAsAct = QAction("Сохранить как", self)
-        self.saveAsAct.triggered.connect(self.saveDocumentAs)
+        self.saveAsAct.triggered.connect(lambda: self.saveDocumentAs())
+        self.closeAct = QAction("Закрыть", self)
+        self.closeAct.setShortcut("Ctrl+W")
+        self.closeAct.triggered.connect(lambda: self.closeDocument(self.tabBar.currentIndex()))
         self.exitAct = QAction("Выход", self)
         self.exitAct.triggered.connect(self.exitApplication)
         self.undoAct = QAction("Отменить", self)
         self.undoAct.triggered.connect(self.textEdit.undo)
-        self.undoAct.setIcon(QIcon("icons/undo.png"))
+        self.undoAct.setIcon(loadIcon('undo'))
         self.redoAct = QAction("Повторить", self)
-        self.redoAct.triggered.connect(self.repeatLastAction)
-        self.redoAct.setIcon(QIcon("icons/redo.png"))
+        self.redoAct.triggered.connect(self.textEdit.redo)
+        self.redoAct.setIcon(loadIcon('redo'))
         self.cutAct = QAction("Вырезать", self)
-        self.cutAct.triggered.connect(lambda: self._recordAction(self.textEdit.cut))
-        self.cutAct.setIcon(QIcon("icons/cut.png"))
+        self.cutAct.triggered.connect(self.textEdit.cut)
+        self.cutAct.setIcon(loadIcon('cut'))
         self.copyAct = QAction("Копировать", self)
-        self.copyAct.triggered.connect(lambda: self._recordAction(self.textEdit.copy))
-        self.copyAct.setIcon(QIcon("icons/copy.png"))
+        self.copyAct.triggered.connect(self.textEdit.copy)
+        self.copyAct.setIcon(loadIcon('copy'))
         self.pasteAct = QAction("Вставить", self)
-        self.pasteAct.triggered.connect(lambda: self._recordAction(self.textEdit.paste))
-        self.pasteAct.setIcon(QIcon("icons/paste.png"))
+        self.pasteAct.triggered.connect(self.textEdit.paste)
+        self.pasteAct.setIcon(loadIcon('paste'))
         self.deleteAct = QAction("Удалить", self)
-        self.deleteAct.triggered.connect(lambda: self._recordAction(self.deleteText))
+        self.deleteAct.triggered.connect(self.textEdit.deleteSelection)
         self.selectAllAct = QAction("Выделить все", self)
         self.selectAllAct.triggered.connect(self.textEdit.selectAll)
+        self.highlightAct = QAction("Подсветка синтаксиса", self)
+        self.highlightAct.setCheckable(True)
+        self.highlightAct.setChecked(True)
+        self.highlightAct.toggled.connect(self.highlighter.setEnabled)
+        self.unloadAct = QAction("Выгружать неактивные вкладки", self)
+        self.unloadAct.setCheckable(True)
+        self.unloadAct.setChecked(True)
+        self.followAct = QAction("Следить за концом файла", self)
+        self.followAct.setCheckable(True)
+        self.followAct.toggled.connect(self.onFollowToggled)
+        self.goToLineAct = QAction("Перейти к строке", self)
+        self.goToLineAct.setShortcut("Ctrl+G")
+        self.goToLineAct.triggered.connect(self.goToLine)
+        self.findAct = QAction("Найти", self)
+        self.findAct.setShortcut(QKeySequence.Find)
+        self.findAct.triggered.connect(lambda: self.showFindBar())
+        self.replaceAct = QAction("Заменить", self)
+        self.replaceAct.setShortcut(QKeySequence.Replace)
+        self.replaceAct.triggered.connect(lambda: self.showFindBar(replace=True))
+        self.findNextAct = QAction("Найти далее", self)
+        self.findNextAct.setShortcut(QKeySequence.FindNext)
+        self.findNextAct.triggered.connect(lambda: self.findNext())
+        self.findPreviousAct = QAction("Найти ранее", self)
+        self.findPreviousAct.setShortcut(QKeySequence.FindPrevious)
+        self.findPreviousAct.triggered.connect(lambda: self.findNext(backward=True))
         self.helpAct = QAction("Вызов справки", self)
         self.helpAct.triggered.connect(self.showHelp)
-        self.helpAct.setIcon(QIcon("icons/help.png"))
+        self.helpAct.setIcon(loadIcon('help'))
         self.aboutAct = QAction("О программе", self)
         self.aboutAct.triggered.connect(self.showAbout)
-        self.aboutAct.setIcon(QIcon("icons/about.png"))
+        self.aboutAct.setIcon(loadIcon('about'))
         self.syntaxAct = QAction("Запуск синтаксического анализатора", self)
         self.syntaxAct.triggered.connect(self.runSyntaxAnalyzer)
-        self.syntaxAct.setIcon(QIcon("icons/syntax.png"))
+        self.syntaxAct.setIcon(loadIcon('syntax'))
     def createMenus(self):
         fileMenu = self.menuBar().addMenu("Файл")
         fileMenu.addAction(self.newAct)
         fileMenu.addAction(self.openAct)
         fileMenu.addAction(self.saveAct)
         fileMenu.addAction(self.saveAsAct)
+        fileMenu.addAction(self.closeAct)
         fileMenu.addSeparator()
         fileMenu.addAction(self.exitAct)
         editMenu = self.menuBar().addMenu("Правка")
@@ -169,6 +1480,16 @@ class MainWindow(QMainWindow):
         editMenu.addAction(self.deleteAct)
         editMenu.addSeparator()
         editMenu.addAction(self.selectAllAct)
+        editMenu.addAction(self.goToLineAct)
+        editMenu.addSeparator()
+        editMenu.addAction(self.findAct)
+        editMenu.addAction(self.replaceAct)
+        editMenu.addAction(self.findNextAct)
+        editMenu.addAction(self.findPreviousAct)
+        self.viewMenu = self.menuBar().addMenu("Вид")
+        self.viewMenu.addAction(self.highlightAct)
+        self.viewMenu.addAction(self.unloadAct)
+        self.viewMenu.addAction(self.followAct)
         helpMenu = self.menuBar().addMenu("Справка")
         helpMenu.addAction(self.helpAct)
         helpMenu.addAction(self.aboutAct)
@@ -191,77 +1512,777 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         toolbar.addAction(self.helpAct)
         toolbar.addAction(self.aboutAct)
+    def createStatusBar(self):
+        self.progressBar = QProgressBar()
+        self.progressBar.setMaximumWidth(300)
+        self.progressBar.setRange(0, 100)
+        self.progressBar.hide()
+        self.cancelButton = QPushButton("Отмена")
+        self.cancelButton.clicked.connect(self.cancelBackgroundTask)
+        self.cancelButton.hide()
+        # Кодировка и переводы строк текущего документа
+        self.encodingLabel = QLabel(encodingName(UTF8) + "  " + newlineName('\n'))
+        self.statusBar().addPermanentWidget(self.encodingLabel)
+        self.statusBar().addPermanentWidget(self.progressBar)
+        self.statusBar().addPermanentWidget(self.cancelButton)
+        self.loadTimer = QTimer(self)
+        self.loadTimer.setInterval(0)
+        self.loadTimer.timeout.connect(self._pumpLoader)
+        self.saveTimer = QTimer(self)
+        self.saveTimer.setInterval(0)
+        self.saveTimer.timeout.connect(self._pumpSaver)
     def onModificationChanged(self, modified):
+        handle = self.currentHandle
         filename = self.currentFile if self.currentFile else "Безымянный документ"
-        if modified:
+        if self.largeFileView is not None:
+            self.setWindowTitle(filename + " [только чтение] - Лабораторная работа №1")
+        elif modified:
             self.setWindowTitle("* " + filename + " - Лабораторная работа №1")
         else:
             self.setWindowTitle(filename + " - Лабораторная работа №1")
+        self.encodingLabel.setText(f"{encodingName(handle.encoding)}  {newlineName(handle.newline)}")
+        index = self.documents.index(handle)
+        self.tabBar.setTabText(index, ("* " if modified else "") + handle.displayName())
+        self.tabBar.setTabToolTip(index, handle.path or "")
     def maybeSave(self):
+        if self.loader is not None:
+            return True
+        if self.saver is not None and not self._completeSaving():
+            return False
         if self.textEdit.document().isModified():
             ret = QMessageBox.question(self, "Сохранить изменения?",
-                                       "Документ был изменён. Сохранить изменения?",
+                                       f"Документ '{self.currentHandle.displayName()}' был изменён. Сохранить изменения?",
                                        QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
             if ret == QMessageBox.Yes:
-                return self.saveDocument()
+                return self.saveDocument(wait=True)
             elif ret == QMessageBox.Cancel:
                 return False
         return True
-    def _recordAction(self, action):
-        action()
-        self.lastAction = action
     def newDocument(self):
-        if not self.maybeSave():
-            return
-        self.textEdit.clear()
-        self.textEdit.document().setModified(False)
-        self.currentFile = None
-        self.onModificationChanged(False)
+        self.addDocument(DocumentHandle())
         self.resultArea.clear()
         self.resultArea.appendPlainText("Создан новый документ.")
     def openDocument(self):
-        if not self.maybeSave():
-            return
         filename, _ = QFileDialog.getOpenFileName(self, "Открыть файл", "", "Текстовые файлы (*.txt);;Все файлы (*.*)")
         if filename:
+            self.openFile(filename)
+    def openFile(self, filename):
+        for index, handle in enumerate(self.documents):
+            if handle.path is not None and os.path.abspath(handle.path) == os.path.abspath(filename):
+                self.setCurrentTab(index)
+                return
+        viewer = False
+        # Просмотр делит строки по байту '\n', в UTF-16 и UTF-32 так нельзя
+        if (os.path.isfile(filename) and os.path.getsize(filename) > VIEWER_THRESHOLD
+                and len('\n'.encode(sniffFile(filename)[0].codec)) == 1):
+            ret = QMessageBox.question(self, "Большой файл",
+                                       "Файл очень большой. Открыть его в режиме просмотра (только чтение)?",
+                                       QMessageBox.Yes | QMessageBox.No)
+            viewer = ret == QMessageBox.Yes
+        # Пустая безымянная вкладка используется повторно, иначе файл открывается в новой
+        current = self.currentHandle
+        if (current.path is not None or current.isModified() or self.loader is not None
+                or not current.document.isEmpty()):
+            handle = DocumentHandle(filename)
+            handle.viewer = viewer
+            self.addDocument(handle)
+        elif viewer:
+            self.openLargeFileView(filename)
+        else:
+            self.loadDocument(filename)
+    def addDocument(self, handle):
+        self.documents.append(handle)
+        index = self.tabBar.addTab(handle.displayName())
+        self.tabBar.setTabToolTip(index, handle.path or "")
+        self.setCurrentTab(index)
+    def setCurrentTab(self, index):
+        self.tabBar.setCurrentIndex(index)
+        self.activateDocument(index)
+    def activateDocument(self, index):
+        if index < 0 or index >= len(self.documents) or self.documents[index] is self.currentHandle:
+            return
+        dropped = self._deactivateDocument()
+        handle = self.documents[index]
+        self.currentHandle = handle
+        needsLoading = False
+        if handle.document is None:
+            handle.document = self._newTextDocument()
+            handle.analysis = None
+            handle.highlightState = None
+            needsLoading = handle.path is not None
+        if handle.analysis is None:
+            handle.analysis = SyntaxAnalyzer.newEngine(handle.document)
+        self.textEdit.attachDocument(handle.document, handle.history)
+        self.highlighter.setDocument(handle.document, handle.highlightState)
+        self.analyzer.setDocument(handle.document, handle.analysis)
+        self.search.setDocument(handle.document)
+        self.autosave.setHandle(handle)
+        self.clearDiagnostics()
+        # Выгруженный документ удаляется только после того, как редактор от него отвязан
+        if dropped is not None:
+            dropped.deleteLater()
+        if handle.viewer:
+            self.openLargeFileView(handle.path)
+        elif needsLoading:
+            # История правок выгруженной вкладки верна, пока файл не изменился
+            self.loadDocument(handle.path, keepHistory=self._fileUnchanged(handle))
+        else:
+            self._restorePosition(handle)
+        self.onModificationChanged(handle.document.isModified())
+        if handle.fileChanged:
+            handle.fileChanged = False
+            self.checkFileChange(handle)
+    def _deactivateDocument(self):
+        # Возвращает документ, который нужно удалить, если вкладка выгружается
+        handle = self.currentHandle
+        if self.saver is not None:
+            self._completeSaving()
+        interrupted = self.loader is not None
+        self._stopLoading()
+        self.closeLargeFileView()
+        handle.highlightState = self.highlighter.saveState()
+        if not interrupted:
+            handle.cursorPosition = self.textEdit.textCursor().position()
+            handle.scrollValue = self.textEdit.verticalScrollBar().value()
+        # Недогруженный документ всегда выгружается: при активации он загрузится заново.
+        # Неизменённый - только если файл на диске тот же, что в документе: иначе
+        # текст был бы потерян или подменён
+        unload = interrupted or handle.viewer
+        if not unload and self.unloadAct.isChecked() and not handle.isModified():
+            unload = not handle.fileChanged and self._fileUnchanged(handle)
+        if handle.path is not None and unload:
+            document = handle.document
+            handle.document = None
+            handle.analysis = None
+            handle.highlightState = None
+            if interrupted or handle.viewer:
+                handle.history.clear()
+                handle.fileSize = None
+            handle.fileChanged = False
+            return document
+        return None
+    def _fileUnchanged(self, handle):
+        # Файл на диске совпадает с прочитанным в документ (размер и время изменения)
+        if handle.fileSize is None:
+            return False
+        try:
+            info = os.stat(handle.path)
+        except OSError:
+            return False
+        return info.st_size == handle.fileSize and info.st_mtime_ns == handle.fileMtime
+    def _newTextDocument(self):
+        document = QTextDocument(self)
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        document.setDefaultFont(self.textEdit.document().defaultFont())
+        document.modificationChanged.connect(self.onModificationChanged)
+        return document
+    def _restorePosition(self, handle):
+        cursor = QTextCursor(handle.document)
+        cursor.setPosition(min(handle.cursorPosition, handle.document.characterCount() - 1))
+        self.textEdit.setTextCursor(cursor)
+        self.textEdit.verticalScrollBar().setValue(handle.scrollValue)
+    def closeDocument(self, index):
+        if index < 0:
+            return
+        handle = self.documents[index]
+        if handle is not self.currentHandle and handle.isModified():
+            # Изменённую вкладку показываем перед вопросом о сохранении
+            self.setCurrentTab(index)
+        if handle is self.currentHandle:
+            if not self.maybeSave():
+                return
+            if len(self.documents) == 1:
+                self.addDocument(DocumentHandle())
+            else:
+                self.setCurrentTab(index - 1 if index > 0 else 1)
+        index = self.documents.index(handle)
+        del self.documents[index]
+        self.tabBar.removeTab(index)
+        if handle.document is not None:
+            handle.document.deleteLater()
+        handle.history.clear()
+        self.autosave.discard(handle.journal)
+        self._updateWatchedFiles()
+    def onTabMoved(self, source, target):
+        self.documents.insert(target, self.documents.pop(source))
+    def openLargeFileView(self, filename):
+        self._stopLoading()
+        self.closeLargeFileView()
+        try:
+            view = LargeFileView(filename)
+        except Exception as e:
+            self.currentHandle.viewer = False
+            self.currentFile = None
+            self.onModificationChanged(False)
+            QMessageBox.warning(self, "Ошибка открытия файла", f"Не удалось открыть файл:\n{e}")
+            return
+        view.indexingFinished.connect(
+            lambda total: self.resultArea.appendPlainText(f"Индексация завершена: строк - {total}."))
+        self.largeFileView = view
+        self.textEdit.clear()
+        self.textEdit.document().setModified(False)
+        self.textEdit.hide()
+        self.editorLayout.addWidget(view)
+        self._setEditingEnabled(False)
+        self.currentHandle.viewer = True
+        self.currentFile = filename
+        self.currentHandle.encoding = view.encoding
+        self.currentHandle.newline = view.newline
+        self.onModificationChanged(False)
+        view.start()
+        self.resultArea.appendPlainText(f"Файл '{filename}' открыт в режиме просмотра.")
+    def closeLargeFileView(self):
+        if self.largeFileView is None:
+            return
+        view = self.largeFileView
+        self.largeFileView = None
+        view.closeFile()
+        view.hide()
+        view.setParent(None)
+        view.deleteLater()
+        self.textEdit.show()
+        self._setEditingEnabled(True)
+    def _setEditingEnabled(self, enabled):
+        for act in (self.saveAct, self.saveAsAct, self.undoAct, self.redoAct, self.cutAct,
+                    self.copyAct, self.pasteAct, self.deleteAct, self.selectAllAct):
+            act.setEnabled(enabled)
+    def goToLine(self):
+        view = self.largeFileView
+        maximum = view.index.lineCount() if view is not None else self.textEdit.blockCount()
+        line, ok = QInputDialog.getInt(self, "Перейти к строке", "Номер строки:", 1, 1, maximum)
+        if not ok:
+            return
+        if view is not None:
+            view.goToLine(line - 1)
+        else:
+            block = self.textEdit.document().findBlockByNumber(line - 1)
+            self.textEdit.setTextCursor(QTextCursor(block))
+            self.textEdit.centerCursor()
+    def _createFindBar(self):
+        findBar = FindBar()
+        findBar.closed.connect(self.hideFindBar)
+        findBar.findEdit.textChanged.connect(self.scheduleSearch)
+        findBar.findEdit.returnPressed.connect(lambda: self.findNext())
+        findBar.regexBox.toggled.connect(self.scheduleSearch)
+        findBar.caseBox.toggled.connect(self.scheduleSearch)
+        findBar.nextButton.clicked.connect(lambda: self.findNext())
+        findBar.previousButton.clicked.connect(lambda: self.findNext(backward=True))
+        findBar.replaceButton.clicked.connect(self.replaceCurrent)
+        findBar.replaceAllButton.clicked.connect(self.replaceAllMatches)
+        self.editorLayout.addWidget(findBar)
+        return findBar
+    def showFindBar(self, replace=False):
+        if self.largeFileView is not None:
+            return
+        if self.findBar is None:
+            self.findBar = self._createFindBar()
+        cursor = self.textEdit.textCursor()
+        selected = cursor.selectedText()
+        if selected and '\u2029' not in selected:
+            self.findBar.findEdit.setText(selected)
+        self.findBar.setReplaceVisible(replace)
+        self.findBar.show()
+        self.findBar.findEdit.setFocus()
+        self.findBar.findEdit.selectAll()
+        self.scheduleSearch()
+    def hideFindBar(self):
+        if self.findBar is None:
+            return
+        self.findBar.hide()
+        self.searchTimer.stop()
+        self.search.search(None)
+        self.textEdit.setFocus()
+    def scheduleSearch(self, *args):
+        self.searchTimer.start()
+    def startSearch(self):
+        if self.findBar is None:
+            return
+        text = self.findBar.findEdit.text()
+        if not text or not self.findBar.isVisible():
+            self.search.search(None)
+            return
+        try:
+            pattern = compilePattern(text, self.findBar.regexBox.isChecked(), self.findBar.caseBox.isChecked())
+        except re.error as e:
+            self.search.search(None)
+            self.findBar.countLabel.setText(f"Ошибка: {e}")
+            return
+        self.search.search(pattern)
+    def onMatchesChanged(self, count, finished):
+        if self.search.pattern is None:
+            if self.findBar is not None:
+                self.findBar.countLabel.clear()
+        else:
+            self.findBar.countLabel.setText(f"Найдено: {count}" + ("" if finished else "..."))
+        self.shownMatches = None
+        self.scheduleViewportSelections()
+    def scheduleViewportSelections(self, *args):
+        if not self.viewportSelectionTimer.isActive():
+            self.viewportSelectionTimer.start()
+    def updateViewportSelections(self):
+        # Вхождения поиска и ошибки анализатора выделяются только в видимой части
+        layers = self.textEdit.selectionLayers
+        if not self.search.index.count() and not self.diagnosticCursors:
+            for name in ('search', 'diagnostics'):
+                if layers.layer(name):
+                    layers.setLayer(name, [])
+            self.shownMatches = self.shownDiagnostics = None
+            return
+        start, end = layers.visibleRange()
+        self._updateMatchSelections(start, end)
+        self._updateDiagnosticSelections(start, end)
+    def _updateMatchSelections(self, start, end):
+        index = self.search.index
+        matches = index.between(start, end)
+        # Прокрутки не было и индекс не менялся: выделения уже актуальны
+        if matches == self.shownMatches:
+            return
+        self.shownMatches = matches
+        selections = []
+        document = self.textEdit.document()
+        for number in matches:
+            first, last = index.match(number)
+            selection = QTextEdit.ExtraSelection()
+            selection.format = MATCH_FORMAT
+            selection.cursor = QTextCursor(document)
+            selection.cursor.setPosition(first)
+            selection.cursor.setPosition(last, QTextCursor.KeepAnchor)
+            selections.append(selection)
+        self.textEdit.selectionLayers.setLayer('search', selections)
+    def _updateDiagnosticSelections(self, start, end):
+        # Курсоры сами сдвигаются при правках, поэтому подчёркивания не отстают от текста
+        visible = [cursor for cursor in self.diagnosticCursors if start <= cursor.position() < end]
+        positions = [cursor.position() for cursor in visible]
+        if positions == self.shownDiagnostics:
+            return
+        self.shownDiagnostics = positions
+        selections = []
+        for cursor in visible:
+            selection = QTextEdit.ExtraSelection()
+            selection.format = DIAGNOSTIC_FORMAT
+            selection.cursor = cursor
+            selections.append(selection)
+        self.textEdit.selectionLayers.setLayer('diagnostics', selections)
+    def clearDiagnostics(self):
+        self.diagnosticCursors = []
+        self.shownDiagnostics = None
+        self.scheduleViewportSelections()
+    def findNext(self, backward=False):
+        if self.largeFileView is not None:
+            return
+        if self.search.pattern is None:
+            if self.findBar is None or not self.findBar.findEdit.text():
+                self.showFindBar()
+                return
+            self.startSearch()
+        index = self.search.index
+        if not index.count():
+            message = "Поиск ещё выполняется..." if not self.search.finished else "Совпадений не найдено."
+            self.statusBar().showMessage(message, 3000)
+            return
+        cursor = self.textEdit.textCursor()
+        if backward:
+            number = index.previous(cursor.selectionStart())
+            if number is None:
+                number = index.count() - 1
+        else:
+            number = index.next(cursor.selectionEnd())
+            if number is None:
+                number = 0
+        start, end = index.match(number)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        self.textEdit.setTextCursor(cursor)
+        self.textEdit.centerCursor()
+        self.statusBar().showMessage(f"Вхождение {number + 1} из {index.count()}", 3000)
+    def replaceCurrent(self):
+        pattern = self.search.pattern
+        cursor = self.textEdit.textCursor()
+        if pattern is None or self.textEdit.isReadOnly():
+            return
+        match = pattern.fullmatch(cursor.selectedText().replace('\u2029', '\n')) if cursor.hasSelection() else None
+        if match is None:
+            self.findNext()
+            return
+        replacement = self.findBar.replaceEdit.text()
+        if self.findBar.regexBox.isChecked():
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.textEdit.setPlainText(content)
-                self.currentFile = filename
-                self.textEdit.document().setModified(False)
-                self.onModificationChanged(False)
-                self.resultArea.appendPlainText(f"Файл '{filename}' успешно открыт.")
-            except Exception as e:
-                QMessageBox.warning(self, "Ошибка открытия файла", f"Не удалось открыть файл:\n{e}")
-    def saveDocument(self):
-        if self.currentFile is None:
-            return self.saveDocumentAs()
+                replacement = match.expand(replacement)
+            except (re.error, IndexError) as e:
+                self.findBar.countLabel.setText(f"Ошибка: {e}")
+                return
+        start = cursor.selectionStart()
+        self.textEdit.replaceRange(start, cursor.selectionEnd(), replacement)
+        cursor = self.textEdit.textCursor()
+        cursor.setPosition(start + utf16Length(replacement))
+        self.textEdit.setTextCursor(cursor)
+        self.search.search(pattern)
+    def replaceAllMatches(self):
+        if self.search.pattern is None or self.textEdit.isReadOnly():
+            return
+        self.statusBar().showMessage("Замена...")
+        self.search.replaceAll(self.findBar.replaceEdit.text(), self.findBar.regexBox.isChecked())
+    def onReplaceFinished(self, result):
+        self.statusBar().clearMessage()
+        if isinstance(result, Exception):
+            self.findBar.countLabel.setText(f"Ошибка: {result}")
+            return
+        if result is None:
+            self.resultArea.appendPlainText("Совпадений для замены не найдено.")
+            return
+        if self.textEdit.isReadOnly():
+            return
+        # Все замены - одна правка на участке от первого до последнего вхождения,
+        # поэтому отменяются одним шагом
+        start, end, text, replaced = result
+        scroll = self.textEdit.verticalScrollBar().value()
+        self.textEdit.replaceRange(start, end, text)
+        self.textEdit.verticalScrollBar().setValue(scroll)
+        self.resultArea.appendPlainText(f"Заменено вхождений: {replaced}.")
+    def loadDocument(self, filename, keepHistory=False):
+        # keepHistory - файл не менялся с тех пор, как вкладка была выгружена
+        self._stopLoading()
+        self.closeLargeFileView()
+        self.currentHandle.viewer = False
         try:
-            with open(self.currentFile, 'w', encoding='utf-8') as f:
-                f.write(self.textEdit.toPlainText())
+            self.loader = DocumentLoader(filename)
+        except Exception as e:
+            self.currentFile = None
+            self.onModificationChanged(False)
+            QMessageBox.warning(self, "Ошибка открытия файла", f"Не удалось открыть файл:\n{e}")
+            return
+        # Имя известно вкладке сразу: если её покинуть до конца загрузки, файл загрузится заново
+        self.currentFile = filename
+        # Загрузка не попадает в историю правок и журнал автосохранения
+        self.textEdit.trackHistory = False
+        self.autosave.suspend()
+        if not keepHistory:
+            self.textEdit.history.clear()
+        self.textEdit.clear()
+        self.textEdit.setReadOnly(True)
+        self.highlighter.suspend()
+        self.loadCursor = QTextCursor(self.textEdit.document())
+        if self.loader.totalBytes > PROGRESS_THRESHOLD:
+            self.progressBar.setValue(0)
+            self.progressBar.show()
+            self.cancelButton.show()
+            self.statusBar().showMessage(f"Загрузка '{filename}'...")
+        self.loader.start()
+        self.loadTimer.start()
+    def _pumpLoader(self):
+        loader = self.loader
+        # Закрытие блока правки (раскладка и обработчики contentsChange) стоит примерно
+        # столько же, сколько вставка, поэтому на вставку отводится половина из 15 мс
+        deadline = time.perf_counter() + 0.0075
+        self.loadCursor.beginEditBlock()
+        try:
+            while time.perf_counter() < deadline:
+                if loader.pendingOffset >= len(loader.pending):
+                    try:
+                        chunk = loader.chunks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if chunk is None:
+                        self.loadCursor.endEditBlock()
+                        self._finishLoading()
+                        return
+                    loader.pending, loader.pendingOffset = chunk, 0
+                offset = loader.pendingOffset
+                self.loadCursor.insertText(loader.pending[offset:offset + loader.INSERT_SIZE])
+                loader.pendingOffset = offset + loader.INSERT_SIZE
+        finally:
+            if self.loader is loader:
+                self.loadCursor.endEditBlock()
+        if loader.totalBytes:
+            self.progressBar.setValue(int(loader.bytesRead * 100 / loader.totalBytes))
+    def _finishLoading(self):
+        loader = self.loader
+        self._stopLoading()
+        if loader.error is not None:
+            self.textEdit.clear()
+            self.textEdit.history.clear()
+            self.currentFile = None
             self.textEdit.document().setModified(False)
             self.onModificationChanged(False)
-            self.resultArea.appendPlainText(f"Файл '{self.currentFile}' успешно сохранён.")
-            return True
+            if isinstance(loader.error, UnicodeDecodeError):
+                message = f"Файл не является текстом в кодировке {encodingName(loader.encoding)}:\n{loader.error}"
+            else:
+                message = f"Не удалось открыть файл:\n{loader.error}"
+            QMessageBox.warning(self, "Ошибка открытия файла", message)
+            return
+        # При сохранении сохраняются кодировка и переводы строк файла
+        self.currentHandle.encoding = loader.encoding
+        self.currentHandle.newline = loader.newline
+        previous = self.currentHandle.fileSize, self.currentHandle.fileMtime
+        self._rememberFileState(self.currentHandle, loader.bytesRead)
+        if (self.currentHandle.fileSize, self.currentHandle.fileMtime) != previous:
+            # Файл изменился после выгрузки вкладки: позиции в истории неверны
+            self.textEdit.history.clear()
+        self._updateWatchedFiles()
+        self.textEdit.document().setModified(False)
+        self._restorePosition(self.currentHandle)
+        self.onModificationChanged(False)
+        self.resultArea.appendPlainText(f"Файл '{loader.filename}' успешно открыт.")
+    def _rememberFileState(self, handle, size=None):
+        # size - сколько байтов файла прочитано в документ, по умолчанию весь файл
+        handle.fileSize = None
+        try:
+            info = os.stat(handle.path)
+            size = info.st_size if size is None else size
+            with open(handle.path, 'rb') as f:
+                start = max(len(handle.encoding.bom), size - FILE_TAIL_CHECK)
+                f.seek(start)
+                handle.fileTail = f.read(size - start)
+        except OSError:
+            return
+        handle.fileSize = size
+        handle.fileMtime = info.st_mtime_ns
+    def _updateWatchedFiles(self):
+        # Следим за файлами всех вкладок; файл, заменённый переименованием
+        # (так сохраняют многие программы), добавляется в слежение заново
+        wanted = {handle.path for handle in self.documents
+                  if handle.path is not None and not handle.viewer and os.path.exists(handle.path)}
+        if self.fileWatcher is None:
+            if not wanted:
+                return
+            self.fileWatcher = QFileSystemWatcher(self)
+            self.fileWatcher.fileChanged.connect(self.onFileChanged)
+        watched = set(self.fileWatcher.files())
+        if watched - wanted:
+            self.fileWatcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            self.fileWatcher.addPaths(list(wanted - watched))
+    def onFileChanged(self, path):
+        # Запись обычно идёт порциями: изменения проверяются после паузы
+        self.changedFiles.add(path)
+        self.fileChangeTimer.start()
+    def _processFileChanges(self):
+        paths, self.changedFiles = self.changedFiles, set()
+        for handle in self.documents:
+            if handle.path not in paths or handle.document is None:
+                continue
+            if handle is self.currentHandle:
+                self.checkFileChange(handle)
+            else:
+                handle.fileChanged = True
+        self._updateWatchedFiles()
+    def checkFileChange(self, handle):
+        if handle.fileSize is None or handle.viewer or self.loader is not None or self.saver is not None:
+            return
+        try:
+            info = os.stat(handle.path)
+        except FileNotFoundError:
+            handle.fileSize = None
+            # Документ - единственная копия текста: он считается изменённым, чтобы
+            # вкладка не выгружалась, а при закрытии предлагалось сохранение
+            if handle.document is not None:
+                handle.history.invalidateClean()
+                handle.document.setModified(True)
+            self.resultArea.appendPlainText(f"Файл '{handle.path}' удалён другой программой.")
+            return
+        except OSError:
+            return
+        if info.st_size == handle.fileSize and info.st_mtime_ns == handle.fileMtime:
+            # Собственное сохранение или изменение без новых данных
+            return
+        # Дописывание: файл вырос, а прочитанные последние байты остались на месте.
+        # Правку в середине файла с дописыванием так не отличить, но при слежении
+        # за журналами это и не нужно
+        if handle.fileTail is not None and handle.fileSize < info.st_size <= handle.fileSize + APPEND_LIMIT:
+            try:
+                with open(handle.path, 'rb') as f:
+                    f.seek(handle.fileSize - len(handle.fileTail))
+                    data = f.read(info.st_size - handle.fileSize + len(handle.fileTail))
+                if data.startswith(handle.fileTail):
+                    self._appendFileTail(handle, data[len(handle.fileTail):], info)
+                    return
+            except (OSError, UnicodeDecodeError):
+                pass
+        self._reloadChangedFile(handle, info)
+    def _appendFileTail(self, handle, data, info):
+        text, consumed = decodeAppended(data, handle.encoding)
+        handle.fileSize += consumed
+        handle.fileMtime = info.st_mtime_ns
+        handle.fileTail = (handle.fileTail + data[:consumed])[-FILE_TAIL_CHECK:]
+        if not text:
+            return
+        document = handle.document
+        modified = document.isModified()
+        scrollBar = self.textEdit.verticalScrollBar()
+        scroll = scrollBar.value()
+        # Дописанное не попадает в историю правок: позиции в ней остаются верными
+        self.textEdit.trackHistory = False
+        if modified:
+            # Сохранённое состояние больше не совпадает с файлом, а журнал
+            # автосохранения должен перестать зависеть от файла
+            handle.history.invalidateClean()
+            handle.journal.needsCompaction = True
+        else:
+            self.autosave.suspend()
+        try:
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+        finally:
+            self.textEdit.trackHistory = True
+            if not modified:
+                self.autosave.resume()
+        document.setModified(modified)
+        if self.followAct.isChecked():
+            self.textEdit.moveCursor(QTextCursor.End)
+            self.textEdit.ensureCursorVisible()
+        else:
+            scrollBar.setValue(scroll)
+    def _reloadChangedFile(self, handle, info):
+        if handle.isModified():
+            ret = QMessageBox.question(self, "Файл изменён",
+                                       f"Файл '{handle.displayName()}' изменён другой программой. "
+                                       f"Загрузить его заново? Несохранённые изменения будут потеряны.",
+                                       QMessageBox.Yes | QMessageBox.No)
+            if ret != QMessageBox.Yes:
+                # Документ больше не продолжение файла: дальше только перезагрузка
+                handle.fileSize = info.st_size
+                handle.fileMtime = info.st_mtime_ns
+                handle.fileTail = None
+                return
+        handle.cursorPosition = self.textEdit.textCursor().position()
+        handle.scrollValue = self.textEdit.verticalScrollBar().value()
+        self.resultArea.appendPlainText(f"Файл '{handle.path}' изменён другой программой и загружается заново.")
+        self.loadDocument(handle.path)
+    def onFollowToggled(self, checked):
+        if checked and self.largeFileView is None:
+            self.textEdit.moveCursor(QTextCursor.End)
+            self.textEdit.ensureCursorVisible()
+    def cancelBackgroundTask(self):
+        if self.loader is not None:
+            self.cancelLoading()
+        elif self.saver is not None:
+            self.cancelSaving()
+    def cancelLoading(self):
+        if self.loader is None:
+            return
+        filename = self.loader.filename
+        self._stopLoading()
+        self.textEdit.clear()
+        self.currentFile = None
+        self.textEdit.document().setModified(False)
+        self.onModificationChanged(False)
+        self.resultArea.appendPlainText(f"Загрузка файла '{filename}' отменена.")
+    def _stopLoading(self):
+        if self.loader is None:
+            return
+        self.loader.cancel()
+        self.loader = None
+        self.loadCursor = None
+        self.loadTimer.stop()
+        self.progressBar.hide()
+        self.cancelButton.hide()
+        self.statusBar().clearMessage()
+        self.textEdit.setReadOnly(False)
+        self.textEdit.trackHistory = True
+        self.autosave.resume()
+        self.highlighter.resume()
+    def saveDocument(self, wait=False):
+        if self.currentFile is None:
+            return self.saveDocumentAs(wait)
+        return self.writeDocument(self.currentFile, wait)
+    def saveDocumentAs(self, wait=False):
+        filename, _ = QFileDialog.getSaveFileName(self, "Сохранить как", "", "Текстовые файлы (*.txt);;Все файлы (*.*)")
+        if not filename:
+            return False
+        encoding = self.chooseEncoding()
+        if encoding is None:
+            return False
+        self.currentFile = filename
+        return self.writeDocument(filename, wait, encoding)
+    def chooseEncoding(self):
+        # Текущая кодировка документа предлагается первой
+        current = self.currentHandle.encoding
+        encodings = [current] + [encoding for encoding in SAVE_ENCODINGS if encoding != current]
+        names = [encodingName(encoding) for encoding in encodings]
+        name, ok = QInputDialog.getItem(self, "Сохранить как", "Кодировка:", names, 0, False)
+        return encodings[names.index(name)] if ok else None
+    def writeDocument(self, filename, wait=False, encoding=None):
+        # encoding - кодировка, в которой файл сохраняется; None - текущая кодировка документа
+        if self.saver is not None and not self._completeSaving():
+            return False
+        try:
+            handle = self.currentHandle
+            saver = DocumentSaver(self.textEdit.document(), filename, encoding or handle.encoding, handle.newline)
         except Exception as e:
             QMessageBox.warning(self, "Ошибка сохранения файла", f"Не удалось сохранить файл:\n{e}")
             return False
-    def saveDocumentAs(self):
-        filename, _ = QFileDialog.getSaveFileName(self, "Сохранить как", "", "Текстовые файлы (*.txt);;Все файлы (*.*)")
-        if filename:
-            self.currentFile = filename
-            return self.saveDocument()
-        return False
+        self.saver = saver
+        # Пока документ пишется, он не должен меняться
+        self.textEdit.setReadOnly(True)
+        self._setEditingEnabled(False)
+        saver.start()
+        if wait:
+            return self._completeSaving()
+        if saver.totalBlocks > 1 and self.textEdit.document().characterCount() > PROGRESS_THRESHOLD:
+            self.progressBar.setValue(0)
+            self.progressBar.show()
+            self.cancelButton.show()
+            self.statusBar().showMessage(f"Сохранение '{filename}'...")
+        self.saveTimer.start()
+        return True
+    def _pumpSaver(self):
+        saver = self.saver
+        saver.feed(time.perf_counter() + 0.015)
+        self.progressBar.setValue(int(saver.blocksWritten * 100 / max(1, saver.totalBlocks)))
+        if saver.isFinished():
+            self._finishSaving()
+    def _completeSaving(self):
+        self.saver.feed()
+        self.saver.thread.join()
+        return self._finishSaving(wait=True)
+    def _finishSaving(self, wait=False):
+        saver = self.saver
+        self._stopSaving()
+        if saver.cancelled.is_set():
+            self.resultArea.appendPlainText(f"Сохранение файла '{saver.filename}' отменено.")
+            return False
+        if isinstance(saver.error, UnicodeEncodeError) and saver.encoding != UTF8:
+            # В тексте есть символы, которых нет в кодировке файла (например, в cp1251)
+            ret = QMessageBox.question(self, "Ошибка сохранения файла",
+                                       f"Текст содержит символы, которых нет в кодировке "
+                                       f"{encodingName(saver.encoding)}. Сохранить файл в UTF-8?",
+                                       QMessageBox.Yes | QMessageBox.No)
+            if ret == QMessageBox.Yes:
+                return self.writeDocument(saver.filename, wait, UTF8)
+            return False
+        if saver.error is not None:
+            QMessageBox.warning(self, "Ошибка сохранения файла", f"Не удалось сохранить файл:\n{saver.error}")
+            return False
+        self.currentHandle.encoding = saver.encoding
+        self.textEdit.document().setModified(False)
+        self.textEdit.history.setClean()
+        self.autosave.discard(self.currentHandle.journal)
+        # Файл заменён новым: слежение переносится на него
+        self._rememberFileState(self.currentHandle)
+        self._updateWatchedFiles()
+        self.onModificationChanged(False)
+        self.resultArea.appendPlainText(f"Файл '{self.currentFile}' успешно сохранён.")
+        return True
+    def cancelSaving(self):
+        self.saver.cancel()
+        self.saver.thread.join()
+        self._finishSaving()
+    def _stopSaving(self):
+        self.saver = None
+        self.saveTimer.stop()
+        self.progressBar.hide()
+        self.cancelButton.hide()
+        self.statusBar().clearMessage()
+        self.textEdit.setReadOnly(False)
+        self._setEditingEnabled(True)
     def exitApplication(self):
-        if not self.maybeSave():
-            return
         self.close()
-    def deleteText(self):
-        cursor = self.textEdit.textCursor()
-        if cursor.hasSelection():
-            cursor.removeSelectedText()
     def showHelp(self):
+        if self.helpDialog is None:
+            self.helpDialog = self._createHelpDialog()
+        self.helpDialog.exec_()
+    def _createHelpDialog(self):
         help_text = """
 Текстовый редактор - Лабораторная работа №1
 
@@ -277,7 +2298,8 @@ class MainWindow(QMainWindow):
 • Создать - создает новый документ (Ctrl+N)
 • Открыть - открывает существующий текстовый файл (Ctrl+O)
 • Сохранить - сохраняет текущий документ (Ctrl+S)
-• Сохранить как - сохраняет документ под новым именем
+• Сохранить как - сохраняет документ под новым именем и в выбранной кодировке
+• Закрыть - закрывает текущую вкладку (Ctrl+W)
 • Выход - закрывает программу (Ctrl+Q)
 
 --- Меню "Правка" ---
@@ -288,6 +2310,7 @@ class MainWindow(QMainWindow):
 • Вставить - вставляет текст из буфера обмена (Ctrl+V)
 • Удалить - удаляет выделенный текст (Del)
 • Выделить все - выделяет весь текст в редакторе (Ctrl+A)
+• Найти / Заменить - панель поиска и замены (Ctrl+F / Ctrl+H), переход по вхождениям (F3 / Shift+F3)
 
 --- Меню "Справка" ---
 • Вызов справки - открывает это руководство пользователя
@@ -303,8 +2326,10 @@ class MainWindow(QMainWindow):
 
 === Особенности реализации ===
 • Поддержка отмены/повтора действий
+• Работа с несколькими документами во вкладках
 • Нумерация строк в редакторе
 • Подсветка текущей строки
+• Подсветка синтаксиса (меню "Вид")
 • Проверка на несохраненные изменения при закрытии
 • Возможность изменения размеров областей редактирования и вывода
 • Автоматическое появление полос прокрутки при необходимости
@@ -332,9 +2357,7 @@ class MainWindow(QMainWindow):
 3. Запустите программу: python main.py
 
 === Ограничения ===
-• Синтаксический анализатор не реализован (функция заглушка)
-• Нет поддержки работы с несколькими документами одновременно
-• Нет подсветки синтаксиса для конкретных языков
+• Подсветка синтаксиса есть только для языка анализатора (операторы присваивания)
 """
 
         # Создаем новое диалоговое окно
@@ -363,43 +2386,207 @@ class MainWindow(QMainWindow):
         layout.addWidget(text_edit)
         layout.addWidget(button_box)
         help_dialog.setLayout(layout)
-        
-        help_dialog.exec_()
+        return help_dialog
     def showAbout(self):
-        about_text = (
-            "Текстовый редактор\n"
-            "Лабораторная работа №1\n\n"
-        )
-        QMessageBox.information(self, "О программе", about_text)
+        if self.aboutBox is None:
+            about_text = (
+                "Текстовый редактор\n"
+                "Лабораторная работа №1\n\n"
+            )
+            self.aboutBox = QMessageBox(QMessageBox.Information, "О программе", about_text, QMessageBox.Ok, self)
+        self.aboutBox.exec_()
     def runSyntaxAnalyzer(self):
-        self.resultArea.appendPlainText("Запуск синтаксического анализатора: Функция не реализована.")
-    def repeatLastAction(self):
-        if self.lastAction is not None:
-            self.lastAction()
-            self.resultArea.appendPlainText("Повтор последнего действия выполнен (действие из lastAction).")
-        elif self.textEdit.lastKeyEvent is not None:
-            event = self.textEdit.lastKeyEvent
-            if event.key() == Qt.Key_Backspace:
-                cursor = self.textEdit.textCursor()
-                cursor.deletePreviousChar()
-                self.textEdit.setTextCursor(cursor)
-            elif event.key() == Qt.Key_Delete:
-                cursor = self.textEdit.textCursor()
-                cursor.deleteChar()
-                self.textEdit.setTextCursor(cursor)
-            elif event.text() != "":
-                self.textEdit.insertPlainText(event.text())
-            self.resultArea.appendPlainText("Повтор последнего действия выполнен (клавиатурное событие).")
-        else:
-            self.resultArea.appendPlainText("Нет действий для повтора.")
+        if self.largeFileView is not None:
+            self.resultArea.appendPlainText("Синтаксический анализ недоступен в режиме просмотра.")
+            return
+        self.analysisStarted = time.perf_counter()
+        self.analyzer.analyze()
+    def showDiagnostics(self, diagnostics):
+        elapsed = time.perf_counter() - self.analysisStarted
+        lines = [f"Синтаксический анализ завершён за {elapsed * 1000:.1f} мс. Ошибок: {len(diagnostics)}."]
+        lines.extend(f"Строка {d.line}, позиция {d.column}: {d.message}"
+                     for d in diagnostics[:MAX_SHOWN_DIAGNOSTICS])
+        if len(diagnostics) > MAX_SHOWN_DIAGNOSTICS:
+            lines.append(f"... и ещё {len(diagnostics) - MAX_SHOWN_DIAGNOSTICS}")
+        self.resultArea.appendPlainText('\n'.join(lines))
+        document = self.textEdit.document()
+        cursors = []
+        for d in diagnostics[:MAX_SHOWN_DIAGNOSTICS]:
+            block = document.findBlockByNumber(d.line - 1)
+            if not block.isValid():
+                continue
+            # Ошибка в конце строки подчёркивает её последний символ. Позиция
+            # ошибки - в символах строки, позиция курсора - в единицах UTF-16
+            text = block.text()
+            column = min(d.column - 1, len(text) - 1)
+            if column < 0:
+                continue
+            astral = astralPositions(text)
+            cursor = QTextCursor(block)
+            cursor.setPosition(block.position() + utf16Offset(astral, column))
+            cursor.setPosition(block.position() + utf16Offset(astral, column + 1), QTextCursor.KeepAnchor)
+            cursors.append(cursor)
+        self.diagnosticCursors = cursors
+        self.shownDiagnostics = None
+        self.scheduleViewportSelections()
     def closeEvent(self, event):
-        if self.maybeSave():
-            event.accept()
-        else:
-            event.ignore()
+        current = self.currentHandle
+        for handle in [current] + [h for h in self.documents if h is not current]:
+            if handle is current or handle.isModified():
+                self.setCurrentTab(self.documents.index(handle))
+                if not self.maybeSave():
+                    event.ignore()
+                    return
+        self._stopLoading()
+        self.closeLargeFileView()
+        self.analyzer.shutdown()
+        self.search.shutdown()
+        # Несохранённые изменения пользователь отклонил: журналы больше не нужны
+        for handle in self.documents:
+            self.autosave.discard(handle.journal)
+        self.autosave.shutdown()
+        if self.timings is not None:
+            self.writeTimingReport()
+        event.accept()
+    def enableTimingReport(self, timings, filename):
+        # --profile-hotpaths: замеры выводятся по команде меню и пишутся в JSON при выходе
+        self.timings = timings
+        self.timingReportFile = filename
+        self.timingAct = QAction("Замеры производительности", self)
+        self.timingAct.triggered.connect(self.showTimingReport)
+        self.viewMenu.addSeparator()
+        self.viewMenu.addAction(self.timingAct)
+    def showTimingReport(self):
+        from timing import formatSummary
+        self.resultArea.appendPlainText(formatSummary(self.timings.summary()) or "Замеров пока нет.")
+        if self.writeTimingReport():
+            self.resultArea.appendPlainText(f"Отчёт записан в '{self.timingReportFile}'.")
+    def writeTimingReport(self):
+        from timing import peakRss, writeReport
+        try:
+            writeReport(self.timingReportFile, {'peak_rss': peakRss(), 'hotpaths': self.timings.summary()})
+        except OSError as e:
+            self.resultArea.appendPlainText(f"Не удалось записать отчёт о замерах:\n{e}")
+            return False
+        return True
+    def offerRecovery(self):
+        # Журналы, оставшиеся после аварийного завершения программы
+        paths = findJournals()
+        if not paths:
+            return
+        ret = QMessageBox.question(self, "Восстановление документов",
+                                   f"Найдены несохранённые документы после аварийного завершения программы "
+                                   f"({len(paths)}). Восстановить их?",
+                                   QMessageBox.Yes | QMessageBox.No)
+        for path in paths:
+            if ret == QMessageBox.Yes:
+                self.restoreDocument(path)
+            else:
+                removeJournal(path)
+    def restoreDocument(self, path):
+        changed = False
+        try:
+            header, records = readJournal(path)
+            text = ''
+            encoding = TextEncoding(header.get('codec', UTF8.codec), bytes.fromhex(header.get('bom', '')))
+            if records and 'snapshot' in records[0]:
+                text = records.pop(0)['snapshot']
+            elif header.get('path') is not None:
+                changed = baseChanged(header)
+                text = readText(header['path'], encoding)
+            journal = Journal.adopt(path, header)
+        except (OSError, ValueError) as e:
+            self.resultArea.appendPlainText(f"Не удалось восстановить документ из журнала '{path}':\n{e}")
+            return
+        document = self._newTextDocument()
+        document.setPlainText(text)
+        del text
+        cursor = QTextCursor(document)
+        length = document.characterCount() - 1
+        for record in records:
+            position = min(record['p'], length)
+            cursor.setPosition(position)
+            cursor.setPosition(min(position + record['r'], length), QTextCursor.KeepAnchor)
+            cursor.insertText(record['t'])
+            length = document.characterCount() - 1
+        handle = DocumentHandle(header.get('path'), document)
+        handle.encoding = encoding
+        handle.newline = header.get('newline', '\n')
+        # Журнал продолжается с того же места; если файл на диске изменился,
+        # журнал уплотняется и больше от файла не зависит
+        handle.journal = journal
+        journal.needsCompaction = changed
+        handle.history.invalidateClean()
+        self.addDocument(handle)
+        document.setModified(True)
+        self.resultArea.appendPlainText(f"Документ '{handle.displayName()}' восстановлен.")
+        if changed:
+            self.resultArea.appendPlainText(
+                f"Файл '{handle.path}' изменился после начала правок: восстановленный текст может быть неточным.")
+
+class StartupProfiler(QObject):
+    # --profile-startup: время от начала импорта программы до первой отрисовки окна
+    def __init__(self, window, marks):
+        super().__init__(window)
+        self.window = window
+        self.marks = marks
+        self.painted = False
+        window.textEdit.viewport().installEventFilter(self)
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            obj.removeEventFilter(self)
+            # Отчёт - после того, как отрисовка завершится
+            QTimer.singleShot(0, self.report)
+        return False
+    def report(self):
+        self.marks.append(("первая отрисовка", time.perf_counter()))
+        lines = []
+        previous = STARTUP_STARTED
+        for name, moment in self.marks:
+            lines.append(f"{name}: {(moment - previous) * 1000:.1f} мс")
+            previous = moment
+        lines.append(f"Время до первой отрисовки: {(previous - STARTUP_STARTED) * 1000:.1f} мс")
+        text = '\n'.join(lines)
+        print(text, file=sys.stderr)
+        self.window.resultArea.appendPlainText(text)
+
+# Методы, на которые --profile-hotpaths и benchmarks/ ставят замеры времени
+HOT_PATHS = (
+    (CodeEditor, 'lineNumberAreaPaintEvent'),
+    (CodeEditor, 'highlightCurrentLine'),
+    (SelectionLayers, 'apply'),
+    (CodeEditor, 'replaceRange'),
+    (CodeEditor, 'insertFromMimeData'),
+    (CodeEditor, 'undo'),
+    (CodeEditor, 'redo'),
+    (SyntaxHighlighter, 'highlightVisible'),
+    (MainWindow, '_pumpLoader'),
+    (MainWindow, '_pumpSaver'),
+    (MainWindow, 'writeDocument'),
+)
+TIMING_REPORT = 'hotpaths.json'
 
 if __name__ == '__main__':
+    marks = [("импорт модулей", time.perf_counter())]
+    profileStartup = '--profile-startup' in sys.argv
+    if profileStartup:
+        sys.argv.remove('--profile-startup')
+    timings = None
+    if '--profile-hotpaths' in sys.argv:
+        sys.argv.remove('--profile-hotpaths')
+        from timing import HotPathTimings
+        # Обёртки ставятся до создания окна, чтобы сигналы подключились к ним
+        timings = HotPathTimings()
+        timings.install(HOT_PATHS)
     app = QApplication(sys.argv)
+    marks.append(("создание QApplication", time.perf_counter()))
     mainWin = MainWindow()
+    marks.append(("создание окна", time.perf_counter()))
+    if profileStartup:
+        StartupProfiler(mainWin, marks)
+    if timings is not None:
+        mainWin.enableTimingReport(timings, TIMING_REPORT)
     mainWin.show()
+    QTimer.singleShot(0, mainWin.offerRecovery)
     sys.exit(app.exec_())
@@ -0,0 +1,90 @@
+# Поиск и замена по снимку текста документа. Позиции QTextCursor считаются в
+# единицах UTF-16: символ вне BMP (эмодзи) занимает две единицы, а в строке
+# Python - одну, поэтому найденные позиции переводятся в единицы UTF-16
+# (разделитель строк и там, и там - один символ). Поиск идёт по регулярному выражению (обычная строка экранируется), найденные
+# вхождения отдаются порциями, чтобы их число росло в интерфейсе постепенно.
+import re
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+_ASTRAL = re.compile('[\U00010000-\U0010ffff]')
+
+def compilePattern(text, regex=False, caseSensitive=True):
+    # Ошибка в регулярном выражении поднимается как re.error
+    flags = 0 if caseSensitive else re.IGNORECASE
+    return re.compile(text if regex else re.escape(text), flags)
+
+def astralPositions(text):
+    # Отсортированные индексы символов вне BMP в строке
+    if text.isascii():
+        return array('Q')
+    return array('Q', (match.start() for match in _ASTRAL.finditer(text)))
+
+def utf16Offset(astral, offset):
+    # Индекс в строке -> позиция QTextCursor; astral - результат astralPositions
+    return offset + bisect_left(astral, offset) if astral else offset
+
+def findMatches(text, pattern, cancelled=None, interval=0.05):
+    # Генератор порций (начала, концы) в единицах UTF-16; пустые совпадения
+    # пропускаются - их не выделить
+    astral = astralPositions(text)
+    starts, ends = array('Q'), array('Q')
+    deadline = time.perf_counter() + interval
+    for number, match in enumerate(pattern.finditer(text)):
+        start, end = match.span()
+        if start != end:
+            starts.append(utf16Offset(astral, start))
+            ends.append(utf16Offset(astral, end))
+        if number & 0x3ff == 0:
+            if cancelled is not None and cancelled():
+                return
+            if starts and time.perf_counter() > deadline:
+                yield starts, ends
+                starts, ends = array('Q'), array('Q')
+                deadline = time.perf_counter() + interval
+    if starts:
+        yield starts, ends
+
+def replaceAll(text, pattern, replacement, regex=False):
+    # Все замены собираются в одну правку: (начало, конец, новый текст, число замен),
+    # начало и конец - в единицах UTF-16. В режиме регулярных выражений замена - шаблон re.sub (\1, \g<name>)
+    if not regex:
+        replacement = replacement.replace('\\', '\\\\')
+    result, replaced = pattern.subn(replacement, text)
+    if not replaced:
+        return None
+    first = pattern.search(text).start()
+    last = first
+    for match in pattern.finditer(text, first):
+        last = match.end()
+    astral = astralPositions(text)
+    return (utf16Offset(astral, first), utf16Offset(astral, last), result[first:len(result) - (len(text) - last)],
+            replaced)
+
+class MatchIndex:
+    # Отсортированные позиции вхождений (позиции QTextCursor); порции приходят по возрастанию
+    def __init__(self):
+        self.starts = array('Q')
+        self.ends = array('Q')
+    def clear(self):
+        self.starts = array('Q')
+        self.ends = array('Q')
+    def extend(self, starts, ends):
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+    def count(self):
+        return len(self.starts)
+    def match(self, number):
+        return self.starts[number], self.ends[number]
+    def next(self, position):
+        # Номер первого вхождения не раньше position
+        number = bisect_left(self.starts, position)
+        return number if number < len(self.starts) else None
+    def previous(self, position):
+        # Номер последнего вхождения, закончившегося не позже position
+        number = bisect_right(self.ends, position) - 1
+        return number if number >= 0 else None
+    def between(self, start, end):
+        # Номера вхождений, пересекающих [start, end)
+        return range(bisect_right(self.ends, start), bisect_left(self.starts, end))
@@ -0,0 +1,28 @@
+import os
+import sys
+
+# Тесты с виджетами работают без дисплея
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+@pytest.fixture(scope='session')
+def app():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+@pytest.fixture
+def window(app, tmp_path, monkeypatch):
+    from PyQt5.QtCore import QEvent
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    import journal
+    from lab1 import MainWindow
+    monkeypatch.setattr(journal, 'RECOVERY_DIR', str(tmp_path / 'recovery'))
+    monkeypatch.setattr(QMessageBox, 'question', staticmethod(lambda *args: QMessageBox.No))
+    window = MainWindow()
+    yield window
+    window.close()
+    # Окно удаляется сразу, а не сборщиком мусора посреди следующего теста
+    window.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
@@ -0,0 +1,116 @@
+import random
+from analyzer import (EPSILON, LEX_COMMENT, LEX_NORMAL, NONTERMINALS, PARSE_TABLE, Diagnostic, IncrementalAnalyzer,
+                      Token, analyzeLines, analyzeRange, analyzeText, lexLine, scanLine)
+
+def kinds(text, state=LEX_NORMAL):
+    tokens, state, errors = scanLine(text, state)
+    return [(token.kind, token.text) for token in tokens], state, errors
+
+def testScanTokens():
+    tokens, state, errors = kinds('x1 = 3.14 + "s" // c')
+    assert tokens == [('ident', 'x1'), ('space', ' '), ('=', '='), ('space', ' '), ('number', '3.14'),
+                      ('space', ' '), ('+', '+'), ('space', ' '), ('string', '"s"'), ('space', ' '),
+                      ('comment', '// c')]
+    assert state == LEX_NORMAL and errors == []
+
+def testScanColumns():
+    tokens, _, _ = scanLine('ab=(c)')
+    assert [token.column for token in tokens] == [0, 2, 3, 4, 5]
+
+def testBlockCommentSpansLines():
+    assert kinds('a /* b') == ([('ident', 'a'), ('space', ' '), ('comment', '/* b')], LEX_COMMENT, [])
+    assert kinds('still **', LEX_COMMENT) == ([('comment', 'still **')], LEX_COMMENT, [])
+    assert kinds('c */ d', LEX_COMMENT) == ([('comment', 'c */'), ('space', ' '), ('ident', 'd')], LEX_NORMAL, [])
+
+def testScanErrors():
+    assert kinds('"abc')[2] == [(0, "Незакрытая строка")]
+    assert kinds('x @ 1.')[2] == [(2, "Недопустимый символ '@'"), (5, "Недопустимый символ '.'")]
+
+def testLexLineDropsTrivia():
+    tokens, _, _ = lexLine('a = 1; // c')
+    assert tokens == [Token('ident', 'a', 0), Token('=', '=', 2), Token('number', '1', 4), Token(';', ';', 5)]
+
+def first(symbols):
+    # Множество FIRST цепочки символов; None - цепочка выводит пустую
+    result = set()
+    for symbol in symbols:
+        if symbol not in NONTERMINALS:
+            result.add(symbol)
+            return result
+        nullable = False
+        for (nonterminal, terminal), production in PARSE_TABLE.items():
+            if nonterminal == symbol:
+                if production == EPSILON:
+                    nullable = True
+                else:
+                    result |= first(production)
+        if not nullable:
+            return result
+    result.add(None)
+    return result
+
+def testParseTableIsConsistent():
+    for (nonterminal, terminal), production in PARSE_TABLE.items():
+        assert terminal not in NONTERMINALS
+        if production != EPSILON:
+            assert terminal in first(production), (nonterminal, terminal)
+    for nonterminal in NONTERMINALS:
+        entries = [production for (name, _), production in PARSE_TABLE.items() if name == nonterminal]
+        # Для LL(1) у разных продукций нетерминала не пересекаются FIRST
+        firsts = [first(production) - {None} for production in set(entries) if production != EPSILON]
+        for i, left in enumerate(firsts):
+            for right in firsts[i + 1:]:
+                assert not left & right, nonterminal
+
+def testValidPrograms():
+    assert analyzeText('') == []
+    assert analyzeText('x = 1;\ny = x * (2 + -3) / "s";') == []
+    assert analyzeText('x = 1; /* комментарий\n на двух строках */ y = 2; // конец') == []
+
+def testSyntaxErrors():
+    assert analyzeText('x = ;') == [
+        Diagnostic(1, 5, "Неожиданный символ ';', ожидалось: '(', '-', идентификатор, строка, число")]
+    assert analyzeText('x = (1 + 2;\ny = 3;') == [Diagnostic(1, 11, "Ожидалось ')', получено ';'")]
+    assert analyzeText('x = 1') == [
+        Diagnostic(1, 6, "Неожиданный символ конец файла, ожидалось: ')', '*', '+', '-', '/', ';'")]
+    assert analyzeText('x = 1;\n/* a') == [Diagnostic(2, 5, "Незакрытый комментарий")]
+
+def testErrorRecovery():
+    # После ошибки разбор продолжается со следующего оператора
+    diagnostics = analyzeText('x = = 1;\ny = 2;\nz 3;')
+    assert [diagnostic.line for diagnostic in diagnostics] == [1, 3]
+
+def testRangeStopsAtConvergence():
+    lines = ['x = 1;', 'y = 2;', 'z = 3;']
+    states, _ = analyzeRange(lines)
+    changed, _ = analyzeRange(['x = 5;'] + lines[1:], previous=states, convergeFrom=0)
+    assert len(changed) == 1
+
+LINES = ['x = 1;', 'y = x + 2 * (3 - z);', '/* начало', 'конец */', '// комментарий', 'a = "str";', 'b = ;',
+         'c = (1 + ;', '"незакрытая', '', 'x = 1; /* c */ y = 2;', 'z = 3', '@', '1.5', ';', 'w = -(-1)']
+
+def run(engine, lines, rng):
+    # Как SyntaxAnalyzer: порции строк от первой изменённой до совпадения состояний
+    while engine.nextLine() is not None:
+        start = engine.nextLine()
+        texts = lines[start:start + rng.randint(1, 8)]
+        previous, convergeFrom = engine.previousStates(start, len(texts))
+        states, diagnostics = analyzeRange(texts, engine.startState(start), previous, convergeFrom)
+        engine.apply(start, states, diagnostics)
+    return engine.collect(len(lines[-1]))
+
+def testIncrementalMatchesFullAnalysis():
+    rng = random.Random(4)
+    for _ in range(20):
+        lines = ['']
+        engine = IncrementalAnalyzer()
+        for _ in range(60):
+            # Правка, как её видит редактор: строки [start, start + removed) заменяются inserted строками
+            start = rng.randrange(len(lines))
+            removed = rng.randint(1, min(3, len(lines) - start))
+            inserted = [rng.choice(LINES) for _ in range(rng.randint(1, 3))]
+            lines[start:start + removed] = inserted
+            engine.replaceLines(start, removed, len(inserted))
+            if rng.random() < 0.5:
+                assert run(engine, lines, rng) == analyzeLines(lines)
+        assert run(engine, lines, rng) == analyzeLines(lines)
@@ -0,0 +1,55 @@
+from PyQt5.QtGui import QTextCursor, QTextDocument
+from PyQt5.QtWidgets import QPlainTextDocumentLayout
+from journal import Journal
+from lab1 import AutosaveService, DocumentHandle, DocumentSnapshot
+
+def newDocument(text=''):
+    # Как у вкладок редактора: без раскладки документ не сообщает о правках
+    document = QTextDocument()
+    document.setDocumentLayout(QPlainTextDocumentLayout(document))
+    document.setPlainText(text)
+    return document
+
+def replay(records):
+    # Как MainWindow.restoreDocument: правки применяются курсором
+    document = newDocument()
+    cursor = QTextCursor(document)
+    for record in records:
+        cursor.setPosition(record['p'])
+        cursor.setPosition(record['p'] + record['r'], QTextCursor.KeepAnchor)
+        cursor.insertText(record['t'])
+    return document.toPlainText()
+
+def testJournalRecordsNonBmpEdits(app, tmp_path):
+    handle = DocumentHandle(document=newDocument())
+    handle.journal = Journal(str(tmp_path))
+    service = AutosaveService(handle)
+    records = []
+    handle.journal.append = lambda p, r, t: records.append({'p': p, 'r': r, 't': t})
+    cursor = QTextCursor(handle.document)
+    cursor.insertText('abc')
+    cursor.setPosition(1)
+    cursor.insertText('😀')
+    cursor.setPosition(1)
+    cursor.setPosition(3, QTextCursor.KeepAnchor)
+    cursor.insertText('x\ny')
+    cursor.setPosition(0)
+    cursor.setPosition(1, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    assert all(record['r'] >= 0 for record in records)
+    assert replay(records) == handle.document.toPlainText() == 'x\nybc'
+    service.shutdown()
+
+def testSnapshotKeepsSurrogatePairs(app, monkeypatch):
+    monkeypatch.setattr(DocumentSnapshot, 'CHUNK', 2)
+    document = newDocument('a😀b😀😀\nc')
+    result = []
+    snapshot = DocumentSnapshot(result.append)
+    snapshot.start(document)
+    while snapshot.isRunning():
+        app.processEvents()
+    parts = result[0]
+    assert len(parts) > 1
+    assert DocumentSnapshot.text(parts) == 'a😀b😀😀\nc'
+    for part in parts:
+        part.encode('utf-8')
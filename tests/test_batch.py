@@ -0,0 +1,67 @@
+import io
+import json
+import os
+import batch
+from batch import ResultCache, analyzerVersion, collectFiles, run
+
+def analyze(files, cache=None, encoding='auto'):
+    out = io.StringIO()
+    counts = run(files, out, jobs=1, cache=cache, encoding=encoding)
+    return counts, [json.loads(line) for line in out.getvalue().splitlines()]
+
+def testDiagnosticsAndErrors(tmp_path):
+    good = tmp_path / 'good.txt'
+    good.write_text('x = 1;\n')
+    bad = tmp_path / 'bad.txt'
+    bad.write_text('x = 1;\ny = ;\n')
+    missing = str(tmp_path / 'missing.txt')
+    counts, records = analyze([str(good), str(bad), missing])
+    assert counts == (0, 1, 1)
+    assert records[0]['file'] == str(bad) and (records[0]['line'], records[0]['column']) == (2, 5)
+    assert records[1]['file'] == missing and 'error' in records[1]
+
+def testEncodingIsDetected(tmp_path):
+    path = tmp_path / 'utf16.txt'
+    path.write_bytes('\ufeffx = "привет";\r\ny = ;\r\n'.encode('utf-16-le'))
+    counts, records = analyze([str(path)])
+    assert counts == (0, 1, 0) and records[0]['line'] == 2
+    # Явно заданная неподходящая кодировка - файл не прочитан
+    assert analyze([str(path)], encoding='utf-8')[0] == (0, 0, 1)
+
+def testCache(tmp_path):
+    cacheFile = str(tmp_path / 'cache.json')
+    path = tmp_path / 'a.txt'
+    path.write_text('y = ;\n')
+    version = analyzerVersion()
+    cache = ResultCache(cacheFile, version)
+    assert analyze([str(path)], cache)[0] == (0, 1, 0)
+    cache.save()
+    # Второй запуск берёт результат из кэша
+    cache = ResultCache(cacheFile, version)
+    counts, records = analyze([str(path)], cache)
+    assert counts == (1, 1, 0) and records[0]['line'] == 1
+    # Изменённый файл разбирается заново
+    path.write_text('y = 1;\n')
+    os.utime(path, ns=(0, 0))
+    assert analyze([str(path)], cache)[0] == (0, 0, 0)
+    cache.save()
+    # Результат прежнего содержимого больше не нужен и не сохраняется
+    with open(cacheFile, encoding='utf-8') as f:
+        assert len(json.load(f)['results']) == 1
+    # Кэш другой версии не используется
+    assert ResultCache(cacheFile, 'other').files == {}
+
+def testVersionCoversAnalyzerCharsetAndEncoding(monkeypatch, tmp_path):
+    version = analyzerVersion()
+    assert analyzerVersion('cp1251') != version
+    patched = tmp_path / 'charset.py'
+    patched.write_bytes(open(batch.charset.__file__, 'rb').read() + b'\n# changed\n')
+    monkeypatch.setattr(batch.charset, '__file__', str(patched))
+    assert analyzerVersion() != version
+
+def testCollectFiles(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    for name in ('b.txt', 'a.txt', 'c.log', 'sub/d.txt'):
+        (tmp_path / name).write_text('')
+    found = collectFiles([str(tmp_path)], '*.txt')
+    assert [os.path.relpath(path, tmp_path) for path in found] == ['a.txt', 'b.txt', os.path.join('sub', 'd.txt')]
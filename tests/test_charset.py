@@ -0,0 +1,60 @@
+import codecs
+import io
+import pytest
+from charset import (UTF8, TextEncoding, decodeAppended, detectEncoding, detectNewline, openReader, openWriter,
+                     utf16Length)
+
+TEXT = 'x = 1; // пример\ny = x + 2;\n'
+
+@pytest.mark.parametrize('codec, bom', [
+    ('utf-8', codecs.BOM_UTF8),
+    ('utf-16-le', codecs.BOM_UTF16_LE),
+    ('utf-16-be', codecs.BOM_UTF16_BE),
+    ('utf-32-le', codecs.BOM_UTF32_LE),
+    ('utf-32-be', codecs.BOM_UTF32_BE),
+])
+def testBom(codec, bom):
+    assert detectEncoding(bom + TEXT.encode(codec)) == TextEncoding(codec, bom)
+
+@pytest.mark.parametrize('codec', ['utf-8', 'utf-16-le', 'utf-16-be', 'utf-32-le', 'utf-32-be', 'cp1251'])
+def testWithoutBom(codec):
+    assert detectEncoding(TEXT.encode(codec)) == TextEncoding(codec, b'')
+
+def testUtf32NonBmp():
+    assert detectEncoding('a😀b\n'.encode('utf-32-le')).codec == 'utf-32-le'
+
+def testTruncatedUtf8Sample():
+    # Образец обрывается посреди двухбайтового символа
+    assert detectEncoding('ыы'.encode('utf-8')[:-1]) == UTF8
+
+def testFallbackDecodesAnything():
+    assert detectEncoding(bytes([0x98, 0x41])).codec == 'latin-1'
+
+def testNewline():
+    assert detectNewline('a\r\nb\r\nc\n') == '\r\n'
+    assert detectNewline('a\rb\rc\n') == '\r'
+    assert detectNewline('a\nb') == '\n'
+    assert detectNewline('abc') == '\n'
+
+def testWriterAndReader():
+    encoding = TextEncoding('utf-16-le', codecs.BOM_UTF16_LE)
+    raw = io.BytesIO()
+    writer = openWriter(raw, encoding, '\r\n')
+    writer.write(TEXT)
+    writer.flush()
+    data = raw.getvalue()
+    assert data == codecs.BOM_UTF16_LE + TEXT.replace('\n', '\r\n').encode('utf-16-le')
+    assert openReader(io.BytesIO(data), encoding).read() == TEXT
+
+def testDecodeAppended():
+    data = 'ab\r\nв'.encode('utf-8')
+    # Оборванный символ остаётся до следующего дописывания
+    assert decodeAppended(data[:-1], UTF8) == ('ab\n', len(data) - 2)
+    # Завершающий '\r' может оказаться началом '\r\n'
+    assert decodeAppended(data[:3], UTF8) == ('ab', 2)
+    assert decodeAppended(data, UTF8) == ('ab\nв', len(data))
+
+def testUtf16Length():
+    assert utf16Length('abc') == 3
+    assert utf16Length('абв') == 3
+    assert utf16Length('a😀') == 3
@@ -0,0 +1,20 @@
+import time
+
+def analyze(app, window, text):
+    window.textEdit.setPlainText(text)
+    finished = []
+    window.analyzer.analysisFinished.connect(finished.append)
+    window.runSyntaxAnalyzer()
+    deadline = time.monotonic() + 10
+    while not finished and time.monotonic() < deadline:
+        app.processEvents()
+    app.processEvents()
+    return [(c.selectionStart(), c.selectionEnd()) for c in window.diagnosticCursors]
+
+def testUnderlineCountsUtf16Units(app, window):
+    # Символы вне BMP занимают в документе по две позиции: ошибка на ';'
+    assert analyze(app, window, 's = "\U0001F600\U0001F600" + ;') == [(13, 14)]
+
+def testUnderlineAtLineEnd(app, window):
+    # Ошибка за концом строки подчёркивает последний символ - закрывающую кавычку
+    assert analyze(app, window, 'x = "\U0001F600"') == [(7, 8)]
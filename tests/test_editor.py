@@ -0,0 +1,89 @@
+from PyQt5.QtCore import QMimeData, QPointF, Qt
+from PyQt5.QtGui import QDropEvent, QTextCursor
+from lab1 import CodeEditor
+
+def lineNumber(cursor):
+    layout = cursor.block().layout()
+    return layout.lineForTextPosition(cursor.positionInBlock()).lineNumber()
+
+def testCurrentLineFollowsWrappedLines(app):
+    editor = CodeEditor()
+    editor.resize(200, 300)
+    editor.show()
+    editor.setPlainText(' '.join(f'word{i}' for i in range(100)))
+    app.processEvents()
+    calls = []
+    setExtraSelections = editor.setExtraSelections
+    editor.setExtraSelections = lambda selections: (calls.append(1), setExtraSelections(selections))
+    editor.moveCursor(QTextCursor.End)
+    app.processEvents()
+    current = editor.extraSelections()[0].cursor
+    assert lineNumber(current) == lineNumber(editor.textCursor()) > 0
+    # Перемещение внутри той же экранной строки выделения не обновляет
+    calls.clear()
+    editor.moveCursor(QTextCursor.Left)
+    app.processEvents()
+    assert not calls
+    editor.moveCursor(QTextCursor.Up)
+    app.processEvents()
+    assert calls
+    assert lineNumber(editor.extraSelections()[0].cursor) == lineNumber(editor.textCursor())
+    editor.close()
+
+class Drop(QDropEvent):
+    # Источник перетаскивания задаётся явно, как при переносе внутри редактора
+    def __init__(self, editor, text, position, action, source=None):
+        self.mime = QMimeData()
+        self.mime.setText(text)
+        point = editor.cursorRect(cursorAt(editor, position)).center()
+        super().__init__(QPointF(point), Qt.CopyAction | Qt.MoveAction, self.mime, Qt.LeftButton, Qt.NoModifier)
+        self.setDropAction(action)
+        self.dragSource = source
+    def source(self):
+        return self.dragSource
+
+def cursorAt(editor, position):
+    cursor = editor.textCursor()
+    cursor.setPosition(position)
+    return cursor
+
+def testDropIsUndoable(app):
+    editor = CodeEditor()
+    editor.resize(400, 300)
+    editor.show()
+    editor.replaceRange(0, 0, 'one two three')
+    app.processEvents()
+    # Перенос выделенного слова в конец строки
+    cursor = cursorAt(editor, 4)
+    cursor.setPosition(8, QTextCursor.KeepAnchor)
+    editor.setTextCursor(cursor)
+    editor.dropEvent(Drop(editor, 'two ', 13, Qt.MoveAction, editor))
+    assert editor.toPlainText() == 'one threetwo '
+    assert editor.textCursor().selectedText() == 'two '
+    # Вставка из другой программы
+    editor.dropEvent(Drop(editor, '😀', 0, Qt.CopyAction))
+    assert editor.toPlainText() == '😀one threetwo '
+    editor.undo()
+    assert editor.toPlainText() == 'one threetwo '
+    editor.undo()
+    assert editor.toPlainText() == 'one two three'
+    editor.undo()
+    assert editor.toPlainText() == ''
+    editor.close()
+
+def testUndoInReadOnlyModeKeepsHistory(app):
+    editor = CodeEditor()
+    editor.replaceRange(0, 0, 'a = 1;')
+    editor.setReadOnly(True)
+    editor.undo()
+    assert editor.toPlainText() == 'a = 1;'
+    # Отмена в режиме только чтения правку со стека не снимает
+    editor.setReadOnly(False)
+    editor.undo()
+    assert editor.toPlainText() == ''
+    editor.setReadOnly(True)
+    editor.redo()
+    editor.setReadOnly(False)
+    editor.redo()
+    assert editor.toPlainText() == 'a = 1;'
+    editor.close()
@@ -0,0 +1,36 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
+from lab1 import CodeEditor, SyntaxHighlighter
+
+def formats(editor, app, number):
+    app.processEvents()
+    editor.highlighter.highlightVisible()
+    block = editor.document().findBlockByNumber(number)
+    return [(r.start, r.length) for r in block.layout().formats()]
+
+def testTypedTextIsHighlighted(app):
+    editor = CodeEditor()
+    SyntaxHighlighter(editor)
+    editor.resize(400, 300)
+    editor.show()
+    QTest.keyClicks(editor, 'a = 1;')
+    assert formats(editor, app, 0) == [(2, 1), (4, 1), (5, 1)]
+    # Правка уже подсвеченной строки
+    QTest.keyClick(editor, Qt.Key_Home)
+    QTest.keyClicks(editor, 'bb = 22; ')
+    assert formats(editor, app, 0) == [(3, 1), (5, 2), (7, 1), (11, 1), (13, 1), (14, 1)]
+    QTest.keyClick(editor, Qt.Key_End)
+    QTest.keyClick(editor, Qt.Key_Return)
+    QTest.keyClicks(editor, 'c = 3;')
+    assert formats(editor, app, 1) == [(2, 1), (4, 1), (5, 1)]
+    editor.close()
+
+def testRangesCountUtf16Units(app):
+    editor = CodeEditor()
+    SyntaxHighlighter(editor)
+    editor.resize(400, 300)
+    editor.show()
+    # Символ вне BMP занимает в блоке две позиции
+    editor.setPlainText('s = "\U0001F600" + 12;')
+    assert formats(editor, app, 0) == [(2, 1), (4, 4), (9, 1), (11, 2), (13, 1)]
+    editor.close()
@@ -0,0 +1,160 @@
+from history import EditHistory, SpooledText
+
+class Document:
+    # Текст с позициями в единицах UTF-16, как у QTextDocument
+    def __init__(self, text=''):
+        self.data = text.encode('utf-16-le')
+    def text(self):
+        return self.data.decode('utf-16-le')
+    def slice(self, start, end):
+        return self.data[start * 2:end * 2].decode('utf-16-le')
+    def replace(self, history, start, end, text, typing=False):
+        history.record(start, self.slice(start, end), text, typing)
+        self.apply([(start, end - start, text)])
+    def apply(self, edits):
+        for position, length, text in edits:
+            self.data = self.data[:position * 2] + text.encode('utf-16-le') + self.data[(position + length) * 2:]
+
+def testUndoRedoReplacement():
+    history = EditHistory()
+    document = Document('a = 1;')
+    document.replace(history, 4, 5, '42')
+    assert document.text() == 'a = 42;'
+    document.apply(history.undo())
+    assert document.text() == 'a = 1;'
+    document.apply(history.redo())
+    assert document.text() == 'a = 42;'
+    assert history.undo() is not None and history.undo() is None
+
+def testNonBmpText():
+    history = EditHistory()
+    document = Document('a = 1;')
+    document.replace(history, 6, 6, '😀x')
+    document.replace(history, 0, 1, '😀')
+    assert document.text() == '😀 = 1;😀x'
+    document.apply(history.undo())
+    assert document.text() == 'a = 1;😀x'
+    document.apply(history.undo())
+    assert document.text() == 'a = 1;'
+    document.apply(history.redo())
+    document.apply(history.redo())
+    assert document.text() == '😀 = 1;😀x'
+
+def testTypingIsCoalesced():
+    history = EditHistory()
+    document = Document()
+    position = 0
+    for char in 'a😀b':
+        document.replace(history, position, position, char, typing=True)
+        position += len(char.encode('utf-16-le')) // 2
+    assert len(history.undoStack) == 1
+    # Backspace по одному символу, эмодзи - две единицы
+    for length in (1, 2):
+        document.replace(history, position - length, position, '', typing=True)
+        position -= length
+    assert document.text() == 'a'
+    assert len(history.undoStack) == 2
+    document.apply(history.undo())
+    assert document.text() == 'a😀b'
+    document.apply(history.undo())
+    assert document.text() == ''
+
+def testNewlineEndsCoalescing():
+    history = EditHistory()
+    document = Document()
+    for position, char in enumerate('ab\ncd'):
+        document.replace(history, position, position, char, typing=True)
+    assert len(history.undoStack) == 3
+
+def testGroupIsOneStep():
+    history = EditHistory()
+    document = Document('x 😀 x')
+    history.beginGroup()
+    document.replace(history, 5, 6, 'y')
+    document.replace(history, 0, 1, 'y')
+    history.endGroup()
+    assert document.text() == 'y 😀 y'
+    document.apply(history.undo())
+    assert document.text() == 'x 😀 x'
+    document.apply(history.redo())
+    assert document.text() == 'y 😀 y'
+
+def testCleanState():
+    history = EditHistory()
+    document = Document()
+    assert history.isClean()
+    document.replace(history, 0, 0, 'a')
+    history.setClean()
+    document.replace(history, 1, 1, 'b')
+    assert not history.isClean()
+    history.undo()
+    assert history.isClean()
+    history.undo()
+    assert not history.isClean()
+    # Новая правка после отмены делает сохранённое состояние недостижимым
+    document.replace(history, 0, 0, 'c')
+    history.undo()
+    assert not history.isClean()
+
+def testEviction():
+    history = EditHistory(maxOperations=3)
+    document = Document()
+    for position in range(5):
+        document.replace(history, position, position, str(position))
+    assert len(history.undoStack) == 3
+    while history.canUndo():
+        document.apply(history.undo())
+    assert document.text() == '01'
+
+def testCleanStateSurvivesEviction():
+    history = EditHistory(maxOperations=2)
+    document = Document()
+    document.replace(history, 0, 0, 'a')
+    history.setClean()
+    document.replace(history, 1, 1, 'b')
+    document.replace(history, 2, 2, 'c')
+    # Правка 'a' вытеснена, сохранённое состояние - дно стека
+    while history.canUndo():
+        document.apply(history.undo())
+    assert document.text() == 'a'
+    assert history.isClean()
+    document.apply(history.redo())
+    document.apply(history.redo())
+    # Ещё одно вытеснение делает его недостижимым
+    document.replace(history, 3, 3, 'd')
+    while history.canUndo():
+        document.apply(history.undo())
+    assert not history.isClean()
+
+def testLargeTextIsSpooled():
+    history = EditHistory(spillThreshold=10)
+    document = Document('start')
+    text = '😀' * 20
+    document.replace(history, 5, 5, text)
+    assert isinstance(history.undoStack[-1].inserted, SpooledText)
+    assert history.bytes == 0
+    document.apply(history.undo())
+    assert document.text() == 'start'
+    document.apply(history.redo())
+    assert document.text() == 'start' + text
+
+def testSpoolSpaceIsReclaimed():
+    history = EditHistory(maxOperations=2, spillThreshold=10)
+    document = Document()
+    texts = [str(number) * 100 for number in range(6)]
+    for text in texts:
+        end = len(document.text())
+        document.replace(history, end, end, text)
+        # Вытесненные тексты не копятся в файле
+        assert history.spool.seek(0, 2) <= 2 * history.spoolLive
+    assert history.spoolLive == 200
+    document.apply(history.undo())
+    document.apply(history.undo())
+    assert document.text() == ''.join(texts[:4])
+    document.apply(history.redo())
+    assert document.text() == ''.join(texts[:5])
+    # Новая правка отбрасывает отменённые; без длинных текстов файл закрывается
+    document.replace(history, 0, 0, 'x')
+    document.replace(history, 0, 0, 'y')
+    document.replace(history, 0, 0, 'z')
+    assert history.spool is None and history.spoolLive == 0
@@ -0,0 +1,60 @@
+from array import array
+from search import MatchIndex, compilePattern, findMatches, replaceAll
+
+def matches(text, pattern):
+    starts, ends = array('Q'), array('Q')
+    for batchStarts, batchEnds in findMatches(text, pattern):
+        starts.extend(batchStarts)
+        ends.extend(batchEnds)
+    return list(zip(starts, ends))
+
+def utf16(text):
+    return len(text.encode('utf-16-le')) // 2
+
+def testFindPlainText():
+    assert matches('abc abc', compilePattern('abc')) == [(0, 3), (4, 7)]
+    assert matches('a.c abc', compilePattern('a.c')) == [(0, 3)]
+    assert matches('ABC abc', compilePattern('abc', caseSensitive=False)) == [(0, 3), (4, 7)]
+
+def testFindSkipsEmptyMatches():
+    assert matches('ab', compilePattern('x*', regex=True)) == []
+
+def testFindOffsetsAreUtf16():
+    text = '😀 abc\n😀😀abc'
+    found = matches(text, compilePattern('abc'))
+    assert found == [(3, 6), (utf16('😀 abc\n😀😀'), utf16(text))]
+
+def testFindIsCancelled():
+    assert matches('abc', compilePattern('abc')) and not list(findMatches('abc', compilePattern('abc'), lambda: True))
+
+def testReplaceAllSpan():
+    assert replaceAll('x abc y abc z', compilePattern('abc'), 'X') == (2, 11, 'X y X', 2)
+    assert replaceAll('x', compilePattern('abc'), 'X') is None
+
+def testReplaceAllNonBmp():
+    text = '😀 abc abc'
+    start, end, replacement, replaced = replaceAll(text, compilePattern('abc'), 'X')
+    assert (start, end, replaced) == (3, 10, 2)
+    # Правка в единицах UTF-16, как её применяет QTextCursor
+    data = text.encode('utf-16-le')
+    data = data[:start * 2] + replacement.encode('utf-16-le') + data[end * 2:]
+    assert data.decode('utf-16-le') == '😀 X X'
+
+def testReplaceAllRegex():
+    result = replaceAll('a1 b22', compilePattern(r'(\w)(\d+)', regex=True), r'\2\1', regex=True)
+    assert result == (0, 6, '1a 22b', 2)
+    # Вне режима регулярных выражений обратная косая черта вставляется как есть
+    assert replaceAll('ab', compilePattern('a'), r'\1') == (0, 1, '\\1', 1)
+
+def testMatchIndex():
+    index = MatchIndex()
+    index.extend(array('Q', [0, 10]), array('Q', [3, 13]))
+    index.extend(array('Q', [20]), array('Q', [25]))
+    assert index.count() == 3
+    assert index.match(1) == (10, 13)
+    assert index.next(0) == 0 and index.next(4) == 1 and index.next(21) is None
+    assert index.previous(2) is None and index.previous(13) == 1 and index.previous(100) == 2
+    assert list(index.between(2, 11)) == [0, 1]
+    assert list(index.between(3, 10)) == []
+    index.clear()
+    assert index.count() == 0
@@ -0,0 +1,57 @@
+import os
+
+def openFile(app, window, path):
+    window.openFile(str(path))
+    while window.loader is not None:
+        app.processEvents()
+
+def switchAway(app, window):
+    # На вторую вкладку и обратно на первую
+    if len(window.documents) == 1:
+        window.newDocument()
+    window.setCurrentTab(1)
+    window.setCurrentTab(0)
+    while window.loader is not None:
+        app.processEvents()
+
+def testDeletedFileIsNotUnloaded(app, window, tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('x = 1;\n')
+    openFile(app, window, path)
+    os.remove(path)
+    window.checkFileChange(window.currentHandle)
+    assert window.currentHandle.isModified()
+    switchAway(app, window)
+    assert window.currentHandle.document is not None
+    assert window.textEdit.toPlainText() == 'x = 1;\n'
+    assert window.currentHandle.path == str(path)
+
+def testUndoSurvivesUnloading(app, window, tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('x = 1;\n')
+    openFile(app, window, path)
+    window.textEdit.replaceRange(0, 0, 'y = 2;\n')
+    window.saveDocument(wait=True)
+    switchAway(app, window)
+    assert window.textEdit.toPlainText() == 'y = 2;\nx = 1;\n'
+    assert window.textEdit.history.canUndo()
+    window.textEdit.undo()
+    assert window.textEdit.toPlainText() == 'x = 1;\n'
+    assert window.currentHandle.isModified()
+    window.textEdit.redo()
+    assert not window.currentHandle.isModified()
+
+def testHistoryIsDroppedWhenFileChanges(app, window, tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('x = 1;\n')
+    openFile(app, window, path)
+    window.textEdit.replaceRange(0, 0, 'y = 2;\n')
+    window.saveDocument(wait=True)
+    window.newDocument()
+    window.setCurrentTab(1)
+    path.write_text('z = 3;\n')
+    window.setCurrentTab(0)
+    while window.loader is not None:
+        app.processEvents()
+    assert window.textEdit.toPlainText() == 'z = 3;\n'
+    assert not window.textEdit.history.canUndo()
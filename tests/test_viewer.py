@@ -0,0 +1,31 @@
+from PyQt5.QtCore import QPoint, QPointF, Qt
+from PyQt5.QtGui import QWheelEvent
+from lab1 import LargeFileView
+
+def wheel(app, view, delta):
+    event = QWheelEvent(QPointF(10, 10), QPointF(10, 10), QPoint(0, 0), QPoint(0, delta),
+                        Qt.NoButton, Qt.NoModifier, Qt.NoScrollPhase, False)
+    app.sendEvent(view.editor.viewport(), event)
+
+def testTrackpadScrollsBothWays(app, tmp_path):
+    path = tmp_path / 'big.txt'
+    path.write_text(''.join(f'line {i}\n' for i in range(1000)))
+    view = LargeFileView(str(path))
+    view.resize(400, 300)
+    view.show()
+    view.start()
+    view.index.thread.join()
+    view._updateRange()
+    view.scrollBar.setValue(100)
+    # Четыре доли по 30 - один шаг колеса вниз, затем столько же вверх
+    for _ in range(4):
+        wheel(app, view, -30)
+    assert view.scrollBar.value() == 103
+    for _ in range(3):
+        wheel(app, view, 30)
+    assert view.scrollBar.value() == 103
+    wheel(app, view, 30)
+    assert view.scrollBar.value() == 100
+    wheel(app, view, 240)
+    assert view.scrollBar.value() == 94
+    view.closeFile()
@@ -0,0 +1,79 @@
+# Необязательные замеры времени горячих путей редактора (--profile-hotpaths и
+# benchmarks/). Обёртки ставятся на методы классов только на время замеров,
+# поэтому обычный запуск вызывает методы напрямую и ничего не платит. Обёртка
+# действует на методы, вызываемые по имени (перерисовка, правки); к сигналам,
+# подключённым до install, она не применяется.
+import functools
+import inspect
+import json
+import sys
+import time
+from collections import defaultdict
+
+def peakRss():
+    # Пиковый объём резидентной памяти процесса в байтах или None, если неизвестен
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # В Linux ru_maxrss в килобайтах, в macOS - в байтах
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class HotPathTimings:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.originals = []
+    def install(self, targets):
+        # targets - пары (класс, имя метода)
+        for owner, name in targets:
+            original = owner.__dict__[name]
+            setattr(owner, name, self._wrap(f'{owner.__name__}.{name}', original))
+            self.originals.append((owner, name, original))
+    def uninstall(self):
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals = []
+    def reset(self):
+        # Обёртки держат ссылки на списки замеров, поэтому списки очищаются на месте
+        for samples in self.samples.values():
+            samples.clear()
+    def _wrap(self, key, method):
+        samples = self.samples[key]
+        clock = time.perf_counter
+        # PyQt отбрасывает лишние аргументы сигнала (triggered(checked)) по сигнатуре
+        # слота; у обёртки сигнатура (*args), поэтому лишнее отбрасывается здесь
+        code = method.__code__
+        limit = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return method(*args[:limit], **kwargs)
+            finally:
+                samples.append(clock() - started)
+        return timed
+    def summary(self):
+        # {метод: {calls, total_ms, mean_ms, p95_ms, max_ms}} для вызывавшихся методов
+        result = {}
+        for key, samples in sorted(self.samples.items()):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[key] = {
+                'calls': len(ordered),
+                'total_ms': sum(ordered) * 1000,
+                'mean_ms': sum(ordered) / len(ordered) * 1000,
+                'p95_ms': ordered[max(0, int(len(ordered) * 0.95) - 1)] * 1000,
+                'max_ms': ordered[-1] * 1000,
+            }
+        return result
+
+def formatSummary(summary):
+    return '\n'.join(f"{key}: вызовов {item['calls']}, среднее {item['mean_ms']:.3f} мс, "
+                     f"95% {item['p95_ms']:.3f} мс, максимум {item['max_ms']:.3f} мс"
+                     for key, item in summary.items())
+
+def writeReport(filename, report):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)